@@ -14,90 +14,664 @@ API endpoints:
     [API - No Auth]
     ------------
     - /api/v1/health (health check - HEAD request)
+    - /api/v1/health/live (liveness probe - GET/HEAD)
+    - /api/v1/health/ready (readiness probe - GET/HEAD)
+    - /metrics (Prometheus metrics, unless METRICS_ENABLED=false)
 
     [API - With Auth]
     ------------
     - /api/v1/status (status of the API)
+    - /api/v1/health/deep (run every health check now, with details)
     - /api/v1/version (version of the API)
     - /api/v1/coverage (check data coverage for a given year)
     - /api/v1/check_holiday (check whether a given date is a holiday or not)
     - /api/v1/holiday_info (information about a given holiday)
-    - /api/v1/holidays (list of holidays for a given year/month)
+    - /api/v1/check_holidays (check many dates/date ranges at once - GET/POST)
+    - /api/v1/business_days/next (next working day after a given date)
+    - /api/v1/business_days/previous (previous working day before a given date)
+    - /api/v1/business_days/add (add/subtract working days to a given date)
+    - /api/v1/business_days/between (count working days between two dates)
+    - /api/v1/holidays (list of holidays for a given year/month - JSON/ICS/CSV/XML)
+    - /api/v1/holidays/range (list of holidays overlapping a date range - JSON/ICS/CSV/XML)
 
 Docs:
     - /docs (Swagger UI)
     - /redoc (ReDoc)
 """
 
-# pylint: disable=import-error
-from typing import Annotated, Optional
+# pylint: disable=import-error,wrong-import-position
+import time
+
+# Start of the import phase reported by the startup profiler
+_IMPORTS_STARTED = time.perf_counter()
+
+from typing import Annotated, Dict, Iterator, List, Optional, Union
 from pathlib import Path
-from datetime import datetime, date, timezone
+from datetime import datetime, date
+import asyncio
 import json
+import math
 import os
 import hashlib
 from secrets import compare_digest
 from fastapi import FastAPI, Response, status, Query, HTTPException, Depends, Header
-from fastapi.responses import RedirectResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
-from fastapi.staticfiles import StaticFiles
-import redis
-import redis.asyncio as redis_asyncio
+from pydantic import BaseModel
 from contextlib import asynccontextmanager
-from dotenv import load_dotenv
 import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from srilanka_holidays import (
+    AccessLogMiddleware,
+    ApiKeyIndex,
+    ArtifactStore,
+    BreakerClient,
+    CircuitBreaker,
+    CoverageError,
+    DataWatcher,
+    EXPORT_FORMATS,
+    HealthMonitor,
+    HolidayCalendar,
+    HolidayStore,
+    MetricsMiddleware,
+    MetricsRegistry,
+    RateLimit,
+    RateLimiter,
+    ResponseCache,
+    SampledLogger,
+    SharedDataset,
+    StartupProfiler,
+    UsageRecorder,
+    configure_logging,
+    deserialize_json,
+    format_http_date,
+    is_not_modified,
+    iter_export,
+    load_store,
+    make_etag,
+    negotiate_format,
+    parse_holidays,
+    read_data_file,
+    serialize_json,
+    set_request_fields,
+    store_version,
+    use_serializer,
+)
+
+# Time spent in each startup phase, logged when STARTUP_PROFILE=true.
+# `python -X importtime` gives a per-module breakdown of the import phase.
+STARTUP = StartupProfiler(started=_IMPORTS_STARTED)
+STARTUP.mark("imports")
+
+# Load environment variables from .env file (only present on dev setups)
+if Path(".env").is_file():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+# Configure logging: records are written by a background thread, so logging
+# never blocks the event loop. Hot-path debug events are only emitted with
+# LOG_LEVEL=DEBUG, for a LOG_SAMPLE_RATE fraction of requests.
+configure_logging(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    json_format=os.getenv("LOG_FORMAT", "json").lower() == "json",
+)
 logger = logging.getLogger(__name__)
-
-# Load environment variables from .env file
-logger.info("Loading environment variables from .env file")
-load_dotenv()
+sampled_logger = SampledLogger(logger, float(os.getenv("LOG_SAMPLE_RATE", 0.01)))
+ACCESS_LOG = os.getenv("ACCESS_LOG", "true").lower() != "false"
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+# JSON library for response bodies and Redis payloads: orjson when installed,
+# unless JSON_SERIALIZER=json
+use_serializer(os.getenv("JSON_SERIALIZER") or None)
+STARTUP.mark("config")
 
 # Define API version
 API_VERSION = "2.0.0"
 
-# Define year limits
+# Year range served, updated from the data files found at startup and
+# whenever the data is reloaded
 YEAR_MIN = 2021
 YEAR_MAX = 2026
 
+# Directory holding the yearly holiday data files
+DATA_DIR = Path("json")
+# Year -> validated data file path, filled at startup and on reload
+DATA_FILES: Dict[int, Path] = {}
+DATA_WATCHER = DataWatcher(DATA_DIR)
+# Binary artifact compiled from DATA_DIR (converters/json_to_bin.py)
+DATA_ARTIFACT = Path(os.getenv("DATA_ARTIFACT", "bin/holidays.bin"))
+# Directory shared by the worker processes of a host (ex:
+# /dev/shm/srilanka-holidays). When set, the data is published there as
+# memory-mapped generations that every worker attaches to.
+SHARED_DATA_DIR = os.getenv("SHARED_DATA_DIR", "")
+SHARED_DATA = SharedDataset(Path(SHARED_DATA_DIR)) if SHARED_DATA_DIR else None
+DATA_RELOAD_LOCK = asyncio.Lock()
+# How often the data directory is checked for changed files (0 disables)
+DATA_RELOAD_SECONDS = float(os.getenv("DATA_RELOAD_SECONDS", 60))
+# Redis key whose value changes whenever an instance picks up new data, so
+# the other instances reload as well
+DATA_VERSION_KEY = "HOLIDAY_DATA_VERSION"
+DATA_VERSION_SEEN: Optional[str] = None
+
+# Max number of dates a single /api/v1/check_holidays request may cover
+BATCH_MAX_DATES = int(os.getenv("BATCH_MAX_DATES", 10000))
+# Batch responses covering more dates than this are streamed
+BATCH_STREAM_THRESHOLD = int(os.getenv("BATCH_STREAM_THRESHOLD", 1000))
+
+# ICS/CSV/XML holiday listings with more holidays than this are streamed
+EXPORT_STREAM_THRESHOLD = int(os.getenv("EXPORT_STREAM_THRESHOLD", 500))
+# Formats of the holiday listing endpoints ("simple"/"full" are JSON)
+HOLIDAY_LIST_FORMATS = ("simple", "full", *EXPORT_FORMATS)
+INVALID_FORMAT_ERROR = {
+    "error": "Invalid format. Use 'simple', 'full', 'ics', 'csv' or 'xml'"
+}
+
+# Cache-Control header sent with holiday data responses
+CACHE_CONTROL = os.getenv("CACHE_CONTROL", "private, max-age=3600")
+
 # Get fallback API keys from environment variables
 FALLBACK_API_KEY_HASHES = os.getenv("API_KEYS", "").split(",")
-# Initialize Redis client variable
+# Redis key holding the API key records and the key whose value changes
+# whenever those records are updated
+API_KEYS_KEY = "API_KEYS_V2"
+API_KEYS_VERSION_KEY = "API_KEYS_VERSION"
+# How often the in-process API key index is checked against Redis
+API_KEYS_REFRESH_SECONDS = float(os.getenv("API_KEYS_REFRESH_SECONDS", 30))
+# Minimum time between reloads triggered by unknown keys
+API_KEYS_MIN_RELOAD_SECONDS = float(os.getenv("API_KEYS_MIN_RELOAD_SECONDS", 5))
+
+# How often the health checks (Redis ping, holiday lookup canary) run in the
+# background. Health probes answer from their latest results, which count as
+# failing once older than three intervals.
+HEALTH_CHECK_SECONDS = float(os.getenv("HEALTH_CHECK_SECONDS", 10))
+
+# Metrics exposed on /metrics and optional Server-Timing response headers
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+SERVER_TIMING = os.getenv("SERVER_TIMING", "false").lower() == "true"
+# When set, /metrics requires "Authorization: Bearer <token>"; otherwise it is
+# public like /health, so keep it off the internet or behind the proxy
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Initialize Redis client variable, set once the server has answered
 REDIS_CLIENT = None
+# Client created while Redis was unreachable; the breaker probe pings it and
+# makes it REDIS_CLIENT once Redis is up
+REDIS_PENDING_CLIENT = None
+# "blocking" waits for Redis before serving; "background" serves at once,
+# using the fallback API keys and data files until Redis is connected
+REDIS_CONNECT_MODE = os.getenv("REDIS_CONNECT_MODE", "blocking").lower()
+# Connection pool size and timeouts (seconds). Requests wait at most
+# REDIS_SOCKET_TIMEOUT for a pooled connection, and failed commands are not
+# retried, so a slow Redis costs each request one bounded wait at most.
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 20))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", 1))
+# After REDIS_BREAKER_THRESHOLD consecutive Redis errors, requests stop using
+# Redis (fallback API keys, in-memory data and files) and Redis is probed
+# every REDIS_PROBE_SECONDS until it answers again
+REDIS_BREAKER = CircuitBreaker(
+    "Redis", failure_threshold=int(os.getenv("REDIS_BREAKER_THRESHOLD", 5))
+)
+REDIS_PROBE_SECONDS = float(os.getenv("REDIS_PROBE_SECONDS", 5))
+
+
+class RedisError(Exception):
+    """Stands in for redis.RedisError until the redis package is imported.
+
+    The redis package is only imported when connecting (see
+    create_redis_client), which keeps it off the cold start path. No Redis
+    call can fail before that, so nothing raises this placeholder.
+    """
+
+
+# In-process copy of the API key records, kept in sync with Redis
+API_KEY_INDEX = ApiKeyIndex(
+    negative_ttl=float(os.getenv("API_KEYS_NEGATIVE_TTL", 30)),
+)
+API_KEYS_LOCK = asyncio.Lock()
+# Per-key hourly usage counters, flushed to Redis in the background
+USAGE_RECORDER = UsageRecorder(
+    flush_threshold=int(os.getenv("USAGE_FLUSH_THRESHOLD", 500)),
+)
+USAGE_FLUSH_SECONDS = float(os.getenv("USAGE_FLUSH_SECONDS", 10))
+# Per-key token buckets and daily quotas (0 = unlimited, the default). API_KEYS_V2
+# records can override these with "rate_limit", "burst" and "daily_quota" fields.
+RATE_LIMIT_PER_MINUTE = float(os.getenv("RATE_LIMIT_PER_MINUTE", 0))
+RATE_LIMITER = RateLimiter(
+    RateLimit(
+        per_minute=RATE_LIMIT_PER_MINUTE,
+        burst=float(os.getenv("RATE_LIMIT_BURST", 0)) or RATE_LIMIT_PER_MINUTE,
+        daily_quota=int(os.getenv("RATE_LIMIT_DAILY_QUOTA", 0)),
+    )
+)
+# How often request counts are exchanged with other instances through Redis
+RATE_LIMIT_SYNC_SECONDS = float(os.getenv("RATE_LIMIT_SYNC_SECONDS", 5))
+
+METRICS = MetricsRegistry(prefix="srilanka_holidays_")
+HOLIDAY_DATA_LOADS = METRICS.counter(
+    "holiday_data_loads_total",
+    "Loads of years missing from memory, by source (redis/file) and result",
+    ["source", "result"],
+)
+API_KEY_CHECKS = METRICS.counter(
+    "api_key_checks_total", "API key checks by outcome", ["result"]
+)
+REDIS_ERRORS = METRICS.counter(
+    "redis_errors_total", "Redis errors by operation", ["operation"]
+)
+DATA_RELOADS = METRICS.counter(
+    "data_reloads_total", "Holiday data reloads by trigger", ["trigger"]
+)
+METRICS.callback(
+    "response_cache_hits_total",
+    "Response cache hits",
+    lambda: RESPONSE_CACHE.hits,
+    "counter",
+)
+METRICS.callback(
+    "response_cache_misses_total",
+    "Response cache misses",
+    lambda: RESPONSE_CACHE.misses,
+    "counter",
+)
+METRICS.callback("api_keys_loaded", "API keys in the index", lambda: len(API_KEY_INDEX))
+METRICS.callback(
+    "usage_flushes_total",
+    "Successful usage counter flushes",
+    lambda: USAGE_RECORDER.flushes,
+    "counter",
+)
+METRICS.callback(
+    "usage_flush_failures_total",
+    "Failed usage counter flushes",
+    lambda: USAGE_RECORDER.failed_flushes,
+    "counter",
+)
+METRICS.callback(
+    "usage_flushed_increments_total",
+    "Usage increments written to Redis",
+    lambda: USAGE_RECORDER.flushed_increments,
+    "counter",
+)
+METRICS.callback(
+    "usage_dropped_increments_total",
+    "Usage increments dropped after failed flushes",
+    lambda: USAGE_RECORDER.dropped_increments,
+    "counter",
+)
+METRICS.callback(
+    "usage_pending_increments",
+    "Usage increments waiting to be flushed",
+    lambda: USAGE_RECORDER.pending,
+)
+METRICS.callback(
+    "redis_circuit_open",
+    "1 while the Redis circuit breaker is open",
+    lambda: int(REDIS_BREAKER.is_open),
+)
+METRICS.callback(
+    "redis_circuit_trips_total",
+    "Times the Redis circuit breaker opened",
+    lambda: REDIS_BREAKER.trips,
+    "counter",
+)
+METRICS.callback(
+    "data_generation",
+    "Shared holiday data generation in use (0 when not shared)",
+    lambda: (SHARED_DATA and SHARED_DATA.generation) or 0,
+)
+METRICS.callback(
+    "health_ready",
+    "1 while the latest health checks pass",
+    lambda: int(HEALTH.is_ready()),
+)
+METRICS.callback(
+    "rate_limited_total",
+    "Requests rejected for exceeding the per-minute rate limit",
+    lambda: RATE_LIMITER.rejected_rate,
+    "counter",
+)
+METRICS.callback(
+    "quota_exceeded_total",
+    "Requests rejected for exceeding the daily quota",
+    lambda: RATE_LIMITER.rejected_quota,
+    "counter",
+)
+METRICS.callback(
+    "rate_limit_sync_failures_total",
+    "Failed rate limit syncs with Redis",
+    lambda: RATE_LIMITER.failed_syncs,
+    "counter",
+)
+# Holiday lookups over the in-memory data; its store is replaced (never
+# mutated) when the data is reloaded or a year is added
+CALENDAR = HolidayCalendar()
+# Serialized /api/v1/holidays bodies keyed by (year, month, type, format)
+RESPONSE_CACHE = ResponseCache(maxsize=int(os.getenv("RESPONSE_CACHE_SIZE", 1024)))
 
 # Define API key header for authentication
 api_key_header_scheme = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+def create_redis_client():
+    """Import the redis package and create a client (blocking, run in a thread)
+
+    The client reports the outcome of every command to REDIS_BREAKER.
+    """
+    global RedisError
+    # pylint: disable=import-outside-toplevel
+    import redis.asyncio as redis_asyncio
+    from redis.asyncio.retry import Retry
+    from redis.backoff import NoBackoff
+
+    RedisError = redis_asyncio.RedisError
+    pool = redis_asyncio.BlockingConnectionPool(
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_SOCKET_TIMEOUT,
+        host=os.getenv("REDIS_HOST", ""),
+        port=int(os.getenv("REDIS_PORT", 0)),
+        decode_responses=True,
+        username=os.getenv("REDIS_USERNAME", ""),
+        password=os.getenv("REDIS_PASSWORD", ""),
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        retry=Retry(NoBackoff(), 0),
+    )
+    return BreakerClient(
+        redis_asyncio.Redis.from_pool(pool), REDIS_BREAKER, (RedisError,)
+    )
+
+
+def get_redis():
+    """Return the Redis client, or None if not connected or the breaker is open"""
+    return REDIS_CLIENT if REDIS_BREAKER.allow() else None
+
+
+async def probe_redis():
+    """Ping Redis for the circuit breaker (raises while it is down)"""
+    global REDIS_CLIENT, REDIS_PENDING_CLIENT
+    client = REDIS_CLIENT or REDIS_PENDING_CLIENT
+    if client is None:
+        raise ConnectionError("Redis client not created")
+    await client.ping()
+    if REDIS_CLIENT is None:
+        REDIS_CLIENT, REDIS_PENDING_CLIENT = client, None
+        logger.info("Redis connection established after startup.")
+
+
+async def connect_redis():
+    """Connect to Redis, then load the API keys and data version kept there
+
+    Requests only see the client once it answered a ping, so none of them
+    waits on a server that isn't reachable yet.
+    """
+    global REDIS_CLIENT, REDIS_PENDING_CLIENT, DATA_VERSION_SEEN
+    with STARTUP.phase("redis_connect"):
+        client = await asyncio.to_thread(create_redis_client)
+        try:
+            await client.ping()
+        except RedisError:
+            REDIS_ERRORS.inc("connect")
+            # Serve from the fallbacks; the breaker reconnects once Redis is up
+            REDIS_PENDING_CLIENT = client
+            REDIS_BREAKER.trip()
+            logger.error("Failed to connect to Redis. Falling back to file reads.")
+            return
+        REDIS_CLIENT = client
+        logger.info("Redis connection established successfully.")
+
+    with STARTUP.phase("api_keys"):
+        try:
+            await refresh_api_keys()
+        except (RedisError, ValueError, AttributeError):
+            REDIS_ERRORS.inc("api_keys_refresh")
+            logger.error("Failed to load API keys from Redis")
+    try:
+        DATA_VERSION_SEEN = await REDIS_CLIENT.get(DATA_VERSION_KEY)
+    except RedisError:
+        REDIS_ERRORS.inc("data_version")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global REDIS_CLIENT
-    try:
-        REDIS_CLIENT = redis_asyncio.Redis(
-            host=os.getenv("REDIS_HOST", ""),
-            port=int(os.getenv("REDIS_PORT", 0)),
-            decode_responses=True,
-            username=os.getenv("REDIS_USERNAME", ""),
-            password=os.getenv("REDIS_PASSWORD", ""),
-        )
-        await REDIS_CLIENT.ping()
-        logger.info("Redis connection established successfully.")
-    except redis.RedisError:
-        logger.error("Failed to connect to Redis. Falling back to file reads.")
-        REDIS_CLIENT = None
-    yield
-    if REDIS_CLIENT:
-        await REDIS_CLIENT.close()
+    with STARTUP.phase("data_load"):
+        await load_data_files()
+    tasks = []
+    if REDIS_CONNECT_MODE == "background":
+
+        async def connect_in_background():
+            await connect_redis()
+            # The checks before serving ran without Redis
+            await HEALTH.check()
+
+        connect_task = asyncio.create_task(connect_in_background())
+        if STARTUP_PROFILE:
+            connect_task.add_done_callback(
+                lambda _: logger.info("Startup phases: %s", STARTUP.summary())
+            )
+        tasks.append(connect_task)
+    else:
+        await connect_redis()
+    if STARTUP_PROFILE:
+        logger.info("Startup phases: %s", STARTUP.summary())
+    # Probes answer from these results, so have them before serving
+    await HEALTH.check()
+
+    tasks += [
+        asyncio.create_task(refresh_api_keys_periodically()),
+        asyncio.create_task(USAGE_RECORDER.run(get_redis, USAGE_FLUSH_SECONDS)),
+        asyncio.create_task(RATE_LIMITER.run(get_redis, RATE_LIMIT_SYNC_SECONDS)),
+        asyncio.create_task(REDIS_BREAKER.run(probe_redis, REDIS_PROBE_SECONDS)),
+        asyncio.create_task(HEALTH.run(HEALTH_CHECK_SECONDS)),
+    ]
+    if DATA_RELOAD_SECONDS > 0:
+        tasks.append(asyncio.create_task(reload_holiday_data_periodically()))
 
+    yield
 
-app = FastAPI(lifespan=lifespan)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    # Write out usage and request counts since the last flush/sync
+    await USAGE_RECORDER.flush(get_redis())
+    await RATE_LIMITER.sync(get_redis())
+    for client in (REDIS_CLIENT, REDIS_PENDING_CLIENT):
+        if client:
+            await client.aclose()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through the configured JSON serializer"""
+
+    def render(self, content) -> bytes:
+        return serialize_json(content)
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, registry=METRICS, server_timing=SERVER_TIMING)
+if ACCESS_LOG:
+    app.add_middleware(AccessLogMiddleware, logger=logging.getLogger("app.access"))
+
+
+def build_store(paths: Dict[int, Path]) -> Union[HolidayStore, ArtifactStore]:
+    """Load the given data files into a new store (blocking, run in a thread)
+
+    The binary artifact is memory-mapped instead of parsing the JSON files
+    when it was compiled from exactly these files.
+    """
+    store = load_store(DATA_DIR, paths, DATA_ARTIFACT)
+    # Warm the default business calendar so the first request after a
+    # reload doesn't pay for it
+    store.business_calendar()
+    return store
+
+
+def sync_shared_data(paths: Dict[int, Path], check: bool):
+    """Publish changed data files, then attach a newer shared generation.
+
+    Blocking, run in a thread. Returns the newly attached store, or None
+    while the attached generation is still the current one.
+    """
+    if check:
+        SHARED_DATA.update(paths, build_store)
+    store = SHARED_DATA.attach()
+    if store is not None:
+        store.business_calendar()
+        logger.info("Attached holiday data generation %s", SHARED_DATA.generation)
+    return store
+
+
+async def load_data_files(force: bool = False) -> set:
+    """Rescan the data directory and swap in a new store if files changed.
+
+    The directory scan and the index build run in a worker thread; the
+    store, data file paths and year range are then replaced together on the
+    event loop. With SHARED_DATA, changed files are published as a new
+    generation and every call switches to the latest one, whichever worker
+    published it. Returns the years whose data may have changed (every year
+    with force=True).
+    """
+    global DATA_FILES, YEAR_MIN, YEAR_MAX
+    changed = await asyncio.to_thread(DATA_WATCHER.poll)
+    if SHARED_DATA is not None:
+        paths = dict(DATA_WATCHER.paths)
+        store = await asyncio.to_thread(sync_shared_data, paths, bool(changed) or force)
+        if store is None:
+            return set()
+        changed = {
+            year
+            for year in set(CALENDAR.store.years) | set(store.years)
+            if CALENDAR.store.version(year) != store.version(year)
+        }
+    elif not changed and not force:
+        return set()
+    else:
+        paths = dict(DATA_WATCHER.paths)
+        store = await asyncio.to_thread(build_store, paths)
+        # Years loaded on demand since the last reload are replaced as well
+        changed |= set(CALENDAR.store.years) ^ set(store.years)
+    if force:
+        changed |= set(CALENDAR.store.years) | set(store.years)
+
+    CALENDAR.store = store
+    DATA_FILES = paths
+    years = set(paths) | set(store.years)
+    if years:
+        YEAR_MIN, YEAR_MAX = min(years), max(years)
+    logger.info("Loaded holiday data for years: %s", sorted(store.years))
+    return changed
+
+
+async def reload_holiday_data(force: bool = False) -> bool:
+    """Reload changed data files and drop every cache derived from them.
+
+    Cached responses and the Redis `holidays:{year}` copies of the changed
+    years are invalidated. When files changed locally, the new data version
+    is published to Redis so other instances reload too. Returns whether
+    anything was reloaded.
+    """
+    global DATA_VERSION_SEEN
+    async with DATA_RELOAD_LOCK:
+        changed = await load_data_files(force)
+        if not changed:
+            return False
+        for year in changed:
+            RESPONSE_CACHE.invalidate(year)
+        DATA_RELOADS.inc("version_key" if force else "files")
+        redis = get_redis()
+        if redis and not force:
+            try:
+                await redis.delete(*(f"holidays:{year}" for year in changed))
+                DATA_VERSION_SEEN = store_version(CALENDAR.store)
+                await redis.set(DATA_VERSION_KEY, DATA_VERSION_SEEN)
+            except RedisError:
+                REDIS_ERRORS.inc("data_version")
+                logger.error("Failed to publish the new holiday data version")
+        return True
+
+
+async def reload_holiday_data_periodically():
+    """Pick up changed data files, or a new data version set in Redis"""
+    global DATA_VERSION_SEEN
+    while True:
+        await asyncio.sleep(DATA_RELOAD_SECONDS)
+        force = False
+        redis = get_redis()
+        if redis:
+            try:
+                version = await redis.get(DATA_VERSION_KEY)
+                if version != DATA_VERSION_SEEN:
+                    DATA_VERSION_SEEN = version
+                    force = version is not None
+            except RedisError:
+                REDIS_ERRORS.inc("data_version")
+        try:
+            await reload_holiday_data(force)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to reload holiday data")
+
+
+async def refresh_api_keys(force: bool = False):
+    """Reload the API key index from Redis when the key store has changed.
+
+    The full key list is only fetched when the version key differs from the
+    loaded one (or is not set). force=True skips the version check but still
+    honours API_KEYS_MIN_RELOAD_SECONDS.
+    """
+    redis = get_redis()
+    if not redis:
+        return
+    async with API_KEYS_LOCK:
+        if force and API_KEY_INDEX.age() < API_KEYS_MIN_RELOAD_SECONDS:
+            return
+        with METRICS.stage("auth_backend"):
+            version = await redis.get(API_KEYS_VERSION_KEY)
+            if (
+                not force
+                and API_KEY_INDEX.loaded
+                and version is not None
+                and version == API_KEY_INDEX.version
+            ):
+                return
+            records = await redis.json().get(API_KEYS_KEY, Path(".api_keys"))
+        API_KEY_INDEX.replace(records or [], version)  # type: ignore
+        logger.info("Loaded %s API keys from Redis", len(API_KEY_INDEX))
+
+
+async def refresh_api_keys_periodically():
+    """Keep the API key index in sync with Redis off the request path"""
+    while True:
+        await asyncio.sleep(API_KEYS_REFRESH_SECONDS)
+        try:
+            await refresh_api_keys()
+        except (RedisError, ValueError, AttributeError):
+            REDIS_ERRORS.inc("api_keys_refresh")
+            logger.error("Failed to refresh API keys from Redis")
 
 
 async def verify_api_key(key: Optional[str] = Depends(api_key_header_scheme)):
     """Validate API key from Redis or fallback environment variables"""
+    with METRICS.stage("auth"):
+        return await check_api_key(key)
+
+
+def enforce_rate_limit(key_hash: str, limit: RateLimit):
+    """Raise 429 if the key is over its rate limit or daily quota"""
+    retry_after = RATE_LIMITER.acquire(key_hash, limit)
+    if retry_after:
+        sampled_logger.debug("Rate limited API key %s", key_hash[:16])
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded. Please retry later.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+async def check_api_key(key: Optional[str]):
+    """Return the key if valid, raise 401 otherwise"""
     if not key:
+        API_KEY_CHECKS.inc("missing")
         logger.warning("API key is missing in the request")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,43 +681,42 @@ async def verify_api_key(key: Optional[str] = Depends(api_key_header_scheme)):
     # Hash the provided key for comparison
     provided_hash = hashlib.sha256(key.encode()).hexdigest()
 
-    # Check Redis if available
-    if REDIS_CLIENT:
+    # Check the in-process key index, which is synced from Redis in the
+    # background and stays usable if Redis goes away
+    if get_redis() or API_KEY_INDEX.loaded:
         try:
-            logger.info("Checking API key in Redis")
-            json_data = (
-                await REDIS_CLIENT.json().get("API_KEYS_V2", Path(".api_keys")) or []
-            )
-            for entry in json_data:
-                if not compare_digest(entry.get("hash"), provided_hash):  # type: ignore
-                    continue
-                if entry.get("active") is False:  # type: ignore
+            if not API_KEY_INDEX.loaded:
+                await refresh_api_keys()
+            entry = API_KEY_INDEX.get(provided_hash)
+            if entry is None and not API_KEY_INDEX.is_known_invalid(provided_hash):
+                # Possibly a key issued since the last reload
+                await refresh_api_keys(force=True)
+                entry = API_KEY_INDEX.get(provided_hash)
+                if entry is None:
+                    API_KEY_INDEX.mark_invalid(provided_hash)
+            if entry is not None:
+                if entry.get("active") is False:
+                    API_KEY_CHECKS.inc("revoked")
                     logger.warning("API key marked as revoked in Redis")
                     raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
                         detail="Invalid or revoked API key. Use 'X-API-Key' header with a valid key.",
                     )
-                # Increment usage counter
-                try:
-                    utc_now = datetime.now(timezone.utc)
-                    hour_str = utc_now.strftime("%Y%m%d%H")  # ex:2025112814
-                    counter_key = f"usage:{provided_hash[:16]}:{hour_str}"
-
-                    pipe = REDIS_CLIENT.pipeline()
-                    pipe.incr(counter_key)
-                    pipe.expire(counter_key, 86400 * 30)
-                    await pipe.execute()
-                except Exception:
-                    logger.error("Failed to log usage")
-                logger.info("API key validated via Redis")
+                enforce_rate_limit(provided_hash, RATE_LIMITER.limit_for(entry))
+                # Increment usage counter (written to Redis in batches)
+                USAGE_RECORDER.record(provided_hash)
+                API_KEY_CHECKS.inc("index")
+                set_request_fields(auth="index")
+                sampled_logger.debug("API key validated via Redis")
                 return key
             logger.warning("API key not found in Redis. Possibly invalid key")
-        except (redis.RedisError, ValueError, AttributeError):
+        except (RedisError, ValueError, AttributeError):
+            REDIS_ERRORS.inc("auth")
             logger.error("Auth backend failed")
             pass
 
     # Fallback to environment variables
-    logger.info("Checking API key against fallback environment variables")
+    sampled_logger.debug("Checking API key against fallback environment variables")
     if not FALLBACK_API_KEY_HASHES or not any(FALLBACK_API_KEY_HASHES):
         logger.warning(
             "Redis Failure: No fallback API keys found in environment variables"
@@ -156,9 +729,13 @@ async def verify_api_key(key: Optional[str] = Depends(api_key_header_scheme)):
     # Check hashed keys in fallback environment variables
     for fallback_key_hash in FALLBACK_API_KEY_HASHES:
         if compare_digest(fallback_key_hash, provided_hash):
-            logger.info("API key validated via fallback environment variables")
+            enforce_rate_limit(provided_hash, RATE_LIMITER.default)
+            API_KEY_CHECKS.inc("fallback")
+            set_request_fields(auth="fallback")
+            sampled_logger.debug("API key validated via fallback environment variables")
             return key
 
+    API_KEY_CHECKS.inc("rejected")
     logger.warning("Rejecting request with invalid API key")
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -166,106 +743,151 @@ async def verify_api_key(key: Optional[str] = Depends(api_key_header_scheme)):
     )
 
 
-async def get_holiday_info(year: int, month: int, day: int):
-    """Process provided date and return holiday information with status code"""
-    try:
-        date_to_check = date(year, month, day)
-    except (ValueError, TypeError):
-        logger.error(
-            "Invalid date provided: year=%s, month=%s, day=%s", year, month, day
-        )
-        return None, status.HTTP_400_BAD_REQUEST, {"error": "Invalid date provided"}
+def check_year(year: int):
+    """Reject years outside the range covered by the data files (422)"""
+    if year < YEAR_MIN:
+        error_type, bound, relation = "greater_than_equal", "ge", "greater"
+        limit = YEAR_MIN
+    elif year > YEAR_MAX:
+        error_type, bound, relation = "less_than_equal", "le", "less"
+        limit = YEAR_MAX
+    else:
+        return
+    raise RequestValidationError(
+        [
+            {
+                "type": error_type,
+                "loc": ("query", "year"),
+                "msg": f"Input should be {relation} than or equal to {limit}",
+                "input": str(year),
+                "ctx": {bound: limit},
+            }
+        ]
+    )
+
+
+async def load_holiday_year(year: int):
+    """Load a year missing from the in-memory store via Redis cache or data file.
 
+    Returns a (status_code, error) tuple, error being None once the year is
+    available in CALENDAR.
+    """
     cache_key = f"holidays:{year}"
     holiday_data = None
 
     # Try Redis cache
-    if REDIS_CLIENT:
+    redis = get_redis()
+    if redis:
         try:
-            logger.info("Checking Redis cache for %s", cache_key)
-            holiday_data_cached = await REDIS_CLIENT.get(cache_key)
+            sampled_logger.debug("Checking Redis cache for %s", cache_key)
+            with METRICS.stage("redis_cache"):
+                holiday_data_cached = await redis.get(cache_key)
             if holiday_data_cached:
-                logger.info("Cache hit for %s in Redis", cache_key)
-                holiday_data = json.loads(holiday_data_cached)  # type: ignore
-        except redis.RedisError:
+                sampled_logger.debug("Cache hit for %s in Redis", cache_key)
+                with METRICS.stage("parse"):
+                    holiday_data = deserialize_json(holiday_data_cached)  # type: ignore
+                    holidays = parse_holidays(holiday_data)
+                HOLIDAY_DATA_LOADS.inc("redis", "hit")
+                set_request_fields(data_source="redis")
+            else:
+                HOLIDAY_DATA_LOADS.inc("redis", "miss")
+        except RedisError:
+            REDIS_ERRORS.inc("cache_get")
+            HOLIDAY_DATA_LOADS.inc("redis", "error")
             logger.error(
                 "Redis cache failed for %s, falling back to file read", cache_key
             )
             pass
         except json.JSONDecodeError:
+            HOLIDAY_DATA_LOADS.inc("redis", "error")
             logger.error("Failed to decode cached data for %s in Redis", cache_key)
             pass
 
     # If Redis cache is not available or no cache hit, read from file
     if holiday_data is None:
-        logger.info(
+        sampled_logger.debug(
             "No cache hit for %s, reading from file for year %s", cache_key, year
         )
-        base_dir = Path("json")
-        filename = base_dir / f"{year}.json"
-
-        # Resolve the path to prevent directory traversal
-        resolved_path = filename.resolve()
-
-        # Ensure the resolved path is within the intended directory
-        if not resolved_path.parent.samefile(base_dir.resolve()):
-            logger.warning("Invalid file path received: %s", resolved_path)
+        file_path = DATA_FILES.get(year)
+        if file_path is None:
+            HOLIDAY_DATA_LOADS.inc("file", "miss")
+            logger.error("Data file not found for year %s", year)
             return (
-                date_to_check,
-                status.HTTP_400_BAD_REQUEST,
-                {"error": "Invalid file path"},
+                status.HTTP_404_NOT_FOUND,
+                {"error": "Data for requested year not available"},
             )
 
         try:
-            with open(resolved_path, "r", encoding="utf-8") as file:
-                holiday_data = json.load(file)
-                # Cache in Redis with 24-hour TTL
-                if REDIS_CLIENT:
-                    try:
-                        await REDIS_CLIENT.setex(
-                            cache_key, 86400, json.dumps(holiday_data)
-                        )
-                        logger.info("Cached %s in Redis", cache_key)
-                    except redis.RedisError:
-                        logger.error("Failed to cache %s in Redis", cache_key)
-                        pass  # Continue without caching if Redis fails
+            with METRICS.stage("file_read"):
+                holiday_data, holidays = await asyncio.to_thread(
+                    read_data_file, file_path
+                )
         except FileNotFoundError:
+            HOLIDAY_DATA_LOADS.inc("file", "miss")
             logger.error("Data file not found for year %s", year)
             return (
-                date_to_check,
                 status.HTTP_404_NOT_FOUND,
                 {"error": "Data for requested year not available"},
             )
         except json.JSONDecodeError:
+            HOLIDAY_DATA_LOADS.inc("file", "error")
             logger.error("Invalid JSON format in file for year %s", year)
             return (
-                date_to_check,
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
                 {
                     "error": "Invalid data format for requested year. Please notify the admin."
                 },
             )
+        HOLIDAY_DATA_LOADS.inc("file", "hit")
+        set_request_fields(data_source="file")
+
+        # Cache in Redis with 24-hour TTL
+        redis = get_redis()
+        if redis:
+            try:
+                await redis.setex(cache_key, 86400, serialize_json(holiday_data))
+                sampled_logger.debug("Cached %s in Redis", cache_key)
+            except RedisError:
+                REDIS_ERRORS.inc("cache_set")
+                logger.error("Failed to cache %s in Redis", cache_key)
+                pass  # Continue without caching if Redis fails
+
+    # A reload may have added the year while this one was being read
+    if not CALENDAR.has_year(year):
+        CALENDAR.store = CALENDAR.store.with_year(year, holidays)
+    return status.HTTP_200_OK, None
+
+
+def holiday_match(holiday):
+    """Format a holiday covering a looked up date"""
+    return {
+        "id": holiday.uid,
+        "holiday": holiday.summary,
+        "type": list(holiday.categories),
+        "holiday_start": holiday.start_iso,
+        "holiday_end": holiday.end_iso,
+    }
 
-    # Process holiday data (from cache or file)
-    matches = []
-    for holiday in holiday_data:
-        try:
-            start_date = datetime.strptime(holiday["start"], "%Y-%m-%d").date()
-            end_date = datetime.strptime(holiday["end"], "%Y-%m-%d").date()
-        except (ValueError, KeyError):
-            logger.warning("Invalid holiday entry detected: %s", holiday)
-            continue  # Skip invalid holiday entries
-
-        if start_date <= date_to_check < end_date:
-            matches.append(
-                {
-                    "id": holiday.get("uid"),
-                    "holiday": holiday.get("summary"),
-                    "type": holiday.get("categories"),
-                    "holiday_start": holiday.get("start"),
-                    "holiday_end": holiday.get("end"),
-                }
-            )
+
+async def get_holiday_info(year: int, month: int, day: int):
+    """Process provided date and return holiday information with status code"""
+    try:
+        date_to_check = date(year, month, day)
+    except (ValueError, TypeError):
+        logger.error(
+            "Invalid date provided: year=%s, month=%s, day=%s", year, month, day
+        )
+        return None, status.HTTP_400_BAD_REQUEST, {"error": "Invalid date provided"}
+
+    # Years loaded at startup are served from memory without any I/O
+    if not CALENDAR.has_year(year):
+        status_code, error = await load_holiday_year(year)
+        if error:
+            return date_to_check, status_code, error
+
+    matches = [
+        holiday_match(holiday) for holiday in CALENDAR.holidays_on(date_to_check)
+    ]
 
     if matches:
         result = {
@@ -282,45 +904,120 @@ async def get_holiday_info(year: int, month: int, day: int):
     return date_to_check, status.HTTP_200_OK, {"is_holiday": False}
 
 
-@app.head("/api/v1/health")
-async def api_health_head():
-    """Return status of the API (HEAD request)"""
-    redis_healthy = False
-    if REDIS_CLIENT:
-        try:
-            await REDIS_CLIENT.ping()
-            redis_healthy = True
-        except redis.RedisError:
-            logger.warning("Health check: Redis ping failed")
-
-    # if Redis is down and fallback key count is not greater than 2
-    # Default 2 fallback keys: Dev key, Test key.
-    if not redis_healthy and not len(FALLBACK_API_KEY_HASHES) > 2:
-        logger.warning(
-            "Health check failed: Redis down and no fallback API keys configured"
-        )
-        return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+async def get_cache_headers(year: int, *variant):
+    """Return ETag/Last-Modified/Cache-Control headers for a year's data.
 
-    # Canary check [Known Holiday]: 2025-02-04 - Sri Lanka National Day
-    try:
-        _, status_code, result = await get_holiday_info(2025, 2, 4)
-    except Exception:
-        logger.warning(
-            "Health check failed: get_holiday_info raised an exception", exc_info=True
-        )
-        return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    Loads the year into the store if needed; returns None when the year is not
+    available so the caller can produce its usual error response.
+    """
+    if not CALENDAR.has_year(year):
+        _, error = await load_holiday_year(year)
+        if error:
+            return None
+    return {
+        "ETag": make_etag(CALENDAR.store.version(year), *variant),
+        "Last-Modified": format_http_date(CALENDAR.store.last_modified(year)),
+        "Cache-Control": CACHE_CONTROL,
+    }
 
+
+def not_modified_response(
+    year: int,
+    headers: Optional[dict],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+):
+    """Return a 304 response if the client's cached copy is still valid"""
+    if headers and is_not_modified(
+        headers["ETag"],
+        CALENDAR.store.last_modified(year),
+        if_none_match,
+        if_modified_since,
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+async def check_redis_health():
+    """Health check: Redis reachability"""
+    redis = get_redis()
+    error = None
+    if redis is None:
+        error = "circuit breaker open" if REDIS_CLIENT else "not connected"
+    else:
+        try:
+            await redis.ping()
+        except RedisError as exc:
+            REDIS_ERRORS.inc("health_ping")
+            error = f"ping failed ({exc})"
+    if error is None:
+        return "ok", None
+    # Redis down only fails the check if fallback key count is not greater
+    # than 2. Default 2 fallback keys: Dev key, Test key.
+    if len(FALLBACK_API_KEY_HASHES) > 2:
+        return "degraded", f"Redis {error}, using fallback API keys"
+    return "fail", f"Redis {error} and no fallback API keys configured"
+
+
+async def check_data_health():
+    """Health check: holiday lookup canary"""
+    # Canary check [Known Holiday]: 2025-02-04 - Sri Lanka National Day
+    _, status_code, result = await get_holiday_info(2025, 2, 4)
     if status_code != status.HTTP_200_OK or not result.get("is_holiday"):
-        logger.warning(
-            f"Health check failed: holiday API returned status={status_code}, "
-            f"is_holiday => {result.get('is_holiday') if result else None}"
+        return (
+            "fail",
+            f"Holiday API returned status={status_code}, "
+            f"is_holiday => {result.get('is_holiday') if result else None}",
         )
-        return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return "ok", None
+
+
+# Results of the background health checks
+HEALTH = HealthMonitor(
+    {"redis": check_redis_health, "data": check_data_health},
+    max_age=3 * HEALTH_CHECK_SECONDS,
+)
+
+
+def health_response():
+    """200 or 503 from the latest health check results"""
+    if HEALTH.is_ready():
+        return Response(status_code=status.HTTP_200_OK)
+    return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@app.head("/api/v1/health")
+async def api_health_head():
+    """Return status of the API (HEAD request) from the latest background checks"""
+    return health_response()
+
 
-    logger.info("=== Health check passed ===")
+@app.get("/api/v1/health/live")
+@app.head("/api/v1/health/live")
+async def api_health_live():
+    """Liveness probe: the process is up and serving requests"""
     return Response(status_code=status.HTTP_200_OK)
 
 
+@app.get("/api/v1/health/ready")
+@app.head("/api/v1/health/ready")
+async def api_health_ready():
+    """Readiness probe: the latest background health checks pass"""
+    return health_response()
+
+
+@app.get("/api/v1/health/deep")
+async def api_health_deep(
+    response: Response,
+    api_key: str = Depends(verify_api_key),
+):
+    """Run every health check now and return the detailed results"""
+    await HEALTH.check()
+    if not HEALTH.is_ready():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return HEALTH.snapshot()
+
+
 @app.get("/api/v1/status")
 async def api_status(
     api_key: str = Depends(verify_api_key),
@@ -331,7 +1028,7 @@ async def api_status(
         "api_version": API_VERSION,
         "API_Key_Validation": "successful",
         "timestamp": datetime.now().isoformat(),
-        "redis_connected": REDIS_CLIENT is not None,
+        "redis_connected": get_redis() is not None,
         "data_store_year_min": YEAR_MIN,
         "data_store_year_max": YEAR_MAX,
     }
@@ -351,25 +1048,12 @@ async def api_version(
 
 @app.get("/api/v1/coverage")
 async def api_coverage_year(
-    year: Annotated[int, Query(ge=YEAR_MIN, le=YEAR_MAX)],
+    year: Annotated[int, Query()],
     api_key: str = Depends(verify_api_key),
 ):
     """Return current data coverage in the API for a given year"""
-    base_dir = Path("json")
-    filename = base_dir / f"{year}.json"
-
-    # Resolve the path to prevent directory traversal
-    resolved_path = filename.resolve()
-
-    # Ensure the resolved path is within the intended directory
-    if not resolved_path.parent.samefile(base_dir.resolve()):
-        return {
-            "year": year,
-            "error": "Invalid file path",
-        }
-
-    # Check if the file exists
-    if resolved_path.is_file():
+    check_year(year)
+    if CALENDAR.has_year(year) or year in DATA_FILES:
         return {
             "year": year,
             "coverage": "ok",
@@ -383,18 +1067,29 @@ async def api_coverage_year(
 
 @app.get("/api/v1/check_holiday")
 async def check_holiday(
-    year: Annotated[int, Query(ge=YEAR_MIN, le=YEAR_MAX)],
+    year: Annotated[int, Query()],
     month: Annotated[int, Query(ge=1, le=12)],
     day: Annotated[int, Query(ge=1, le=31)],
     response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    if_modified_since: Annotated[Optional[str], Header()] = None,
     api_key: str = Depends(verify_api_key),
 ):
     """Return whether a given date is a holiday or not"""
+    check_year(year)
+    headers = await get_cache_headers(year, "check_holiday", month, day)
+    not_modified = not_modified_response(
+        year, headers, if_none_match, if_modified_since
+    )
+    if not_modified:
+        return not_modified
+
     date_provided, status_code, result = await get_holiday_info(year, month, day)
     if response:
         response.status_code = status_code
     if status_code != status.HTTP_200_OK:
         return {"response": result}
+    response.headers.update(headers or {})
     if result["is_holiday"]:
         return {"date": date_provided, "response": True}
     return {"date": date_provided, "response": False}
@@ -402,96 +1097,461 @@ async def check_holiday(
 
 @app.get("/api/v1/holiday_info")
 async def holiday_info(
-    year: Annotated[int, Query(ge=YEAR_MIN, le=YEAR_MAX)],
+    year: Annotated[int, Query()],
     month: Annotated[int, Query(ge=1, le=12)],
     day: Annotated[int, Query(ge=1, le=31)],
     response: Response,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    if_modified_since: Annotated[Optional[str], Header()] = None,
     api_key: str = Depends(verify_api_key),
 ):
     """Return information about a given holiday"""
+    check_year(year)
+    headers = await get_cache_headers(year, "holiday_info", month, day)
+    not_modified = not_modified_response(
+        year, headers, if_none_match, if_modified_since
+    )
+    if not_modified:
+        return not_modified
+
     date_provided, status_code, result = await get_holiday_info(year, month, day)
     if response:
         response.status_code = status_code
+    if status_code == status.HTTP_200_OK:
+        response.headers.update(headers or {})
     return {"date": date_provided, "response": result}
 
 
+class DateRange(BaseModel):
+    """Inclusive range of dates"""
+
+    start: date
+    end: date
+
+
+class BatchCheckRequest(BaseModel):
+    """Dates and date ranges to check in a single request"""
+
+    dates: List[date] = []
+    ranges: List[DateRange] = []
+
+
+def expand_batch(dates: List[date], ranges: List[DateRange]):
+    """Expand dates and inclusive ranges into the list of dates to check.
+
+    Returns a (days, error) tuple, error being set when the batch is invalid.
+    """
+    total = len(dates)
+    for date_range in ranges:
+        if date_range.end < date_range.start:
+            return None, {"error": "Invalid date range: end is before start"}
+        total += (date_range.end - date_range.start).days + 1
+    if total > BATCH_MAX_DATES:
+        return None, {
+            "error": f"Too many dates requested. Maximum batch size is {BATCH_MAX_DATES}"
+        }
+
+    days = list(dates)
+    for date_range in ranges:
+        first = date_range.start.toordinal()
+        days.extend(
+            date.fromordinal(ordinal)
+            for ordinal in range(first, date_range.end.toordinal() + 1)
+        )
+    return days, None
+
+
+def parse_batch_query(dates: Optional[str], ranges: Optional[str]):
+    """Parse the compact query form: dates=D1,D2 and ranges=D1..D2,D3..D4"""
+    parsed_dates = [
+        date.fromisoformat(d.strip()) for d in (dates or "").split(",") if d.strip()
+    ]
+    parsed_ranges = []
+    for item in (ranges or "").split(","):
+        if not item.strip():
+            continue
+        start, end = item.split("..")
+        parsed_ranges.append(
+            DateRange(
+                start=date.fromisoformat(start.strip()),
+                end=date.fromisoformat(end.strip()),
+            )
+        )
+    return parsed_dates, parsed_ranges
+
+
+def batch_entry(day: date, holidays, available: bool):
+    """Format the result for a single date of a batch"""
+    if not available:
+        return {
+            "date": day.isoformat(),
+            "error": "Data for requested year not available",
+        }
+    if holidays:
+        return {
+            "date": day.isoformat(),
+            "is_holiday": True,
+            "holidays": [holiday_match(holiday) for holiday in holidays],
+        }
+    return {"date": day.isoformat(), "is_holiday": False}
+
+
+def iter_batch_body(days: List[date], matches, available_years) -> Iterator[bytes]:
+    """Yield a batch response body in chunks
+
+    The body is {"count": <n>, "results": [...]}, with the results array
+    written 500 entries at a time.
+    """
+    yield b'{"count":%d,"results":[' % len(days)
+    chunk_size = 500
+    for offset in range(0, len(days), chunk_size):
+        entries = [
+            batch_entry(day, holidays, day.year in available_years)
+            for day, holidays in zip(
+                days[offset : offset + chunk_size],
+                matches[offset : offset + chunk_size],
+            )
+        ]
+        # Each chunk is serialized as a list; drop its brackets and separate
+        # it from the previous chunk with a comma
+        body = serialize_json(entries)[1:-1]
+        if offset > 0:
+            body = b"," + body
+        yield body
+    yield b"]}"
+
+
+async def check_holidays_batch(days: List[date]):
+    """Look up every date of a batch and build the response"""
+    # Make sure every requested year is loaded before the lookup
+    available_years = set()
+    for year in sorted({day.year for day in days}):
+        if CALENDAR.has_year(year):
+            available_years.add(year)
+            continue
+        if not YEAR_MIN <= year <= YEAR_MAX:
+            continue
+        _, error = await load_holiday_year(year)
+        if not error:
+            available_years.add(year)
+
+    matches = CALENDAR.holidays_on_many(days)
+    body = iter_batch_body(days, matches, available_years)
+    if len(days) > BATCH_STREAM_THRESHOLD:
+        return StreamingResponse(body, media_type="application/json")
+    return Response(content=b"".join(body), media_type="application/json")
+
+
+def holiday_entry(holiday):
+    """Format a holiday for the holiday listing endpoints"""
+    return {
+        "date": holiday.start_iso,
+        "name": holiday.summary,
+        "type": list(holiday.categories),
+        "start": holiday.start_iso,
+        "end": holiday.end_iso,
+        "id": holiday.uid,
+    }
+
+
+def normalize_type(type: Optional[str]) -> Optional[str]:
+    """Return the category key of a listing's type filter (None for no filter)
+
+    Types that no holiday has all list nothing, so they share one key ("")
+    rather than each taking its own response cache entry.
+    """
+    if not type:
+        return None
+    type_key = type.strip().lower()
+    return type_key if type_key in CALENDAR.store.category_keys else ""
+
+
+def type_categories(type_key: Optional[str]):
+    """Return the category selection of a listing's type filter"""
+    return None if type_key is None else (type_key,)
+
+
+def build_holidays_list(
+    year: int, month: Optional[int], type_key: Optional[str], format: str
+):
+    """Filter and format the holidays of a loaded year for /api/v1/holidays"""
+    result = []
+    # Track seen dates when returning simple format to avoid duplicates
+    seen_dates = set()
+    # Month filtering is a binary search over the start-sorted holidays
+    for holiday in CALENDAR.holidays(year, month, type_categories(type_key)):
+        # Format output
+        start = holiday.start_iso
+        if format == "simple":
+            # Avoid adding the same date multiple times
+            if start in seen_dates:
+                continue
+            seen_dates.add(start)
+            result.append(start)
+        else:
+            result.append(holiday_entry(holiday))
+    return result
+
+
+def resolve_list_format(format: Optional[str], accept: Optional[str]) -> str:
+    """Return the requested listing format, negotiated from Accept if not given"""
+    if format is not None:
+        return format
+    return negotiate_format(accept) or "full"
+
+
+def export_response(fmt: str, body, filename: str, headers: Optional[dict] = None):
+    """Build an ICS/CSV/XML response from a complete body or an iterator of chunks"""
+    media_type, extension = EXPORT_FORMATS[fmt]
+    headers = dict(headers or {})
+    headers["Content-Disposition"] = f'inline; filename="{filename}{extension}"'
+    if isinstance(body, bytes):
+        return Response(content=body, media_type=media_type, headers=headers)
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
 @app.get("/api/v1/holidays")
 async def holidays_list(
-    year: Annotated[int, Query(ge=YEAR_MIN, le=YEAR_MAX)],
+    year: Annotated[int, Query()],
     response: Response,
     month: Annotated[Optional[int], Query(ge=1, le=12)] = None,
     type: Annotated[Optional[str], Query()] = None,
-    format: Annotated[str, Query()] = "full",
+    format: Annotated[Optional[str], Query()] = None,
+    accept: Annotated[Optional[str], Header()] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    if_modified_since: Annotated[Optional[str], Header()] = None,
     api_key: str = Depends(verify_api_key),
 ):
-    """Return list of holidays for a given year or year/month, optionally filtered by type"""
+    """Return list of holidays for a given year or year/month, optionally filtered by type.
+    format=ics/csv/xml (or a matching Accept header) returns a calendar feed/file"""
+    check_year(year)
     # Validate format
-    if format not in ["simple", "full"]:
+    format = resolve_list_format(format, accept)
+    if format not in HOLIDAY_LIST_FORMATS:
         response.status_code = status.HTTP_400_BAD_REQUEST
-        return {"error": "Invalid format. Use 'simple' or 'full'"}
+        return INVALID_FORMAT_ERROR
 
-    # Safely construct file path
-    base_dir = Path("json")
-    filename = base_dir / f"{year}.json"
-    resolved_path = filename.resolve()
+    # Load holiday data
+    if not CALENDAR.has_year(year):
+        status_code, error = await load_holiday_year(year)
+        if error:
+            response.status_code = status_code
+            return error
+
+    # Answer revalidation requests before doing any filtering work
+    type_key = normalize_type(type)
+    cache_key = (year, month, type_key, format)
+    headers = await get_cache_headers(*cache_key)
+    if headers:
+        # The representation depends on Accept when format is not given
+        headers["Vary"] = "Accept"
+    not_modified = not_modified_response(
+        year, headers, if_none_match, if_modified_since
+    )
+    if not_modified:
+        return not_modified
+
+    # Serve the pre-serialized body if this combination was built before
+    version = CALENDAR.store.version(year)
+    body = RESPONSE_CACHE.get(cache_key, version)
+    if format in EXPORT_FORMATS:
+        if body is None:
+            holidays = CALENDAR.holidays(year, month, type_categories(type_key))
+            body = iter_export(format, holidays, CALENDAR.store.last_modified(year))
+            # Large listings are streamed instead of being held in the cache
+            if len(holidays) <= EXPORT_STREAM_THRESHOLD:
+                body = b"".join(body)
+                RESPONSE_CACHE.put(cache_key, version, body)
+        filename = f"{year}-{month:02d}" if month else str(year)
+        return export_response(format, body, filename, headers)
+    if body is None:
+        body = serialize_json(
+            {"holidays": build_holidays_list(year, month, type_key, format)}
+        )
+        RESPONSE_CACHE.put(cache_key, version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
-    # Ensure path is within json directory
-    if not resolved_path.parent.samefile(base_dir.resolve()):
-        response.status_code = status.HTTP_400_BAD_REQUEST
-        return {"error": "Invalid file path"}
 
-    # Load holiday data
+@app.get("/api/v1/check_holidays")
+async def check_holidays_query(
+    response: Response,
+    dates: Annotated[Optional[str], Query()] = None,
+    ranges: Annotated[Optional[str], Query()] = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return holiday status for many dates (dates=2025-01-01,2025-02-04 and/or
+    ranges=2025-04-01..2025-04-30)"""
     try:
-        with open(resolved_path, "r", encoding="utf-8") as file:
-            holiday_data = json.load(file)
-    except FileNotFoundError:
-        response.status_code = status.HTTP_404_NOT_FOUND
-        return {"error": "Data for requested year not available"}
-    except json.JSONDecodeError:
-        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        return {
-            "error": "Invalid data format for requested year. Please notify the admin."
-        }
+        parsed_dates, parsed_ranges = parse_batch_query(dates, ranges)
+    except ValueError:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"error": "Invalid date provided"}
+
+    days, error = expand_batch(parsed_dates, parsed_ranges)
+    if error:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return error
+    return await check_holidays_batch(days)
+
+
+@app.get("/api/v1/holidays/range")
+async def holidays_range(
+    start: Annotated[date, Query(alias="from")],
+    end: Annotated[date, Query(alias="to")],
+    response: Response,
+    type: Annotated[Optional[str], Query()] = None,
+    format: Annotated[Optional[str], Query()] = None,
+    accept: Annotated[Optional[str], Header()] = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return holidays overlapping the inclusive from/to date range, across years,
+    optionally filtered by type. format=ics/csv/xml (or a matching Accept header)
+    returns a calendar feed/file"""
+    format = resolve_list_format(format, accept)
+    if format not in HOLIDAY_LIST_FORMATS:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return INVALID_FORMAT_ERROR
+    if end < start:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"error": "Invalid date range: 'to' is before 'from'"}
+
+    # Load the years of the range that are not in the store yet. As with the
+    # business day endpoints, a year without data is a 404 rather than a
+    # silently shorter listing.
+    for year in range(start.year, end.year + 1):
+        if not CALENDAR.has_year(year) and YEAR_MIN <= year <= YEAR_MAX:
+            await load_holiday_year(year)
+        if not CALENDAR.has_year(year):
+            response.status_code = status.HTTP_404_NOT_FOUND
+            return {"error": f"Holiday data for {year} is not available"}
+
+    type_key = normalize_type(type)
+    holidays = CALENDAR.holidays_between(start, end, type_categories(type_key))
+    if format in EXPORT_FORMATS:
+        modified = max(
+            CALENDAR.store.last_modified(year)
+            for year in range(start.year, end.year + 1)
+        )
+        body = iter_export(format, holidays, modified)
+        if len(holidays) <= EXPORT_STREAM_THRESHOLD:
+            body = b"".join(body)
+        headers = {"Vary": "Accept"}
+        filename = f"{start.isoformat()}_{end.isoformat()}"
+        return export_response(format, body, filename, headers)
 
-    # Filter and format holidays
     result = []
-    # Track seen dates when returning simple format to avoid duplicates
     seen_dates = set()
-    for holiday in holiday_data:
-        try:
-            if "start" not in holiday or "end" not in holiday:
-                continue  # Skip invalid holiday entries
-            start_date = datetime.strptime(holiday["start"], "%Y-%m-%d").date()
-            # Filter by month if provided
-            if month and start_date.month != month:
-                continue
-            # Filter by type if provided
-            if type and type.lower() not in [
-                cat.lower() for cat in holiday.get("categories", [])
-            ]:
+    for holiday in holidays:
+        if format == "simple":
+            if holiday.start_iso in seen_dates:
                 continue
-            # Format output
-            if format == "simple":
-                # Avoid adding the same date multiple times
-                if holiday["start"] in seen_dates:
-                    continue
-                seen_dates.add(holiday["start"])
-                result.append(holiday["start"])
-            else:
-                result.append(
-                    {
-                        "date": holiday["start"],
-                        "name": holiday["summary"],
-                        "type": holiday["categories"],
-                        "start": holiday["start"],
-                        "end": holiday["end"],
-                        "id": holiday["uid"],
-                    }
-                )
-        except (ValueError, KeyError):
-            continue  # Skip holidays with invalid data
-    response.status_code = status.HTTP_200_OK
-    return {"holidays": result}
+            seen_dates.add(holiday.start_iso)
+            result.append(holiday.start_iso)
+        else:
+            result.append(holiday_entry(holiday))
+    return {"from": start, "to": end, "holidays": result}
+
+
+@app.post("/api/v1/check_holidays")
+async def check_holidays(
+    request: BatchCheckRequest,
+    response: Response,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return holiday status for many dates and/or inclusive date ranges"""
+    days, error = expand_batch(request.dates, request.ranges)
+    if error:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return error
+    return await check_holidays_batch(days)
+
+
+def get_business_calendar(categories: Optional[str]):
+    """Return the working day calendar for a comma-separated category filter"""
+    return CALENDAR.business_calendar(categories.split(",") if categories else None)
+
+
+@app.get("/api/v1/business_days/next")
+async def next_working_day(
+    day: Annotated[date, Query(alias="date")],
+    response: Response,
+    categories: Annotated[Optional[str], Query()] = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return the first working day after a given date, optionally counting only
+    holidays of the given comma-separated categories (ex: Public,Bank)"""
+    try:
+        result = get_business_calendar(categories).next_working_day(day)
+    except CoverageError as exc:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"error": str(exc)}
+    return {"date": day, "next_working_day": result}
+
+
+@app.get("/api/v1/business_days/previous")
+async def previous_working_day(
+    day: Annotated[date, Query(alias="date")],
+    response: Response,
+    categories: Annotated[Optional[str], Query()] = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return the last working day before a given date"""
+    try:
+        result = get_business_calendar(categories).previous_working_day(day)
+    except CoverageError as exc:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"error": str(exc)}
+    return {"date": day, "previous_working_day": result}
+
+
+@app.get("/api/v1/business_days/add")
+async def add_business_days(
+    day: Annotated[date, Query(alias="date")],
+    days: Annotated[int, Query()],
+    response: Response,
+    categories: Annotated[Optional[str], Query()] = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return the working day reached after adding (or subtracting) a number of
+    working days to a given date. The given date itself is not counted."""
+    try:
+        result = get_business_calendar(categories).add_business_days(day, days)
+    except CoverageError as exc:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"error": str(exc)}
+    return {"date": day, "days": days, "result": result}
+
+
+@app.get("/api/v1/business_days/between")
+async def business_days_between(
+    start: Annotated[date, Query()],
+    end: Annotated[date, Query()],
+    response: Response,
+    categories: Annotated[Optional[str], Query()] = None,
+    api_key: str = Depends(verify_api_key),
+):
+    """Return the number of working days from start (inclusive) to end (exclusive)"""
+    try:
+        count = get_business_calendar(categories).business_days_between(start, end)
+    except CoverageError as exc:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"error": str(exc)}
+    return {"start": start, "end": end, "business_days": count}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: Annotated[Optional[str], Header()] = None):
+    """Return request, cache, auth and usage metrics in Prometheus text format"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if METRICS_TOKEN and not compare_digest(
+        (authorization or "").encode(), f"Bearer {METRICS_TOKEN}".encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Response(content=METRICS.render(), media_type="text/plain; version=0.0.4")
 
 
 @app.get("/privacy-policy", include_in_schema=False)
@@ -514,5 +1574,9 @@ async def root():
 
 # Mount static files on dev server
 if os.getenv("ENV") == "DEV":
+    from fastapi.staticfiles import StaticFiles
+
     logger.info("Mounting static files for DEV environment")
     app.mount("/", StaticFiles(directory="public", html=True), name="public")
+
+STARTUP.mark("app_setup")
@@ -0,0 +1,115 @@
+"""
+Micro-benchmarks for the API hot paths.
+
+Run with:
+    pytest benchmarks/bench_hot_paths.py --benchmark-json=bench.json
+
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from datetime import date
+
+import pytest
+from fakes import BENCH_API_KEY, FALLBACK_API_KEY
+from srilanka_holidays import HolidayStore, SharedDataset
+from srilanka_holidays.serialization import SERIALIZERS
+
+
+def test_get_holiday_info_holiday(benchmark, app_module, event_loop_runner):
+    """Lookup of a known holiday (2025-02-04)"""
+    benchmark(lambda: event_loop_runner(app_module.get_holiday_info(2025, 2, 4)))
+
+
+def test_get_holiday_info_regular_day(benchmark, app_module, event_loop_runner):
+    """Lookup of a day that is not a holiday"""
+    benchmark(lambda: event_loop_runner(app_module.get_holiday_info(2025, 2, 5)))
+
+
+def test_calendar_is_holiday(benchmark, app_module):
+    """In-process engine lookup, without the HTTP layer"""
+    day = date(2025, 2, 4)
+    benchmark(lambda: app_module.CALENDAR.is_holiday(day))
+
+
+def test_holidays_list_build(benchmark, app_module):
+    """Filtering and serializing a full year without the response cache"""
+    benchmark(
+        lambda: app_module.serialize_json(
+            {"holidays": app_module.build_holidays_list(2025, None, None, "full")}
+        )
+    )
+
+
+def test_holidays_list_build_month_type(benchmark, app_module):
+    """Filtering a month by type without the response cache"""
+    benchmark(lambda: app_module.build_holidays_list(2025, 4, "mercantile", "simple"))
+
+
+def test_holidays_list_cached(benchmark, app_module):
+    """Response cache hit for a full year"""
+    key = (2025, None, None, "full")
+    version = app_module.CALENDAR.store.version(2025)
+    app_module.RESPONSE_CACHE.put(key, version, b"{}")
+    benchmark(lambda: app_module.RESPONSE_CACHE.get(key, version))
+
+
+def test_verify_api_key_index(benchmark, app_module, event_loop_runner):
+    """Key validated from the in-process key index"""
+    benchmark(lambda: event_loop_runner(app_module.verify_api_key(BENCH_API_KEY)))
+
+
+def test_verify_api_key_fallback(benchmark, app_module, event_loop_runner):
+    """Key validated from the fallback environment variable"""
+    benchmark(lambda: event_loop_runner(app_module.verify_api_key(FALLBACK_API_KEY)))
+
+
+def test_rate_limit_acquire(benchmark, app_module):
+    """Token bucket admission of one request"""
+    limit = app_module.RATE_LIMITER.default
+    benchmark(lambda: app_module.RATE_LIMITER.acquire("bench", limit))
+
+
+@pytest.mark.parametrize("name", sorted(SERIALIZERS))
+def test_serialize_holidays_list(benchmark, app_module, name):
+    """Encoding a full year listing with each installed JSON library"""
+    serializer = SERIALIZERS[name]()
+    content = {"holidays": app_module.build_holidays_list(2025, None, None, "full")}
+    benchmark(lambda: serializer.dumps(content))
+
+
+@pytest.mark.parametrize("name", sorted(SERIALIZERS))
+def test_deserialize_redis_payload(benchmark, name):
+    """Decoding a year's Redis cache payload with each installed JSON library"""
+    serializer = SERIALIZERS[name]()
+    with open("json/2025.json", "rb") as file:
+        payload = serializer.dumps(serializer.loads(file.read()))
+    benchmark(lambda: serializer.loads(payload))
+
+
+@pytest.fixture(scope="module")
+def shared_data(tmp_path_factory, app_module):
+    """Shared data directory holding one published generation"""
+    shared = SharedDataset(tmp_path_factory.mktemp("shared"))
+    shared.update(app_module.DATA_FILES, app_module.build_store)
+    return shared
+
+
+def test_data_load_private(benchmark, app_module):
+    """A worker parsing and indexing every year itself"""
+    benchmark(lambda: HolidayStore.load(app_module.DATA_DIR, app_module.DATA_FILES))
+
+
+def test_data_load_shared(benchmark, shared_data):
+    """A worker attaching to the published shared generation"""
+    benchmark(lambda: SharedDataset(shared_data.directory).attach())
+
+
+def test_shared_store_lookup(benchmark, shared_data):
+    """Date lookup in a shared generation (2025-02-04)"""
+    store = SharedDataset(shared_data.directory).attach()
+    day = date(2025, 2, 4)
+    benchmark(lambda: store.holidays_on(day))
@@ -0,0 +1,50 @@
+"""
+Shared fixtures for the micro-benchmarks.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fakes import FALLBACK_API_KEY, install_fake_redis, key_hash  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner():
+    """Run coroutines to completion on one loop shared by all benchmarks"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def app_module(event_loop_runner):
+    """The API module with its lifespan started against a FakeRedis"""
+    # The API reads data files relative to the working directory
+    os.chdir(REPO_ROOT)
+    os.environ["API_KEYS"] = key_hash(FALLBACK_API_KEY)
+    # Keep the rate limiter on the request path without ever rejecting
+    os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "1e9")
+    # Per-request log lines would be part of the timings
+    os.environ.setdefault("ACCESS_LOG", "false")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    import app  # pylint: disable=import-outside-toplevel
+
+    app.FALLBACK_API_KEY_HASHES = [key_hash(FALLBACK_API_KEY)]
+    install_fake_redis(app)
+    lifespan = app.app.router.lifespan_context(app.app)
+    event_loop_runner(lifespan.__aenter__())
+    yield app
+    event_loop_runner(lifespan.__aexit__(None, None, None))
@@ -0,0 +1,143 @@
+"""
+In-process stand-in for the Redis client used by the API, so benchmarks run
+offline with deterministic timings.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+import hashlib
+
+# API keys accepted by the fake key store and by the fallback env variable
+BENCH_API_KEY = "bench-key"
+FALLBACK_API_KEY = "bench-fallback-key"
+
+
+def key_hash(key):
+    """Return the SHA-256 hash the API stores for a key"""
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class FakePipeline:
+    """Records pipelined commands and applies them on execute"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __await__(self):
+        # Awaitable like redis.asyncio's Pipeline
+        return self._self().__await__()
+
+    async def _self(self):
+        return self
+
+    def incrby(self, key, amount=1):
+        self._commands.append(("incrby", key, amount))
+        return self
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def expire(self, key, seconds):
+        self._commands.append(("expire", key, seconds))
+        return self
+
+    def set(self, key, value, **kwargs):
+        self._commands.append(("set", key, value))
+        return self
+
+    def get(self, key):
+        self._commands.append(("get", key, None))
+        return self
+
+    def delete(self, *keys):
+        for key in keys:
+            self._commands.append(("delete", key, None))
+        return self
+
+    async def execute(self):
+        results = []
+        for command, key, value in self._commands:
+            if command == "incrby":
+                self._redis.data[key] = int(self._redis.data.get(key, 0)) + value
+                results.append(self._redis.data[key])
+            elif command == "set":
+                self._redis.data[key] = value
+                results.append(True)
+            elif command == "get":
+                results.append(self._redis.data.get(key))
+            elif command == "delete":
+                results.append(int(self._redis.data.pop(key, None) is not None))
+            else:
+                results.append(True)
+        self._commands = []
+        return results
+
+
+class FakeJSON:
+    """Subset of the RedisJSON commands used by the API"""
+
+    def __init__(self, redis):
+        self._redis = redis
+
+    async def get(self, key, *paths):
+        return self._redis.json_data.get(key)
+
+
+class FakeRedis:
+    """Minimal async Redis client backed by dicts"""
+
+    def __init__(self, api_keys=(BENCH_API_KEY,)):
+        self.data = {}
+        self.json_data = {
+            "API_KEYS_V2": [{"hash": key_hash(key), "active": True} for key in api_keys]
+        }
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, **kwargs):
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, seconds, value):
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def close(self):
+        return None
+
+    async def aclose(self):
+        return None
+
+    def json(self):
+        return FakeJSON(self)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def install_fake_redis(app_module, redis=None):
+    """
+    Make the API connect to a FakeRedis instead of a real server.
+
+    Args:
+        app_module: The imported `app` module.
+        redis (FakeRedis): Instance to hand out (a new one by default).
+
+    Returns:
+        FakeRedis: The instance the API will use.
+    """
+    redis = redis or FakeRedis()
+    # Wrapped like the real client, so breaker bookkeeping is measured too
+    app_module.create_redis_client = lambda: app_module.BreakerClient(
+        redis, app_module.REDIS_BREAKER, (app_module.RedisError,)
+    )
+    return redis
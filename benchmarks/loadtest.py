@@ -0,0 +1,194 @@
+"""
+In-process load test for the API.
+
+Drives the ASGI app through httpx without a network or a Redis server and
+reports latency percentiles and throughput per endpoint as JSON.
+
+Usage:
+    python benchmarks/loadtest.py [--requests N] [--concurrency C]
+                                  [--output results.json] [--compare old.json]
+
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fakes import (  # noqa: E402
+    BENCH_API_KEY,
+    FALLBACK_API_KEY,
+    install_fake_redis,
+    key_hash,
+)
+
+# Endpoint name -> request path
+SCENARIOS = {
+    "check_holiday": "/api/v1/check_holiday?year=2025&month=2&day=4",
+    "holiday_info": "/api/v1/holiday_info?year=2025&month=4&day=14",
+    "holidays_year": "/api/v1/holidays?year=2025",
+    "holidays_month_type": "/api/v1/holidays?year=2025&month=4&type=mercantile",
+    "holidays_range": "/api/v1/holidays/range?from=2024-12-01&to=2025-02-28",
+    "business_days_between": (
+        "/api/v1/business_days/between?start=2021-01-01&end=2026-12-31"
+    ),
+    "status": "/api/v1/status",
+}
+
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def git_commit():
+    """Return the current commit hash, if available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_scenario(client, path, requests, concurrency, headers):
+    """Send `requests` GETs to path with `concurrency` workers"""
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else None,
+    }
+
+
+async def run(args):
+    """Start the app in-process and run every selected scenario"""
+    os.chdir(REPO_ROOT)
+    os.environ["API_KEYS"] = key_hash(FALLBACK_API_KEY)
+    # Keep the rate limiter on the request path without ever rejecting
+    os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "1e9")
+    # Per-request log lines would be part of the timings
+    os.environ.setdefault("ACCESS_LOG", "false")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    import app  # pylint: disable=import-outside-toplevel
+
+    install_fake_redis(app)
+    headers = {"X-API-Key": BENCH_API_KEY}
+    results = {}
+    async with app.app.router.lifespan_context(app.app):
+        transport = httpx.ASGITransport(app=app.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for name in args.scenarios or SCENARIOS:
+                path = SCENARIOS[name]
+                # Warm up caches so runs measure steady state
+                await run_scenario(client, path, args.warmup, 1, headers)
+                results[name] = await run_scenario(
+                    client, path, args.requests, args.concurrency, headers
+                )
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "results": results,
+    }
+
+
+def compare(current, baseline_path):
+    """Print the change in p50/p99 and throughput against an earlier run"""
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    print(f"Compared with {baseline.get('commit') or baseline_path}:", file=sys.stderr)
+    for name, result in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        changes = []
+        for metric in ("p50_ms", "p99_ms", "rps"):
+            if old.get(metric):
+                delta = (result[metric] - old[metric]) / old[metric] * 100
+                changes.append(f"{metric} {delta:+.1f}%")
+        print(f"  {name}: " + ", ".join(changes), file=sys.stderr)
+
+
+def main():
+    """Parse arguments, run the load test and write the results"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable, default: all)",
+    )
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Earlier results file to compare with")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
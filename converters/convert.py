@@ -0,0 +1,238 @@
+"""
+This module converts many iCalendar files to every output format at once.
+
+Each file is streamed once and every event is written to all formats as it
+is parsed, so memory use stays flat however large the file is.
+Files are converted in parallel across a process pool, and files whose
+content hasn't changed since the last run (per the manifest) are skipped.
+
+Usage:
+    python converters/convert.py [ics files or directories ...]
+        [--formats csv,json,xml] [--output-dir DIR] [--workers N]
+        [--manifest FILE] [--no-artifact] [--force]
+
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+from ics_events import iter_ics_events
+from icalendar_to_csv import CSV_DIR_NAME, CsvWriter
+from icalendar_to_json import JSON_DIR_NAME, JsonWriter
+from icalendar_to_xml import XML_DIR_NAME, XmlWriter
+from json_to_bin import BIN_DIR_NAME, BIN_FILE_NAME, json_to_bin
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+MANIFEST_FILE_NAME = ".convert-manifest.json"
+
+# Format name -> (output directory name, file extension, streaming writer)
+FORMATS = {
+    "csv": (CSV_DIR_NAME, ".csv", CsvWriter),
+    "json": (JSON_DIR_NAME, ".json", JsonWriter),
+    "xml": (XML_DIR_NAME, ".xml", XmlWriter),
+}
+
+
+def find_sources(paths):
+    """Return the .ics files given directly or found in the given directories"""
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            sources.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(".ics")
+            )
+        else:
+            sources.append(path)
+    return sources
+
+
+def output_paths(source, output_dir, formats):
+    """Return the output file of each format for an iCalendar file"""
+    file_name = os.path.splitext(os.path.basename(source))[0]
+    return {
+        fmt: os.path.join(output_dir, FORMATS[fmt][0], file_name + FORMATS[fmt][1])
+        for fmt in formats
+    }
+
+
+def file_hash(file_path):
+    """Return the sha256 hex digest of a file's contents"""
+    with open(file_path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def convert_file(source, outputs):
+    """
+    Stream one iCalendar file into every requested format in a single pass.
+
+    Args:
+        source (str): The path to the iCalendar file.
+        outputs (dict): Format name -> output file path.
+
+    Returns:
+        str: The source path.
+    """
+    with ExitStack() as stack:
+        writers = []
+        for fmt, output_path in outputs.items():
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            writers.append(stack.enter_context(FORMATS[fmt][2](output_path)))
+        for event in iter_ics_events(source):
+            for writer in writers:
+                writer.write(event)
+    return source
+
+
+def load_manifest(manifest_path):
+    """Return the manifest of a previous run (empty if there is none)"""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest, manifest_path):
+    """Write the manifest, sorted for stable diffs"""
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def is_current(entry, digest, outputs):
+    """Return whether a source was already converted to these outputs"""
+    return (
+        entry is not None
+        and entry.get("sha256") == digest
+        and set(outputs) <= set(entry.get("formats", []))
+        and all(os.path.isfile(path) for path in outputs.values())
+    )
+
+
+def convert(
+    sources,
+    output_dir=REPO_DIR,
+    formats=tuple(FORMATS),
+    workers=None,
+    manifest_path=None,
+    artifact=True,
+    force=False,
+):
+    """
+    Convert iCalendar files, skipping the ones that haven't changed.
+
+    Args:
+        sources (list[str]): iCalendar files to convert.
+        output_dir (str): Directory holding one sub-directory per format.
+        formats (tuple[str]): Formats to write.
+        workers (int): Worker processes (default: number of CPUs).
+        manifest_path (str): Where the content hashes of converted files are
+            kept (default: `.convert-manifest.json` in the output directory).
+        artifact (bool): Recompile `bin/holidays.bin` when JSON files changed.
+        force (bool): Convert every file, even unchanged ones.
+
+    Returns:
+        list[str]: The converted sources.
+    """
+    manifest_path = manifest_path or os.path.join(output_dir, MANIFEST_FILE_NAME)
+    manifest = load_manifest(manifest_path)
+
+    jobs = {}
+    digests = {}
+    for source in sources:
+        key = os.path.basename(source)
+        digests[key] = file_hash(source)
+        outputs = output_paths(source, output_dir, formats)
+        if not force and is_current(manifest.get(key), digests[key], outputs):
+            print(f"Unchanged, skipping: {source}")
+            continue
+        jobs[source] = outputs
+
+    converted = []
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for source in pool.map(convert_file, jobs, jobs.values()):
+                key = os.path.basename(source)
+                manifest[key] = {"sha256": digests[key], "formats": sorted(formats)}
+                converted.append(source)
+                print(f"Converted: {source}")
+        save_manifest(manifest, manifest_path)
+
+    bin_file_path = os.path.join(output_dir, BIN_DIR_NAME, BIN_FILE_NAME)
+    if (
+        artifact
+        and "json" in formats
+        and (converted or not os.path.isfile(bin_file_path))
+    ):
+        json_to_bin(os.path.join(output_dir, JSON_DIR_NAME), bin_file_path)
+        print(f"Compiled: {bin_file_path}")
+    return converted
+
+
+def main():
+    """Parse arguments and run the conversion"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        default=[os.path.join(REPO_DIR, "ics")],
+        help="iCalendar files or directories (default: ics/)",
+    )
+    parser.add_argument(
+        "--formats",
+        default=",".join(FORMATS),
+        help=f"Comma-separated formats to write (default: {','.join(FORMATS)})",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=REPO_DIR,
+        help="Directory holding one sub-directory per format (default: repository root)",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes")
+    parser.add_argument("--manifest", help="Manifest file of converted sources")
+    parser.add_argument(
+        "--no-artifact",
+        dest="artifact",
+        action="store_false",
+        help="Don't recompile bin/holidays.bin",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Convert unchanged files as well"
+    )
+    args = parser.parse_args()
+
+    formats = tuple(fmt.strip() for fmt in args.formats.split(",") if fmt.strip())
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        parser.error(f"Unknown formats: {', '.join(unknown)}")
+
+    sources = find_sources(args.sources)
+    missing = [source for source in sources if not os.path.isfile(source)]
+    if missing:
+        parser.error(f"No such file: {', '.join(missing)}")
+
+    convert(
+        sources,
+        output_dir=os.path.abspath(args.output_dir),
+        formats=formats,
+        workers=args.workers,
+        manifest_path=args.manifest,
+        artifact=args.artifact,
+        force=args.force,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
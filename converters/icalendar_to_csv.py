@@ -11,9 +11,58 @@ URL: https://github.com/Dilshan-H/srilanka-holidays
 import csv
 import os
 import sys
-from icalendar import Calendar
+
+from ics_events import iter_ics_events
 
 CSV_DIR_NAME = "csv"
+CSV_FIELDNAMES = ["UID", "Summary", "Categories", "Start", "End"]
+
+
+class CsvWriter:
+    """Writes holiday events to a CSV file as they arrive"""
+
+    def __init__(self, csv_file_path):
+        self._file = open(csv_file_path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDNAMES)
+        self._writer.writeheader()
+
+    def write(self, event):
+        """Append one event"""
+        self._writer.writerow(
+            {
+                "UID": event.uid,
+                "Summary": event.summary,
+                "Categories": event.description,
+                "Start": event.start,
+                "End": event.end,
+            }
+        )
+
+    def close(self):
+        """Flush and close the file"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_csv(events, csv_file_path):
+    """
+    Write holiday events to a CSV file.
+
+    Args:
+        events (Iterable[IcsEvent]): Events to write, consumed one at a time.
+        csv_file_path (str): The path of the CSV file.
+
+    Returns:
+        None
+    """
+    with CsvWriter(csv_file_path) as writer:
+        for event in events:
+            writer.write(event)
 
 
 def ics_to_csv(file_path):
@@ -26,8 +75,7 @@ def ics_to_csv(file_path):
     Returns:
         None
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        cal = Calendar.from_ical(file.read())
+    events = iter_ics_events(file_path)
 
     csv_dir = os.path.abspath(
         os.path.join(os.curdir, os.pardir, "srilanka-holidays", CSV_DIR_NAME)
@@ -40,28 +88,7 @@ def ics_to_csv(file_path):
     # Create the CSV file path
     csv_file_path = os.path.join(csv_dir, f"{file_name}.csv")
 
-    with open(csv_file_path, "w", newline="", encoding="utf-8") as file:
-        fieldnames = [
-            "UID",
-            "Summary",
-            "Categories",
-            "Start",
-            "End",
-        ]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for component in cal.walk():
-            if component.name == "VEVENT":
-                writer.writerow(
-                    {
-                        "UID": component.get("uid"),
-                        "Summary": component.get("summary"),
-                        "Categories": component.get("description"),
-                        "Start": component.decoded("dtstart"),
-                        "End": component.decoded("dtend"),
-                    }
-                )
+    write_csv(events, csv_file_path)
 
 
 if __name__ == "__main__":
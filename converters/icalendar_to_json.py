@@ -11,11 +11,109 @@ URL: https://github.com/Dilshan-H/srilanka-holidays
 import os
 import sys
 import json
-from icalendar import Calendar
+
+from ics_events import iter_ics_events
+
+# Allow running as a script from the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from srilanka_holidays import Holiday  # noqa: E402
 
 JSON_DIR_NAME = "json"
 
 
+def event_to_holiday(event):
+    """
+    Turn an iCalendar event into a holiday record.
+
+    Args:
+        event (IcsEvent): Event to convert.
+
+    Returns:
+        Holiday: The holiday, with dates already parsed.
+    """
+    return Holiday(
+        uid=str(event.uid),
+        summary=str(event.summary),
+        categories=str(event.description).split(","),
+        start=event.start,
+        end=event.end,
+    )
+
+
+def events_to_holidays(events):
+    """
+    Turn iCalendar events into holiday records.
+
+    Args:
+        events (Iterable[IcsEvent]): Events to convert.
+
+    Returns:
+        list[Holiday]: Holidays in calendar order, with dates already parsed.
+    """
+    return [event_to_holiday(event) for event in events]
+
+
+def ics_to_holidays(file_path):
+    """
+    Parse the prepared iCalendar file into holiday records.
+
+    Args:
+        file_path (str): The path to the iCalendar file.
+
+    Returns:
+        list[Holiday]: Holidays in calendar order, with dates already parsed.
+    """
+    return events_to_holidays(iter_ics_events(file_path))
+
+
+class JsonWriter:
+    """
+    Writes holiday events to a JSON file as they arrive.
+
+    The output is byte for byte what `json.dump(..., indent=2)` writes for
+    the whole list.
+    """
+
+    def __init__(self, json_file_path):
+        self._file = open(json_file_path, "w", encoding="utf-8")
+        self._empty = True
+
+    def write(self, event):
+        """Append one event"""
+        item = json.dumps(event_to_holiday(event).to_dict(), indent=2)
+        self._file.write("[\n  " if self._empty else ",\n  ")
+        self._file.write(item.replace("\n", "\n  "))
+        self._empty = False
+
+    def close(self):
+        """Close the array and the file"""
+        self._file.write("[]" if self._empty else "\n]")
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_json(events, json_file_path):
+    """
+    Write holiday events to a JSON file.
+
+    Args:
+        events (Iterable[IcsEvent]): Events to write, consumed one at a time.
+        json_file_path (str): The path of the JSON file.
+
+    Returns:
+        None
+    """
+    with JsonWriter(json_file_path) as writer:
+        for event in events:
+            writer.write(event)
+
+
 def ics_to_json(file_path):
     """
     Convert the prepared iCalendar file to JSON format.
@@ -26,8 +124,7 @@ def ics_to_json(file_path):
     Returns:
         None
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        cal = Calendar.from_ical(file.read())
+    events = iter_ics_events(file_path)
 
     json_dir = os.path.abspath(
         os.path.join(os.curdir, os.pardir, "srilanka-holidays", JSON_DIR_NAME)
@@ -40,20 +137,7 @@ def ics_to_json(file_path):
     # Create the JSON file path
     json_file_path = os.path.join(json_dir, f"{file_name}.json")
 
-    events = []
-    for component in cal.walk():
-        if component.name == "VEVENT":
-            event = {
-                "uid": component.get("uid"),
-                "summary": component.get("summary"),
-                "categories": component.get("description").split(","),
-                "start": component.decoded("dtstart").isoformat(),
-                "end": component.decoded("dtend").isoformat(),
-            }
-            events.append(event)
-
-    with open(json_file_path, "w", encoding="utf-8") as json_file:
-        json.dump(events, json_file, indent=2)
+    write_json(events, json_file_path)
 
 
 if __name__ == "__main__":
@@ -10,40 +10,78 @@ URL: https://github.com/Dilshan-H/srilanka-holidays
 
 import os
 import sys
-import xml.etree.ElementTree as ET
-from icalendar import Calendar
+from xml.sax.saxutils import escape
+
+from ics_events import iter_ics_events
 
 XML_DIR_NAME = "xml"
 
 
-def ics_to_xml(file_path):
+class XmlWriter:
+    """
+    Writes holiday events to an XML file as they arrive.
+
+    The output is byte for byte what ElementTree writes for the whole tree.
     """
-    Convert the prepared iCalendar file to XML format.
+
+    def __init__(self, xml_file_path):
+        self._file = open(xml_file_path, "w", encoding="utf-8")
+        self._file.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        self._empty = True
+
+    def write(self, event):
+        """Append one event"""
+        if self._empty:
+            self._file.write("<CalendarEvents>")
+            self._empty = False
+        self._file.write(
+            "<Event>"
+            f"<Summary>{escape(str(event.summary))}</Summary>"
+            f"<Categories>{escape(str(event.description))}</Categories>"
+            f"<Start>{escape(str(event.start))}</Start>"
+            f"<End>{escape(str(event.end))}</End>"
+            "</Event>"
+        )
+
+    def close(self):
+        """Close the root element and the file"""
+        self._file.write("<CalendarEvents />" if self._empty else "</CalendarEvents>")
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_xml(events, xml_file_path):
+    """
+    Write holiday events to an XML file.
 
     Args:
-        file_path (str): The path to the iCalendar file.
+        events (Iterable[IcsEvent]): Events to write, consumed one at a time.
+        xml_file_path (str): The path of the XML file.
 
     Returns:
         None
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        cal = Calendar.from_ical(file.read())
+    with XmlWriter(xml_file_path) as writer:
+        for event in events:
+            writer.write(event)
 
-    root = ET.Element("CalendarEvents")
 
-    for component in cal.walk():
-        if component.name == "VEVENT":
-            event = ET.SubElement(root, "Event")
-            summary = ET.SubElement(event, "Summary")
-            summary.text = str(component.get("summary"))
-            description = ET.SubElement(event, "Categories")
-            description.text = str(component.get("description"))
-            start = ET.SubElement(event, "Start")
-            start.text = str(component.decoded("dtstart"))
-            end = ET.SubElement(event, "End")
-            end.text = str(component.decoded("dtend"))
+def ics_to_xml(file_path):
+    """
+    Convert the prepared iCalendar file to XML format.
+
+    Args:
+        file_path (str): The path to the iCalendar file.
 
-    tree = ET.ElementTree(root)
+    Returns:
+        None
+    """
+    events = iter_ics_events(file_path)
 
     xml_dir = os.path.abspath(
         os.path.join(os.curdir, os.pardir, "srilanka-holidays", XML_DIR_NAME)
@@ -56,7 +94,7 @@ def ics_to_xml(file_path):
     # Create the XML file path
     xml_file_path = os.path.join(xml_dir, f"{file_name}.xml")
 
-    tree.write(xml_file_path, encoding="utf-8", xml_declaration=True)
+    write_xml(events, xml_file_path)
 
 
 if __name__ == "__main__":
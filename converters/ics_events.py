@@ -0,0 +1,103 @@
+"""
+This module reads the holiday events of an iCalendar file one at a time, so
+every output format can be written from the same events while only one of
+them is held in memory.
+
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from datetime import date
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+from icalendar import Event
+
+
+class IcsEvent(NamedTuple):
+    """Raw fields of one VEVENT, as the converters write them"""
+
+    uid: Optional[str]
+    summary: Optional[str]
+    # Comma-separated holiday categories
+    description: Optional[str]
+    start: date
+    end: date
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded content lines (RFC 5545, section 3.1)"""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if current is not None and line[:1] in (" ", "\t"):
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _event_blocks(lines: Iterable[str]) -> Iterator[List[str]]:
+    """Yield the content lines of each VEVENT, nested components included"""
+    block: Optional[List[str]] = None
+    depth = 0
+    for line in _unfold(lines):
+        name = line.upper()
+        if block is None:
+            if name == "BEGIN:VEVENT":
+                block, depth = [line], 1
+            continue
+        block.append(line)
+        if name.startswith("BEGIN:"):
+            depth += 1
+        elif name.startswith("END:"):
+            depth -= 1
+            if depth == 0:
+                yield block
+                block = None
+
+
+def iter_ics_events(file_path) -> Iterator[IcsEvent]:
+    """
+    Parse an iCalendar file lazily, one event at a time.
+
+    The file is read line by line and each VEVENT is decoded by icalendar as
+    soon as it ends, so memory use doesn't grow with the size of the file.
+
+    Args:
+        file_path (str): The path to the iCalendar file.
+
+    Yields:
+        IcsEvent: Events in calendar order.
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        for block in _event_blocks(file):
+            component = Event.from_ical("\r\n".join(block))
+            yield IcsEvent(
+                uid=_text(component.get("uid")),
+                summary=_text(component.get("summary")),
+                description=_text(component.get("description")),
+                start=component.decoded("dtstart"),
+                end=component.decoded("dtend"),
+            )
+
+
+def read_ics_events(file_path) -> List[IcsEvent]:
+    """
+    Parse an iCalendar file into its events.
+
+    Args:
+        file_path (str): The path to the iCalendar file.
+
+    Returns:
+        list[IcsEvent]: Events in calendar order.
+    """
+    return list(iter_ics_events(file_path))
@@ -0,0 +1,59 @@
+"""
+This module compiles every yearly JSON file into one binary data artifact.
+
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import os
+import sys
+
+# Allow running as a script from the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from srilanka_holidays.artifact import (  # noqa: E402
+    file_sha256,
+    file_stamp,
+    write_artifact,
+)
+from srilanka_holidays.store import HolidayStore, data_file_paths  # noqa: E402
+
+JSON_DIR_NAME = "json"
+BIN_DIR_NAME = "bin"
+BIN_FILE_NAME = "holidays.bin"
+
+
+def json_to_bin(json_dir=None, bin_file_path=None):
+    """
+    Compile the yearly JSON files into `bin/holidays.bin`.
+
+    Args:
+        json_dir (str): Directory holding the yearly JSON files.
+        bin_file_path (str): Path of the artifact to write.
+
+    Returns:
+        str: The path of the written artifact.
+    """
+    repo_dir = os.path.abspath(os.path.join(os.curdir, os.pardir, "srilanka-holidays"))
+    json_dir = json_dir or os.path.join(repo_dir, JSON_DIR_NAME)
+    bin_file_path = bin_file_path or os.path.join(repo_dir, BIN_DIR_NAME, BIN_FILE_NAME)
+    paths = data_file_paths(json_dir)
+    # Stamp and hash before loading, so a file changing meanwhile looks stale
+    source_stamps = {year: file_stamp(path) for year, path in paths.items()}
+    source_hashes = {year: file_sha256(path) for year, path in paths.items()}
+    store = HolidayStore.load(json_dir, paths)
+
+    write_artifact(
+        {year: store.year_holidays(year) for year in store.years},
+        bin_file_path,
+        source_hashes,
+        source_stamps,
+    )
+    return bin_file_path
+
+
+if __name__ == "__main__":
+    print(json_to_bin(sys.argv[1] if len(sys.argv) > 1 else None))
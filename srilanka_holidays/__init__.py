@@ -0,0 +1,111 @@
+"""
+Sri Lanka Holidays
+
+Core holiday data handling shared by the API and the converters, and an
+embeddable lookup engine (HolidayCalendar) over the bundled data. Names are
+imported from their submodules on first use, so importing the package only
+loads what a program needs.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api_keys import ApiKeyIndex, TTLCache
+    from .artifact import ArtifactError, HolidayArtifact, build_artifact, write_artifact
+    from .business_days import BusinessCalendar, CoverageError
+    from .circuit_breaker import BreakerClient, CircuitBreaker
+    from .engine import HolidayCalendar, load_store
+    from .exports import EXPORT_FORMATS, iter_export, negotiate_format
+    from .health import HealthMonitor
+    from .http_cache import format_http_date, is_not_modified, make_etag
+    from .logs import (
+        AccessLogMiddleware,
+        SampledLogger,
+        configure_logging,
+        set_request_fields,
+    )
+    from .metrics import MetricsMiddleware, MetricsRegistry, StartupProfiler
+    from .rate_limit import RateLimit, RateLimiter
+    from .reload import DataWatcher, store_version
+    from .response_cache import ResponseCache
+    from .serialization import (
+        deserialize_json,
+        json_backend,
+        serialize_json,
+        use_serializer,
+    )
+    from .shared_data import ArtifactStore, SharedDataset
+    from .store import (
+        Holiday,
+        HolidayStore,
+        data_file_paths,
+        dataset_version,
+        parse_holidays,
+        read_data_file,
+    )
+    from .usage import UsageRecorder
+
+# Submodule -> names it provides
+_SUBMODULES = {
+    "api_keys": ("ApiKeyIndex", "TTLCache"),
+    "artifact": (
+        "ArtifactError",
+        "HolidayArtifact",
+        "build_artifact",
+        "write_artifact",
+    ),
+    "business_days": ("BusinessCalendar", "CoverageError"),
+    "circuit_breaker": ("BreakerClient", "CircuitBreaker"),
+    "engine": ("HolidayCalendar", "load_store"),
+    "exports": ("EXPORT_FORMATS", "iter_export", "negotiate_format"),
+    "health": ("HealthMonitor",),
+    "http_cache": ("format_http_date", "is_not_modified", "make_etag"),
+    "logs": (
+        "AccessLogMiddleware",
+        "SampledLogger",
+        "configure_logging",
+        "set_request_fields",
+    ),
+    "metrics": ("MetricsMiddleware", "MetricsRegistry", "StartupProfiler"),
+    "rate_limit": ("RateLimit", "RateLimiter"),
+    "reload": ("DataWatcher", "store_version"),
+    "response_cache": ("ResponseCache",),
+    "serialization": (
+        "deserialize_json",
+        "json_backend",
+        "serialize_json",
+        "use_serializer",
+    ),
+    "shared_data": ("ArtifactStore", "SharedDataset"),
+    "store": (
+        "Holiday",
+        "HolidayStore",
+        "data_file_paths",
+        "dataset_version",
+        "parse_holidays",
+        "read_data_file",
+    ),
+    "usage": ("UsageRecorder",),
+}
+_EXPORTS = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first access"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the exported names along with the ones already imported"""
+    return sorted(set(globals()) | set(__all__))
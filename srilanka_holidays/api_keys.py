@@ -0,0 +1,128 @@
+"""
+API key index
+
+In-process copy of the API key records so requests can be authenticated
+without a Redis round trip.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+import time
+
+
+class TTLCache:
+    """Small LRU cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key if present and not expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries"""
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable):
+        """Remove key if present"""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry"""
+        self._entries.clear()
+
+
+class ApiKeyIndex:
+    """
+    API key records indexed by their SHA-256 hash.
+
+    The index is a full copy of the key store, replaced as a whole whenever
+    the key store's version changes, so a lookup is a single dict access.
+    Hashes that were checked and not found are remembered for a short time
+    (negative cache) so repeated invalid keys don't trigger reloads.
+
+    Lookups use the hash of the presented key rather than the key itself, so
+    dict lookup timing reveals nothing useful about valid keys.
+    """
+
+    def __init__(
+        self,
+        negative_ttl: float = 30.0,
+        negative_maxsize: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self._records: dict = {}
+        self._negative = TTLCache(negative_maxsize, negative_ttl, clock)
+        self.version: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been populated at least once"""
+        return self.loaded_at is not None
+
+    def age(self) -> float:
+        """Seconds since the last reload (infinite if never loaded)"""
+        if self.loaded_at is None:
+            return float("inf")
+        return self._clock() - self.loaded_at
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def replace(self, records: Iterable[dict], version: Optional[str] = None):
+        """
+        Swap in a new set of key records.
+
+        Args:
+            records (Iterable[dict]): Key records, each with a "hash" field.
+            version (Optional[str]): Version of the key store they came from.
+        """
+        self._records = {
+            record["hash"]: record
+            for record in records
+            if isinstance(record, dict) and isinstance(record.get("hash"), str)
+        }
+        self.version = version
+        self.loaded_at = self._clock()
+        # Newly issued keys may have been negatively cached
+        self._negative.clear()
+
+    def get(self, key_hash: str) -> Optional[dict]:
+        """Return the record for a key hash, or None if unknown"""
+        return self._records.get(key_hash)
+
+    def is_known_invalid(self, key_hash: str) -> bool:
+        """Return whether the hash was recently checked and not found"""
+        return self._negative.get(key_hash, False)
+
+    def mark_invalid(self, key_hash: str):
+        """Remember that a hash is not in the key store"""
+        self._negative.set(key_hash, True)
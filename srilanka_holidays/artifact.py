@@ -0,0 +1,449 @@
+"""
+Binary data artifact
+
+Compiles every year of holiday data into one compact file that can be
+memory-mapped and queried without parsing it first.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+from .reload import store_version
+from .store import Holiday, HolidayStore, dataset_version
+
+MAGIC = b"SLHD"
+FORMAT_VERSION = 3
+# Marks a missing uid or summary in the string table
+NO_STRING = 0xFFFFFFFF
+
+# Layout (little-endian), each section directly after the previous one:
+#   header
+#   categories   category_count x u32 string id
+#   category sets (set_count + 1) x u32 offsets into the set members
+#   set members  member_count x u32 category index, in the holidays' order
+#   years        year_count x YEAR_ENTRY, ascending
+#   year index   holiday_count x u32 record id, grouped by year
+#   starts       holiday_count x i32 start date ordinal, ascending
+#   records      holiday_count x RECORD, in the same order as starts
+#   offsets      (string_count + 1) x u32 byte offsets into the string data
+#   strings      UTF-8 string data, each distinct string stored once
+
+# magic, format version, category count, year count, holiday count, string
+# count, category set count, set member count, longest holiday in days,
+# content version (see `store_version`)
+HEADER = struct.Struct("<4sHHIIIIII32s")
+# year, first year index slot, holiday count, source file mtime (ns) and size
+# (0 when unknown), sha256 of the source file, content version (see
+# `dataset_version`)
+YEAR_ENTRY = struct.Struct("<HxxIIqQ32s32s")
+# end date ordinal (exclusive), category set id, uid string id, summary string id
+RECORD = struct.Struct("<iIII")
+
+
+class ArtifactError(ValueError):
+    """Raised when a data artifact can't be written or read"""
+
+
+def build_artifact(
+    years: Mapping[int, Tuple[Holiday, ...]],
+    source_hashes: Optional[Mapping[int, bytes]] = None,
+    source_stamps: Optional[Mapping[int, Tuple[int, int]]] = None,
+) -> bytes:
+    """
+    Encode holiday data as a binary artifact.
+
+    Args:
+        years (Mapping[int, Tuple[Holiday, ...]]): Holidays of each year.
+        source_hashes (Optional[Mapping[int, bytes]]): sha256 digest of each
+            year's source file, used to tell whether the artifact is current.
+        source_stamps (Optional[Mapping[int, Tuple[int, int]]]): Modification
+            time and size of each year's source file (see `file_stamp`), which
+            spare reading unchanged files when checking that.
+
+    Returns:
+        bytes: The artifact contents.
+
+    Raises:
+        ArtifactError: If the data can't be represented (ex: more than
+            65535 distinct categories).
+    """
+    source_hashes = source_hashes or {}
+    source_stamps = source_stamps or {}
+    entries = [
+        (holiday.start_ordinal, year, index, holiday)
+        for year in sorted(years)
+        for index, holiday in enumerate(
+            sorted(years[year], key=lambda h: h.start_ordinal)
+        )
+    ]
+    entries.sort(key=lambda entry: entry[:3])
+    holidays = [entry[3] for entry in entries]
+
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    # Each distinct category sequence is stored once, keeping its order
+    categories: Dict[str, int] = {}
+    category_sets: Dict[Tuple[str, ...], int] = {}
+    set_offsets = array("I", [0])
+    set_members = array("I")
+    records = bytearray()
+    for holiday in holidays:
+        set_id = category_sets.get(holiday.categories)
+        if set_id is None:
+            for category in holiday.categories:
+                set_members.append(categories.setdefault(category, len(categories)))
+            set_offsets.append(len(set_members))
+            set_id = category_sets[holiday.categories] = len(category_sets)
+        records += RECORD.pack(
+            holiday.end_ordinal, set_id, intern(holiday.uid), intern(holiday.summary)
+        )
+    if len(categories) > 0xFFFF:
+        raise ArtifactError("At most 65535 distinct categories are supported")
+    category_ids = [intern(category) for category in categories]
+
+    year_entries = bytearray()
+    year_index = array("I")
+    for year in sorted(years):
+        ids = [i for i, entry in enumerate(entries) if entry[1] == year]
+        year_entries += YEAR_ENTRY.pack(
+            year,
+            len(year_index),
+            len(ids),
+            *source_stamps.get(year, (0, 0)),
+            source_hashes.get(year, bytes(32)),
+            bytes.fromhex(dataset_version(holidays[i] for i in ids)),
+        )
+        year_index.extend(ids)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = array("I", [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    max_span = max((h.end_ordinal - h.start_ordinal for h in holidays), default=0)
+    version = store_version(HolidayStore(years))
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(categories),
+        len(years),
+        len(holidays),
+        len(strings),
+        len(category_sets),
+        len(set_members),
+        max_span,
+        bytes.fromhex(version),
+    )
+    body = [
+        header,
+        array("I", category_ids),
+        set_offsets,
+        set_members,
+        year_entries,
+        year_index,
+        array("i", (holiday.start_ordinal for holiday in holidays)),
+        records,
+        offsets,
+        b"".join(encoded),
+    ]
+    if sys.byteorder != "little":
+        for part in body:
+            if isinstance(part, array):
+                part.byteswap()
+    return b"".join(bytes(part) for part in body)
+
+
+def write_artifact(
+    years: Mapping[int, Tuple[Holiday, ...]],
+    file_path: Path,
+    source_hashes: Optional[Mapping[int, bytes]] = None,
+    source_stamps: Optional[Mapping[int, Tuple[int, int]]] = None,
+):
+    """Write a binary artifact, replacing the file atomically"""
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    temp_path.write_bytes(build_artifact(years, source_hashes, source_stamps))
+    temp_path.replace(file_path)
+
+
+def file_sha256(file_path: Path) -> bytes:
+    """Return the sha256 digest of a file's contents"""
+    return hashlib.sha256(Path(file_path).read_bytes()).digest()
+
+
+def file_stamp(file_path: Path) -> Tuple[int, int]:
+    """Return the modification time (in nanoseconds) and size of a file"""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class HolidayArtifact:
+    """
+    Read-only view of a binary artifact through `mmap`.
+
+    Opening it only validates the header; fixed-size sections are used in
+    place as typed memoryviews, and holidays and strings are decoded when a
+    query reaches them, so only the pages a query touches are read.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        with open(self.file_path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Every memoryview of the map, released before it is closed
+        self._exports: List[memoryview] = []
+        try:
+            self._open(self._export(memoryview(self._mmap)))
+        except (struct.error, ArtifactError):
+            self.close()
+            raise
+
+    def _export(self, view: memoryview) -> memoryview:
+        self._exports.append(view)
+        return view
+
+    def _open(self, view: memoryview):
+        if len(view) < HEADER.size:
+            raise ArtifactError("Data artifact is truncated")
+        (
+            magic,
+            format_version,
+            category_count,
+            year_count,
+            holiday_count,
+            string_count,
+            set_count,
+            member_count,
+            self._max_span,
+            version,
+        ) = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ArtifactError("Not a holiday data artifact")
+        if format_version != FORMAT_VERSION:
+            raise ArtifactError(f"Unsupported artifact version {format_version}")
+        self.version = version.hex()
+
+        offset = HEADER.size
+        sizes = (
+            4 * category_count,
+            4 * (set_count + 1),
+            4 * member_count,
+            YEAR_ENTRY.size * year_count,
+            4 * holiday_count,
+            4 * holiday_count,
+            RECORD.size * holiday_count,
+            4 * (string_count + 1),
+        )
+        sections = []
+        for size in sizes:
+            sections.append(self._export(view[offset : offset + size]))
+            offset += size
+        if offset > len(view):
+            raise ArtifactError("Data artifact is truncated")
+        (
+            category_ids,
+            set_offsets,
+            set_members,
+            year_entries,
+            year_index,
+            starts,
+            records,
+            offsets,
+        ) = sections
+
+        self._year_index = self._cast(year_index, "I")
+        self._starts = self._cast(starts, "i")
+        self._records = records
+        self._offsets = self._cast(offsets, "I")
+        self._strings = self._export(view[offset:])
+        self._string_cache: Dict[int, str] = {}
+        self._holiday_cache: Dict[int, Holiday] = {}
+        self._set_offsets = self._cast(set_offsets, "I")
+        self._set_members = self._cast(set_members, "I")
+        self._set_cache: Dict[int, Tuple[str, ...]] = {}
+
+        self._categories = tuple(self._string(i) for i in self._cast(category_ids, "I"))
+        # Year -> (first slot, count, source stamp, source hash, version)
+        self._years: Dict[int, Tuple[int, int, Tuple[int, int], bytes, str]] = {}
+        for index in range(year_count):
+            year, first, count, mtime, size, source_hash, version = (
+                YEAR_ENTRY.unpack_from(year_entries, index * YEAR_ENTRY.size)
+            )
+            self._years[year] = (
+                first,
+                count,
+                (mtime, size),
+                source_hash,
+                version.hex(),
+            )
+
+    def _cast(self, view: memoryview, code: str):
+        if sys.byteorder == "little":
+            return self._export(view.cast(code))
+        values = array(code, view.tobytes())
+        values.byteswap()
+        return values
+
+    def _end(self, record_id: int) -> int:
+        return struct.unpack_from("<i", self._records, record_id * RECORD.size)[0]
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == NO_STRING:
+            return None
+        value = self._string_cache.get(string_id)
+        if value is None:
+            start, end = self._offsets[string_id], self._offsets[string_id + 1]
+            value = str(self._strings[start:end], "utf-8")
+            self._string_cache[string_id] = value
+        return value
+
+    def _category_set(self, set_id: int) -> Tuple[str, ...]:
+        categories = self._set_cache.get(set_id)
+        if categories is None:
+            start, end = self._set_offsets[set_id], self._set_offsets[set_id + 1]
+            categories = tuple(
+                self._categories[index] for index in self._set_members[start:end]
+            )
+            self._set_cache[set_id] = categories
+        return categories
+
+    def holiday(self, record_id: int) -> Holiday:
+        """Decode one holiday record"""
+        holiday = self._holiday_cache.get(record_id)
+        if holiday is None:
+            end, set_id, uid, summary = RECORD.unpack_from(
+                self._records, record_id * RECORD.size
+            )
+            holiday = Holiday(
+                uid=self._string(uid),
+                summary=self._string(summary),
+                categories=self._category_set(set_id),
+                start=date.fromordinal(self._starts[record_id]),
+                end=date.fromordinal(end),
+            )
+            self._holiday_cache[record_id] = holiday
+        return holiday
+
+    @property
+    def years(self) -> Tuple[int, ...]:
+        """Years held by the artifact, in ascending order"""
+        return tuple(sorted(self._years))
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        """Distinct holiday categories, in table order"""
+        return self._categories
+
+    def source_hash(self, year: int) -> Optional[bytes]:
+        """Return the sha256 digest of the file a year was compiled from"""
+        entry = self._years.get(year)
+        return entry[3] if entry else None
+
+    def source_stamp(self, year: int) -> Optional[Tuple[int, int]]:
+        """Return the modification time and size of a year's source file
+        when the artifact was compiled (None if not recorded)"""
+        entry = self._years.get(year)
+        return entry[2] if entry and entry[2] != (0, 0) else None
+
+    def year_version(self, year: int) -> Optional[str]:
+        """Return the content hash of a year's data (see `dataset_version`)"""
+        entry = self._years.get(year)
+        return entry[4] if entry else None
+
+    def matches(self, paths: Mapping[int, Path]) -> bool:
+        """
+        Return whether the artifact was compiled from exactly these files.
+
+        Files whose modification time and size are the recorded ones count
+        as unchanged without being read; any other file of the recorded size
+        (ex: after a fresh checkout) is compared by its sha256 digest.
+        """
+        if set(paths) != set(self._years):
+            return False
+        for year, path in paths.items():
+            try:
+                stamp = file_stamp(path)
+            except OSError:
+                return False
+            recorded = self.source_stamp(year)
+            if recorded == stamp:
+                continue
+            if recorded is not None and recorded[1] != stamp[1]:
+                return False
+            if file_sha256(path) != self.source_hash(year):
+                return False
+        return True
+
+    def year_holidays(self, year: int) -> Tuple[Holiday, ...]:
+        """Return the holidays of a year sorted by start date"""
+        first, count = self._years[year][:2] if year in self._years else (0, 0)
+        return tuple(
+            self.holiday(self._year_index[slot]) for slot in range(first, first + count)
+        )
+
+    def holidays_on(self, day: date) -> Tuple[Holiday, ...]:
+        """Return the holidays that cover the given date"""
+        ordinal = day.toordinal()
+        hi = bisect_right(self._starts, ordinal)
+        lo = bisect_right(self._starts, ordinal - self._max_span, 0, hi)
+        return tuple(
+            self.holiday(record_id)
+            for record_id in range(lo, hi)
+            if self._end(record_id) > ordinal
+        )
+
+    def holidays_between(self, start: date, end: date) -> Tuple[Holiday, ...]:
+        """Return the holidays overlapping an inclusive date range, by start date"""
+        first = start.toordinal()
+        last = end.toordinal()
+        if last < first:
+            return ()
+        lo = bisect_left(self._starts, first - self._max_span + 1)
+        hi = bisect_right(self._starts, last)
+        return tuple(
+            self.holiday(record_id)
+            for record_id in range(lo, hi)
+            if self._end(record_id) > first
+        )
+
+    def to_store(
+        self, modified: Optional[Mapping[int, datetime]] = None
+    ) -> HolidayStore:
+        """Decode every year into a HolidayStore"""
+        return HolidayStore(
+            {year: self.year_holidays(year) for year in self.years}, modified
+        )
+
+    def close(self):
+        """Release the memory map; decoded holidays stay usable"""
+        for view in reversed(self._exports):
+            view.release()
+        self._exports.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> "HolidayArtifact":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,157 @@
+"""
+Business day arithmetic
+
+Working day calculations over the years held by a HolidayStore.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, FrozenSet, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .store import HolidayStore
+
+# Saturday and Sunday
+DEFAULT_WEEKEND = frozenset({5, 6})
+
+
+class CoverageError(ValueError):
+    """Raised when a calculation needs holiday data that is not loaded"""
+
+
+def normalize_categories(
+    categories: Optional[Iterable[str]],
+) -> Optional[FrozenSet[str]]:
+    """Return lower-cased category names, or None to match every holiday"""
+    if categories is None:
+        return None
+    return frozenset(cat.strip().lower() for cat in categories if cat.strip())
+
+
+class BusinessCalendar:
+    """
+    Precomputed working days for every loaded year.
+
+    A day is a working day when it is not a weekend day and no holiday of
+    the selected categories covers it. `cumulative[i]` holds the number of
+    working days before the i-th day of the covered span, so counting the
+    working days between two dates is a subtraction and finding the n-th
+    working day is a binary search, regardless of the distance involved.
+    """
+
+    def __init__(
+        self,
+        store: "HolidayStore",
+        categories: Optional[Iterable[str]] = None,
+        weekend: FrozenSet[int] = DEFAULT_WEEKEND,
+    ):
+        self.categories = normalize_categories(categories)
+        self.weekend = frozenset(weekend)
+        years = store.years
+        self._years = frozenset(years)
+        if not years:
+            self._first = self._last = 0
+            self.cumulative = array("l", [0])
+            return
+
+        # Covered span: 1 January of the first year to 31 December of the last
+        self._first = date(years[0], 1, 1).toordinal()
+        self._last = date(years[-1], 12, 31).toordinal()
+        cumulative = array("l", [0])
+        total = 0
+        for ordinal in range(self._first, self._last + 1):
+            day = date.fromordinal(ordinal)
+            if day.weekday() not in self.weekend and not self._is_holiday(store, day):
+                total += 1
+            cumulative.append(total)
+        self.cumulative = cumulative
+
+    def _is_holiday(self, store: "HolidayStore", day: date) -> bool:
+        holidays = store.holidays_on(day)
+        if self.categories is None:
+            return bool(holidays)
+        return any(holiday.category_keys & self.categories for holiday in holidays)
+
+    def _index(self, day: date) -> int:
+        """Return the position of a date in the covered span"""
+        if day.year not in self._years:
+            raise CoverageError(f"Holiday data for {day.year} is not available")
+        return day.toordinal() - self._first
+
+    def _nth_working_day(self, count: int, origin: date) -> date:
+        """Return the working day reached when `count` working days have passed"""
+        if count < 1 or count > self.cumulative[-1]:
+            raise CoverageError(
+                f"Result for {origin.isoformat()} falls outside the available data"
+            )
+        index = bisect_left(self.cumulative, count) - 1
+        result = date.fromordinal(self._first + index)
+        # Years in between may be missing from non-contiguous data
+        self._check_span(origin, result)
+        return result
+
+    def _check_span(self, start: date, end: date):
+        low, high = sorted((start.year, end.year))
+        for year in range(low, high + 1):
+            if year not in self._years:
+                raise CoverageError(f"Holiday data for {year} is not available")
+
+    def is_working_day(self, day: date) -> bool:
+        """Return whether the given date is a working day"""
+        index = self._index(day)
+        return self.cumulative[index + 1] > self.cumulative[index]
+
+    def next_working_day(self, day: date) -> date:
+        """Return the first working day after the given date"""
+        return self._nth_working_day(self.cumulative[self._index(day) + 1] + 1, day)
+
+    def previous_working_day(self, day: date) -> date:
+        """Return the last working day before the given date"""
+        return self._nth_working_day(self.cumulative[self._index(day)], day)
+
+    def add_business_days(self, day: date, days: int) -> date:
+        """
+        Move a number of working days forward or backward from a date.
+
+        The start date itself is never counted. With `days=0` the date is
+        returned as is if it is a working day, otherwise the next working day.
+
+        Args:
+            day (date): Start date.
+            days (int): Working days to add (negative to subtract).
+
+        Returns:
+            date: The resulting working day.
+
+        Raises:
+            CoverageError: If the result falls outside the loaded years.
+        """
+        index = self._index(day)
+        if days > 0:
+            return self._nth_working_day(self.cumulative[index + 1] + days, day)
+        if days < 0:
+            return self._nth_working_day(self.cumulative[index] + days + 1, day)
+        if self.is_working_day(day):
+            return day
+        return self.next_working_day(day)
+
+    def business_days_between(self, start: date, end: date) -> int:
+        """
+        Count working days from `start` (inclusive) to `end` (exclusive).
+
+        The count is negative when `end` is before `start`.
+        """
+        if end < start:
+            return -self.business_days_between(end, start)
+        first = self.cumulative[self._index(start)]
+        if end == start:
+            return 0
+        # `end` is exclusive, so only the day before it has to be covered
+        # (ex: 1 January of the year after the last loaded one)
+        last = end - timedelta(days=1)
+        self._check_span(start, last)
+        return self.cumulative[self._index(last) + 1] - first
@@ -0,0 +1,171 @@
+"""
+Circuit breaker
+
+Stops calling a failing backend after consecutive errors and probes it in
+the background until it recovers, so requests fall back at once instead of
+waiting on timeouts.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+import asyncio
+import inspect
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Two-state circuit breaker.
+
+    The breaker opens after `failure_threshold` consecutive failures. While
+    open, `allow` returns False and callers use their fallback path; `run`
+    probes the backend every `probe_interval` seconds and closes the breaker
+    on the first successful probe. Requests never act as probes, so none of
+    them waits on a backend that is still down.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # Statistics
+        self.trips = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently short-circuited"""
+        return self.opened_at is not None
+
+    @property
+    def state(self) -> str:
+        """Breaker state, open or closed"""
+        return "open" if self.is_open else "closed"
+
+    def allow(self) -> bool:
+        """Return whether the backend should be called"""
+        return self.opened_at is None
+
+    def record_success(self):
+        """Reset the failure count, closing the breaker if it was open"""
+        self.failures = 0
+        if self.opened_at is not None:
+            logger.info(
+                "%s recovered after %.1fs, closing circuit breaker",
+                self.name,
+                self._clock() - self.opened_at,
+            )
+            self.opened_at = None
+
+    def trip(self):
+        """Open the breaker at once (ex: the backend was never reachable)"""
+        self.failures = max(self.failures, self.failure_threshold)
+        if self.opened_at is None:
+            self.opened_at = self._clock()
+            self.trips += 1
+
+    def record_failure(self):
+        """Count a failure, opening the breaker at the threshold"""
+        self.failures += 1
+        if self.opened_at is None and self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+            self.trips += 1
+            logger.error(
+                "%s failed %s times in a row, opening circuit breaker",
+                self.name,
+                self.failures,
+            )
+
+    async def run(
+        self,
+        probe: Callable[[], Optional[Awaitable[Any]]],
+        probe_interval: float,
+    ):
+        """
+        Probe the backend while the breaker is open, until cancelled.
+
+        Args:
+            probe (Callable): Makes one cheap call to the backend (ex: PING)
+                and raises if it fails.
+            probe_interval (float): Seconds between probes.
+        """
+        while True:
+            await asyncio.sleep(probe_interval)
+            if not self.is_open:
+                continue
+            try:
+                await probe()
+            except Exception:  # pylint: disable=broad-except
+                self.record_failure()
+                logger.warning("%s is still unavailable", self.name)
+            else:
+                self.record_success()
+
+
+class BreakerClient:
+    """
+    Proxy of an async client that reports each call's outcome to a breaker.
+
+    Every method call returning an awaitable is awaited through the proxy:
+    `errors` raised by it count as failures, normal results as successes.
+    Objects returned by `pipeline()` and `json()` are wrapped as well, so
+    pipelined commands count once per `execute()`, which is the only
+    pipeline call awaited through the proxy. The proxy never blocks
+    calls itself; callers check `breaker.allow()` before using the client.
+    """
+
+    _WRAPPED_FACTORIES = ("pipeline", "json")
+
+    def __init__(
+        self,
+        client: Any,
+        breaker: CircuitBreaker,
+        errors: Tuple[Type[BaseException], ...],
+    ):
+        self._client = client
+        self._breaker = breaker
+        self._errors = errors
+
+    @property
+    def client(self) -> Any:
+        """The wrapped client"""
+        return self._client
+
+    async def _guard(self, awaitable: Awaitable[Any]) -> Any:
+        try:
+            result = await awaitable
+        except self._errors:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            # Checked first: redis pipelines are awaitable themselves
+            if name in self._WRAPPED_FACTORIES:
+                return BreakerClient(result, self._breaker, self._errors)
+            if result is self._client:
+                # Chained command (ex: pipe.incrby(...) returns the pipeline)
+                return self
+            if inspect.isawaitable(result):
+                return self._guard(result)
+            return result
+
+        return call
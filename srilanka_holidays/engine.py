@@ -0,0 +1,224 @@
+"""
+Holiday lookup engine
+
+In-process holiday and working day lookups over the bundled data, for
+programs that embed the library instead of calling the HTTP API. The API
+handlers use the same engine.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Mapping, Optional, Tuple, Union
+import logging
+
+from .artifact import ArtifactError, HolidayArtifact
+from .business_days import BusinessCalendar, CoverageError, normalize_categories
+from .shared_data import ArtifactStore
+from .store import Holiday, HolidayStore, data_file_paths
+
+logger = logging.getLogger(__name__)
+
+# Data shipped with the repository, next to the package
+BUNDLED_DATA_DIR = Path(__file__).resolve().parent.parent / "json"
+BUNDLED_ARTIFACT = Path(__file__).resolve().parent.parent / "bin" / "holidays.bin"
+
+
+def load_store(
+    data_dir: Path = BUNDLED_DATA_DIR,
+    paths: Optional[Mapping[int, Path]] = None,
+    artifact_path: Optional[Path] = BUNDLED_ARTIFACT,
+) -> Union[HolidayStore, ArtifactStore]:
+    """
+    Load yearly data files into a store (blocking, run it in a thread).
+
+    When the binary artifact was compiled from exactly these files, it is
+    memory-mapped and served as an ArtifactStore instead of parsing the JSON
+    files; checking that only stats the files unless they were touched
+    since (see `HolidayArtifact.matches`).
+
+    Args:
+        data_dir (Path): Directory holding the yearly JSON files.
+        paths (Optional[Mapping[int, Path]]): Year to data file (every file
+            in `data_dir` by default).
+        artifact_path (Optional[Path]): Binary artifact to try first, or
+            None to always parse the JSON files.
+
+    Returns:
+        Union[HolidayStore, ArtifactStore]: The loaded store.
+    """
+    if paths is None:
+        paths = data_file_paths(data_dir)
+    artifact = None
+    if artifact_path is not None:
+        try:
+            artifact = HolidayArtifact(artifact_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ArtifactError):
+            logger.warning("Ignoring unreadable data artifact %s", artifact_path)
+    if artifact is not None:
+        try:
+            if artifact.matches(paths):
+                modified = {
+                    year: datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+                    for year, path in paths.items()
+                }
+                logger.info("Mapped holiday data from %s", artifact_path)
+                return ArtifactStore(artifact, modified=modified)
+        except OSError:
+            pass
+        artifact.close()
+    return HolidayStore.load(data_dir, paths)
+
+
+class HolidayCalendar:
+    """
+    Holiday lookups over a HolidayStore, without any I/O.
+
+    `categories` arguments select holidays by category (case-insensitive,
+    ex: ["Public", "Bank"]); None means every holiday. Date lookups raise
+    CoverageError for years without data rather than report them as having
+    no holidays.
+
+    The store can be any HolidayStore-like object (ex: the ArtifactStore
+    returned by `SharedDataset.attach`) and can be replaced at any time by
+    assigning `store`; each call reads it once.
+    """
+
+    def __init__(self, store: Optional[HolidayStore] = None):
+        self.store = store if store is not None else HolidayStore()
+
+    @classmethod
+    def load(
+        cls,
+        data_dir: Path = BUNDLED_DATA_DIR,
+        artifact_path: Optional[Path] = BUNDLED_ARTIFACT,
+    ) -> "HolidayCalendar":
+        """Return a calendar of every year in `data_dir` (the bundled data by default)"""
+        return cls(load_store(data_dir, artifact_path=artifact_path))
+
+    @property
+    def years(self) -> Tuple[int, ...]:
+        """Years with data, in ascending order"""
+        return self.store.years
+
+    def has_year(self, year: int) -> bool:
+        """Return whether data for the given year is available"""
+        return self.store.has_year(year)
+
+    def _check_year(self, store: HolidayStore, year: int):
+        if not store.has_year(year):
+            raise CoverageError(f"Holiday data for {year} is not available")
+
+    @staticmethod
+    def _select(
+        holidays: Tuple[Holiday, ...], categories: Optional[Iterable[str]]
+    ) -> Tuple[Holiday, ...]:
+        keys = normalize_categories(categories)
+        if keys is None:
+            return holidays
+        return tuple(h for h in holidays if not keys.isdisjoint(h.category_keys))
+
+    def holidays_on(
+        self, day: date, categories: Optional[Iterable[str]] = None
+    ) -> Tuple[Holiday, ...]:
+        """
+        Return the holidays covering a date.
+
+        Raises:
+            CoverageError: If there is no data for the date's year.
+        """
+        store = self.store
+        self._check_year(store, day.year)
+        return self._select(store.holidays_on(day), categories)
+
+    def is_holiday(self, day: date, categories: Optional[Iterable[str]] = None) -> bool:
+        """
+        Return whether any holiday (of the given categories) covers a date.
+
+        Raises:
+            CoverageError: If there is no data for the date's year.
+        """
+        return bool(self.holidays_on(day, categories))
+
+    def holidays_on_many(self, days: Iterable[date]) -> List[Tuple[Holiday, ...]]:
+        """Return the holidays covering each date; years without data give none"""
+        return self.store.holidays_on_many(days)
+
+    def holidays(
+        self,
+        year: int,
+        month: Optional[int] = None,
+        categories: Optional[Iterable[str]] = None,
+    ) -> Tuple[Holiday, ...]:
+        """
+        List the holidays of a year, or of one of its months, by start date.
+
+        Args:
+            year (int): Year to list.
+            month (Optional[int]): Only list holidays starting in this month.
+            categories (Optional[Iterable[str]]): Only list holidays of
+                these categories.
+
+        Returns:
+            Tuple[Holiday, ...]: The matching holidays.
+
+        Raises:
+            CoverageError: If there is no data for the year.
+        """
+        store = self.store
+        self._check_year(store, year)
+        return self._select(store.year_holidays(year, month), categories)
+
+    def holidays_between(
+        self,
+        start: date,
+        end: date,
+        categories: Optional[Iterable[str]] = None,
+    ) -> Tuple[Holiday, ...]:
+        """
+        List the holidays overlapping an inclusive date range, across years.
+
+        Years of the range without data contribute no holidays; check
+        `has_year` when that matters.
+        """
+        return self._select(self.store.holidays_between(start, end), categories)
+
+    def business_calendar(
+        self, categories: Optional[Iterable[str]] = None
+    ) -> BusinessCalendar:
+        """Return the working day calendar for holidays of the given categories"""
+        return self.store.business_calendar(categories)
+
+    def is_working_day(
+        self, day: date, categories: Optional[Iterable[str]] = None
+    ) -> bool:
+        """Return whether a date is neither a weekend day nor a holiday"""
+        return self.business_calendar(categories).is_working_day(day)
+
+    def next_working_day(
+        self, day: date, categories: Optional[Iterable[str]] = None
+    ) -> date:
+        """Return the first working day after a date"""
+        return self.business_calendar(categories).next_working_day(day)
+
+    def previous_working_day(
+        self, day: date, categories: Optional[Iterable[str]] = None
+    ) -> date:
+        """Return the last working day before a date"""
+        return self.business_calendar(categories).previous_working_day(day)
+
+    def add_business_days(
+        self, day: date, days: int, categories: Optional[Iterable[str]] = None
+    ) -> date:
+        """Move a number of working days forward (or backward) from a date"""
+        return self.business_calendar(categories).add_business_days(day, days)
+
+    def business_days_between(
+        self, start: date, end: date, categories: Optional[Iterable[str]] = None
+    ) -> int:
+        """Count working days from `start` (inclusive) to `end` (exclusive)"""
+        return self.business_calendar(categories).business_days_between(start, end)
@@ -0,0 +1,238 @@
+"""
+Holiday exports
+
+Renders holidays as iCalendar, CSV and XML, in the layout of the files under
+`ics/`, `csv/` and `xml/`, so API clients get the same formats filtered.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+import csv
+import io
+
+from .store import Holiday
+
+# Format name -> (media type, file extension)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "ics": ("text/calendar; charset=utf-8", ".ics"),
+    "csv": ("text/csv; charset=utf-8", ".csv"),
+    "xml": ("application/xml", ".xml"),
+}
+
+# Accept header media type -> export format name
+_ACCEPT_FORMATS = {
+    "text/calendar": "ics",
+    "text/csv": "csv",
+    "application/xml": "xml",
+    "text/xml": "xml",
+}
+# Media ranges matching the JSON listing
+_JSON_MEDIA_TYPES = frozenset({"application/json", "application/*", "*/*"})
+
+ICS_PRODID = "-//Dilshan-H//Sri Lanka Holidays//EN"
+CSV_FIELDNAMES = ["UID", "Summary", "Categories", "Start", "End"]
+# Holidays rendered per yielded chunk
+CHUNK_SIZE = 100
+
+
+def negotiate_format(accept: Optional[str]) -> Optional[str]:
+    """
+    Pick a holiday listing format from an Accept header.
+
+    JSON stays the answer unless the client explicitly prefers an export
+    format: it must be among the highest quality media types of the header
+    and rank above application/json, application/* and */*. Browsers, which
+    list application/xml below text/html, therefore still get JSON.
+
+    Args:
+        accept (Optional[str]): The Accept request header.
+
+    Returns:
+        Optional[str]: An export format, "full" for JSON, or None when the
+            header names none of the supported media types.
+    """
+    if not accept:
+        return None
+    top_quality = json_quality = 0.0
+    best_quality, best_format = 0.0, None
+    for part in accept.split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        media_type = media_type.lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        top_quality = max(top_quality, quality)
+        if media_type in _JSON_MEDIA_TYPES:
+            json_quality = max(json_quality, quality)
+            continue
+        fmt = _ACCEPT_FORMATS.get(media_type)
+        # Equal qualities keep the first listed
+        if fmt and quality > best_quality:
+            best_quality, best_format = quality, fmt
+    if best_format is not None and json_quality < best_quality == top_quality:
+        return best_format
+    if best_format is None and json_quality == 0:
+        return None
+    return "full"
+
+
+def _chunks(holidays: Iterable[Holiday]) -> Iterator[List[Holiday]]:
+    chunk: List[Holiday] = []
+    for holiday in holidays:
+        chunk.append(holiday)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ics_text(value: Optional[str]) -> str:
+    """Escape a TEXT value (RFC 5545, section 3.3.11)"""
+    return (
+        (value or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_line(line: str) -> str:
+    """Fold a content line at 75 octets without splitting a character"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Step back over UTF-8 continuation bytes
+        while cut < len(encoded) and encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        # Continuation lines start with a space, which counts towards 75
+        limit = 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_event(holiday: Holiday, stamp: str) -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        "STATUS:CONFIRMED",
+        f"UID:{_ics_text(holiday.uid)}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;VALUE=DATE:{holiday.start:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{holiday.end:%Y%m%d}",
+        f"SUMMARY:{_ics_text(holiday.summary)}",
+        f"DESCRIPTION:{_ics_text(','.join(holiday.categories))}",
+        f"CATEGORIES:{','.join(_ics_text(c) for c in holiday.categories)}",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+    return "".join(_ics_line(line) for line in lines)
+
+
+def iter_ics(
+    holidays: Iterable[Holiday], modified: Optional[datetime] = None
+) -> Iterator[bytes]:
+    """
+    Render holidays as an iCalendar feed, in chunks.
+
+    Args:
+        holidays (Iterable[Holiday]): Holidays to render.
+        modified (Optional[datetime]): When the data last changed, used as
+            the DTSTAMP of every event so the same data renders identically.
+
+    Yields:
+        bytes: Consecutive parts of the feed.
+    """
+    moment = (modified or datetime(1970, 1, 1, tzinfo=timezone.utc)).astimezone(
+        timezone.utc
+    )
+    stamp = moment.strftime("%Y%m%dT%H%M%SZ")
+    yield (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        f"PRODID:{ICS_PRODID}\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        "METHOD:PUBLISH\r\n"
+        "X-WR-CALNAME:Sri Lanka Holidays\r\n"
+    ).encode("utf-8")
+    for chunk in _chunks(holidays):
+        yield "".join(_ics_event(h, stamp) for h in chunk).encode("utf-8")
+    yield b"END:VCALENDAR\r\n"
+
+
+def iter_csv(holidays: Iterable[Holiday]) -> Iterator[bytes]:
+    """Render holidays as CSV (the `csv/` layout), in chunks"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDNAMES)
+    for chunk in _chunks(holidays):
+        writer.writerows(
+            (h.uid, h.summary, ",".join(h.categories), h.start_iso, h.end_iso)
+            for h in chunk
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # No holidays: only the header was written
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _xml_event(holiday: Holiday) -> str:
+    return (
+        "<Event>"
+        f"<Summary>{escape(str(holiday.summary))}</Summary>"
+        f"<Categories>{escape(','.join(holiday.categories))}</Categories>"
+        f"<Start>{holiday.start_iso}</Start>"
+        f"<End>{holiday.end_iso}</End>"
+        "</Event>"
+    )
+
+
+def iter_xml(holidays: Iterable[Holiday]) -> Iterator[bytes]:
+    """Render holidays as XML (the `xml/` layout), in chunks"""
+    yield b"<?xml version='1.0' encoding='utf-8'?>\n<CalendarEvents>"
+    for chunk in _chunks(holidays):
+        yield "".join(_xml_event(h) for h in chunk).encode("utf-8")
+    yield b"</CalendarEvents>"
+
+
+def iter_export(
+    fmt: str, holidays: Iterable[Holiday], modified: Optional[datetime] = None
+) -> Iterator[bytes]:
+    """
+    Render holidays in one of the EXPORT_FORMATS, in chunks.
+
+    Args:
+        fmt (str): "ics", "csv" or "xml".
+        holidays (Iterable[Holiday]): Holidays to render.
+        modified (Optional[datetime]): When the data last changed (iCalendar
+            only, see `iter_ics`).
+
+    Returns:
+        Iterator[bytes]: Consecutive parts of the body.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt == "ics":
+        return iter_ics(holidays, modified)
+    if fmt == "csv":
+        return iter_csv(holidays)
+    if fmt == "xml":
+        return iter_xml(holidays)
+    raise ValueError(f"Unsupported export format: {fmt}")
@@ -0,0 +1,146 @@
+"""
+Health monitoring
+
+Runs the expensive health checks in the background and keeps their latest
+results, so health probes are answered from memory.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+DEGRADED = "degraded"
+FAIL = "fail"
+# Worse statuses rank higher
+_RANK = {OK: 0, DEGRADED: 1, FAIL: 2}
+
+# A check returns its status and an optional human-readable detail
+HealthCheck = Callable[[], Awaitable[Tuple[str, Optional[str]]]]
+
+
+class CheckResult(NamedTuple):
+    """Outcome of one run of a health check"""
+
+    status: str
+    detail: Optional[str]
+    checked_at: datetime
+    duration_ms: float
+
+
+class HealthMonitor:
+    """
+    Periodically runs named health checks and caches their results.
+
+    Each check reports "ok", "degraded" (working, with reduced service) or
+    "fail". The overall status is the worst of them, and "fail" once the
+    results are older than `max_age` seconds (ex: the monitor task stopped).
+    A check that raises or takes longer than `timeout` seconds fails.
+    """
+
+    def __init__(
+        self,
+        checks: Mapping[str, HealthCheck],
+        timeout: float = 5.0,
+        max_age: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.checks = dict(checks)
+        self.timeout = timeout
+        self.max_age = max_age
+        self._clock = clock
+        self.results: Dict[str, CheckResult] = {}
+        self._checked: Optional[float] = None
+        self._running: Optional[asyncio.Task] = None
+
+    @property
+    def status(self) -> str:
+        """Overall status of the latest results"""
+        if self._checked is None or self._clock() - self._checked > self.max_age:
+            return FAIL
+        return max(
+            (result.status for result in self.results.values()),
+            key=_RANK.__getitem__,
+            default=OK,
+        )
+
+    def is_ready(self) -> bool:
+        """Whether the service should receive traffic (nothing failing)"""
+        return self.status != FAIL
+
+    async def _run_check(self, name: str, check: HealthCheck) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            status, detail = await asyncio.wait_for(check(), self.timeout)
+        except asyncio.TimeoutError:
+            status, detail = FAIL, f"Timed out after {self.timeout}s"
+        except Exception as exc:  # pylint: disable=broad-except
+            status, detail = FAIL, f"{type(exc).__name__}: {exc}"
+        if status not in _RANK:
+            status, detail = FAIL, f"Unknown status {status!r}"
+        duration_ms = (time.perf_counter() - started) * 1000
+        if status != OK:
+            logger.warning("Health check %s: %s (%s)", name, status, detail)
+        return CheckResult(
+            status, detail, datetime.now(timezone.utc), round(duration_ms, 3)
+        )
+
+    async def _check_all(self):
+        names = list(self.checks)
+        results = await asyncio.gather(
+            *(self._run_check(name, self.checks[name]) for name in names)
+        )
+        self.results = dict(zip(names, results))
+        self._checked = self._clock()
+
+    async def check(self) -> str:
+        """
+        Run every check now and return the overall status.
+
+        Concurrent callers share a single run.
+        """
+        if self._running is None or self._running.done():
+            self._running = asyncio.ensure_future(self._check_all())
+        await asyncio.shield(self._running)
+        return self.status
+
+    def snapshot(self) -> dict:
+        """Return the latest results for diagnostics"""
+        return {
+            "status": self.status,
+            "age_seconds": (
+                None
+                if self._checked is None
+                else round(self._clock() - self._checked, 3)
+            ),
+            "checks": {
+                name: {
+                    "status": result.status,
+                    "detail": result.detail,
+                    "checked_at": result.checked_at.isoformat(),
+                    "duration_ms": result.duration_ms,
+                }
+                for name, result in self.results.items()
+            },
+        }
+
+    async def run(self, interval: float):
+        """
+        Run the checks every `interval` seconds until cancelled.
+
+        Args:
+            interval (float): Seconds between runs.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.check()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Health checks failed to run")
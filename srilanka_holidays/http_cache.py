@@ -0,0 +1,80 @@
+"""
+HTTP caching helpers
+
+Builds validators (ETag/Last-Modified) and evaluates conditional request
+headers so unchanged data can be answered with 304 Not Modified.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Hashable, Optional
+import hashlib
+
+
+def make_etag(version: Optional[str], *variant: Hashable) -> str:
+    """
+    Build a strong ETag for a representation of a dataset.
+
+    Args:
+        version (Optional[str]): Content hash of the underlying dataset.
+        *variant (Hashable): Request parameters that shape the representation.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    seed = "|".join([version or ""] + [repr(part) for part in variant])
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def format_http_date(moment: datetime) -> str:
+    """Format a timezone-aware datetime as an HTTP date"""
+    return format_datetime(moment, usegmt=True)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    etag: str,
+    last_modified: Optional[datetime],
+    if_none_match: Optional[str] = None,
+    if_modified_since: Optional[str] = None,
+) -> bool:
+    """
+    Evaluate conditional request headers against the current validators.
+
+    If-None-Match takes precedence over If-Modified-Since, as per RFC 9110.
+
+    Args:
+        etag (str): Current ETag of the representation.
+        last_modified (Optional[datetime]): When the data last changed.
+        if_none_match (Optional[str]): Value of the If-None-Match header.
+        if_modified_since (Optional[str]): Value of the If-Modified-Since header.
+
+    Returns:
+        bool: True if the client's copy is still fresh.
+    """
+    if if_none_match:
+        return _etag_matches(etag, if_none_match)
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have one second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
@@ -0,0 +1,194 @@
+"""
+Logging
+
+Non-blocking structured logging: records are handed to a queue on the
+event loop thread and formatted/written by a background listener thread.
+Also provides sampled hot-path debug events and a one line per request
+access log.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import time
+
+# Extra fields of the request being handled, written in its access log line
+_request_fields: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_fields", default=None
+)
+
+# LogRecord attributes that are not user supplied extra fields
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+# Listener started by configure_logging, shared by later calls
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name, value in record.__dict__.items():
+            if name not in _RECORD_ATTRS and not name.startswith("_"):
+                entry[name] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now, since args may be mutated after the call;
+        # everything else is formatted by the listener
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: str = "INFO", json_format: bool = True) -> QueueListener:
+    """
+    Route all logging through a queue drained by a background thread.
+
+    Replaces any handlers on the root logger. The listener is stopped (and
+    the queue flushed) at interpreter exit. Later calls only set the level
+    and return the listener already running.
+
+    Args:
+        level (str): Root log level name.
+        json_format (bool): Write JSON lines instead of plain text.
+
+    Returns:
+        QueueListener: The started listener.
+    """
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None:
+        root.setLevel(level.upper())
+        return _listener
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        JsonFormatter()
+        if json_format
+        else logging.Formatter("%(levelname)s:%(name)s:%(message)s")
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level.upper())
+    listener.start()
+    atexit.register(listener.stop)
+    _listener = listener
+    return listener
+
+
+class SampledLogger:
+    """
+    Emits hot-path debug events for a fraction of calls.
+
+    With the logger above DEBUG (the default) a call costs one level check;
+    otherwise only `rate` of the calls are logged.
+    """
+
+    def __init__(self, logger: logging.Logger, rate: float):
+        self.logger = logger
+        self.rate = rate
+
+    def debug(self, msg: str, *args, **kwargs):
+        """Log a debug event if it is enabled and selected by the sample rate"""
+        if (
+            self.rate > 0
+            and self.logger.isEnabledFor(logging.DEBUG)
+            and (self.rate >= 1 or random.random() < self.rate)
+        ):
+            self.logger.debug(msg, *args, **kwargs)
+
+
+def set_request_fields(**fields: Any):
+    """Add fields to the access log line of the current request"""
+    current = _request_fields.get()
+    if current is not None:
+        current.update(fields)
+
+
+class AccessLogMiddleware:
+    """
+    ASGI middleware writing one INFO line per HTTP request.
+
+    The line holds the method, path, matched route, status and duration,
+    plus any fields added with `set_request_fields` while handling it.
+    """
+
+    def __init__(self, app, logger: Optional[logging.Logger] = None):
+        self.app = app
+        self.logger = logger or logging.getLogger("access")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        fields: Dict[str, Any] = {}
+        token = _request_fields.set(fields)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", None)
+            self.logger.info(
+                "%s %s %s",
+                scope.get("method", ""),
+                scope.get("path", ""),
+                status_code,
+                extra={
+                    "method": scope.get("method", ""),
+                    "path": scope.get("path", ""),
+                    "route": route,
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                    **fields,
+                },
+            )
+            _request_fields.reset(token)
@@ -0,0 +1,299 @@
+"""
+Metrics
+
+Dependency-free counters and histograms rendered in the Prometheus text
+format, plus an ASGI middleware that times every request and can report
+per-stage timings in a Server-Timing header, and a startup phase timer.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import time
+
+# Latency buckets in seconds, from 100 microseconds to 2.5 seconds
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+# Stage timings of the request being handled, for the Server-Timing header
+_request_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        """Add amount to the series identified by the label values"""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current value of a series"""
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+
+
+class Histogram:
+    """Histogram with fixed upper bounds and optional labels"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), count, sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        """Record one observation for the series identified by the label values"""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += 1
+        series[2] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations of a series"""
+        series = self._series.get(labels)
+        return series[1] if series else 0
+
+    def samples(self) -> Iterator[str]:
+        for labels, (bucket_counts, count, total) in sorted(self._series.items()):
+            cumulative = 0
+            bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+            for bound, bucket_count in zip(bounds, bucket_counts):
+                cumulative += bucket_count
+                label_str = _format_labels(self.labelnames, labels, f'le="{bound}"')
+                yield f"{self.name}_bucket{label_str} {cumulative}"
+            label_str = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_count{label_str} {count}"
+            yield f"{self.name}_sum{label_str} {total}"
+
+
+class CallbackMetric:
+    """Counter or gauge whose value is read from a callback at render time"""
+
+    def __init__(
+        self, name: str, documentation: str, kind: str, callback: Callable[[], float]
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.callback = callback
+
+    def samples(self) -> Iterator[str]:
+        yield f"{self.name} {self.callback()}"
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together.
+
+    Recording is a dict update on the event loop thread, so it is cheap
+    enough to leave enabled in production. Values from other subsystems
+    (cache hit counts, usage flush stats) are read through callbacks only
+    when the metrics are scraped.
+    """
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._metrics: list = []
+        self.request_duration = self.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route",
+            ["route", "method", "status"],
+        )
+        self.stage_duration = self.histogram(
+            "stage_duration_seconds",
+            "Time spent in each stage of request handling",
+            ["stage"],
+        )
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        """Create and register a counter"""
+        return self._add(Counter(self.prefix + name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Create and register a histogram"""
+        return self._add(
+            Histogram(self.prefix + name, documentation, labelnames, buckets)
+        )
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], float],
+        kind: str = "gauge",
+    ) -> CallbackMetric:
+        """Register a metric whose value is computed when rendering"""
+        return self._add(
+            CallbackMetric(self.prefix + name, documentation, kind, callback)
+        )
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as a named stage of the current request"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stage_duration.observe(elapsed, name)
+            timings = _request_timings.get()
+            if timings is not None:
+                timings.append((name, elapsed))
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+class StartupProfiler:
+    """
+    Records how long each phase of process startup took.
+
+    Phases are either timed blocks (`phase`) or the time elapsed since the
+    previous phase ended (`mark`), which suits module-level code such as
+    the import section of a module.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = time.perf_counter() if started is None else started
+        self._last = self.started
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, name: str):
+        """Record the time since the previous phase as the named phase"""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as a named phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.phases.append((name, self._last - started))
+
+    def summary(self) -> str:
+        """Return the phases and their durations in milliseconds"""
+        return ", ".join(
+            f"{name}={elapsed * 1000:.1f}ms" for name, elapsed in self.phases
+        )
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording a latency histogram per route, method and status.
+
+    With `server_timing` enabled, stages timed through `MetricsRegistry.stage`
+    during the request are also sent back in a Server-Timing header.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+        self.requests = registry.request_duration
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: List[Tuple[str, float]] = []
+        token = _request_timings.set(timings)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    entries = timings + [("total", time.perf_counter() - started)]
+                    value = ", ".join(
+                        f"{name};dur={elapsed * 1000:.3f}" for name, elapsed in entries
+                    )
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", value.encode("latin-1"))
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the scope
+            route = getattr(scope.get("route"), "path", None) or "other"
+            self.requests.observe(
+                time.perf_counter() - started,
+                route,
+                scope.get("method", ""),
+                str(status_code),
+            )
+            _request_timings.reset(token)
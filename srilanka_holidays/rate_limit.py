@@ -0,0 +1,230 @@
+"""
+Rate limiting
+
+Per API key token buckets and daily quotas, enforced in-process and
+reconciled across workers and instances through periodic Redis syncs.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Daily request counters are kept in Redis for two days
+RATE_LIMIT_TTL_SECONDS = 86400 * 2
+
+
+class RateLimit(NamedTuple):
+    """Limits of one API key (0 means unlimited)"""
+
+    # Sustained requests per minute
+    per_minute: float
+    # Requests that can be made at once after being idle
+    burst: float
+    # Requests per UTC day
+    daily_quota: int
+
+
+def rate_limit_key(key_hash: str, day: int) -> str:
+    """Return the Redis key of a daily request counter (ex: ratelimit:<hash16>:20251128)"""
+    moment = datetime.fromtimestamp(day * 86400, tz=timezone.utc)
+    return f"ratelimit:{key_hash[:16]}:{moment:%Y%m%d}"
+
+
+class _Bucket:
+    """Admission state of one API key"""
+
+    __slots__ = ("limit", "tokens", "updated", "day", "used", "synced", "unsynced")
+
+    def __init__(self, limit: RateLimit, now: float, day: int):
+        self.limit = limit
+        self.tokens = limit.burst
+        self.updated = now
+        self.day = day
+        # Requests counted today: the last synced total plus local ones since
+        self.used = 0
+        # Total of the Redis counter at the last sync
+        self.synced = 0
+        # Local requests not yet added to the Redis counter
+        self.unsynced = 0
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with daily quotas, keyed by API key hash.
+
+    `acquire` only touches in-memory state. `sync` adds each key's local
+    requests to a shared daily counter in Redis in one pipeline; the totals
+    it reads back tell every instance how many requests the others admitted,
+    which are taken out of its own buckets and counted against the quota.
+    Limits are therefore shared across instances, within one sync interval.
+    """
+
+    def __init__(
+        self,
+        default: RateLimit,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.default = default
+        self._clock = clock
+        self._buckets: Dict[str, _Bucket] = {}
+        # Statistics
+        self.rejected_rate = 0
+        self.rejected_quota = 0
+        self.syncs = 0
+        self.failed_syncs = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def limit_for(self, record: Optional[dict] = None) -> RateLimit:
+        """
+        Return the limits of an API key record.
+
+        Records may set "rate_limit" (requests per minute), "burst" and
+        "daily_quota"; missing or invalid fields use the defaults. A record
+        that only sets "rate_limit" gets a burst of the same size.
+
+        Args:
+            record (Optional[dict]): API key record from the key store.
+
+        Returns:
+            RateLimit: The key's limits.
+        """
+        if not record:
+            return self.default
+
+        def field(name: str, default: float) -> float:
+            value = record.get(name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return default
+            return max(0, value)
+
+        per_minute = field("rate_limit", self.default.per_minute)
+        burst = field("burst", 0) or (
+            per_minute if "rate_limit" in record else self.default.burst
+        )
+        return RateLimit(
+            per_minute, burst, int(field("daily_quota", self.default.daily_quota))
+        )
+
+    def acquire(self, key_hash: str, limit: Optional[RateLimit] = None) -> float:
+        """
+        Admit or reject one request.
+
+        Args:
+            key_hash (str): SHA-256 hash of the API key.
+            limit (Optional[RateLimit]): The key's limits (default limits
+                if not given).
+
+        Returns:
+            float: 0 if the request is admitted, otherwise the number of
+                seconds until it would be.
+        """
+        limit = limit or self.default
+        if not limit.per_minute and not limit.daily_quota:
+            return 0.0
+        now = self._clock()
+        day = int(now // 86400)
+        bucket = self._buckets.get(key_hash)
+        if bucket is None:
+            bucket = self._buckets[key_hash] = _Bucket(limit, now, day)
+        elif bucket.limit != limit:
+            bucket.tokens = min(bucket.tokens, limit.burst)
+            bucket.limit = limit
+        if bucket.day != day:
+            bucket.day, bucket.used, bucket.synced, bucket.unsynced = day, 0, 0, 0
+
+        if limit.daily_quota and bucket.used >= limit.daily_quota:
+            self.rejected_quota += 1
+            return (day + 1) * 86400 - now
+
+        if limit.per_minute:
+            rate = limit.per_minute / 60
+            bucket.tokens = min(
+                limit.burst, bucket.tokens + (now - bucket.updated) * rate
+            )
+            bucket.updated = now
+            if bucket.tokens < 1:
+                self.rejected_rate += 1
+                return (1 - bucket.tokens) / rate
+            bucket.tokens -= 1
+
+        bucket.used += 1
+        bucket.unsynced += 1
+        return 0.0
+
+    async def sync(self, client: Optional[Any]) -> int:
+        """
+        Exchange request counts with the other instances through Redis.
+
+        Args:
+            client: Async Redis client, or None to keep limits local.
+
+        Returns:
+            int: Number of keys synced.
+        """
+        if not self._buckets:
+            return 0
+        day = int(self._clock() // 86400)
+        if not client:
+            self._prune(day)
+            return 0
+
+        batch: List[Tuple[_Bucket, int]] = []
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key_hash, bucket in self._buckets.items():
+                if bucket.day < day and not bucket.unsynced:
+                    continue
+                # Requests left over from a previous day go to that day's counter
+                counter_key = rate_limit_key(key_hash, bucket.day)
+                pipe.incrby(counter_key, bucket.unsynced)
+                pipe.expire(counter_key, RATE_LIMIT_TTL_SECONDS)
+                batch.append((bucket, bucket.unsynced))
+                bucket.unsynced = 0
+            results = await pipe.execute()
+        except Exception:  # pylint: disable=broad-except
+            logger.error("Failed to sync rate limits of %s keys", len(batch))
+            self.failed_syncs += 1
+            for bucket, sent in batch:
+                bucket.unsynced += sent
+            return 0
+
+        for (bucket, sent), total in zip(batch, results[::2]):
+            if bucket.day != day:
+                continue
+            others = int(total) - bucket.synced - sent
+            bucket.synced = int(total)
+            bucket.used = bucket.synced + bucket.unsynced
+            if others > 0 and bucket.limit.per_minute:
+                # Requests admitted elsewhere use up this bucket too, down to
+                # one burst of debt
+                bucket.tokens = max(bucket.tokens - others, -bucket.limit.burst)
+        self._prune(day)
+        self.syncs += 1
+        return len(batch)
+
+    def _prune(self, day: int):
+        # Buckets idle since before today hold nothing worth keeping once
+        # their requests are flushed
+        for key_hash in [k for k, b in self._buckets.items() if b.day < day]:
+            del self._buckets[key_hash]
+
+    async def run(self, get_client: Callable[[], Optional[Any]], interval: float):
+        """
+        Sync periodically until cancelled.
+
+        Args:
+            get_client (Callable): Returns the current Redis client (or None).
+            interval (float): Seconds between syncs.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.sync(get_client())
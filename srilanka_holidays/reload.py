@@ -0,0 +1,70 @@
+"""
+Data reloading
+
+Detects added, changed and removed yearly data files so the holiday data
+can be reloaded without restarting the API.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+import hashlib
+
+from .store import HolidayStore, data_file_paths
+
+# Year -> (mtime in nanoseconds, size in bytes) of its data file
+Snapshot = Dict[int, Tuple[int, int]]
+
+
+def store_version(store: HolidayStore) -> str:
+    """Return a hash identifying the content of every year in a store"""
+    payload = ",".join(f"{year}:{store.version(year)}" for year in store.years)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DataWatcher:
+    """
+    Polls a data directory for yearly JSON files that changed.
+
+    A file counts as changed when its modification time or size differs from
+    the previous scan. Scans stat every file, so they belong in a worker
+    thread rather than on the event loop.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self.paths: Dict[int, Path] = {}
+        self._snapshot: Optional[Snapshot] = None
+
+    def scan(self) -> Tuple[Dict[int, Path], Snapshot]:
+        """Return the current data files and their modification stamps"""
+        paths = data_file_paths(self.data_dir)
+        snapshot = {}
+        for year, path in list(paths.items()):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removed between listing and stat
+                del paths[year]
+                continue
+            snapshot[year] = (stat.st_mtime_ns, stat.st_size)
+        return paths, snapshot
+
+    def poll(self) -> Set[int]:
+        """
+        Rescan the directory and return the years whose files changed.
+
+        The first call records the initial state and returns every year found.
+        """
+        paths, snapshot = self.scan()
+        previous = self._snapshot or {}
+        changed = {
+            year
+            for year in set(previous) | set(snapshot)
+            if previous.get(year) != snapshot.get(year)
+        }
+        self.paths = paths
+        self._snapshot = snapshot
+        return changed
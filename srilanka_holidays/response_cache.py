@@ -0,0 +1,58 @@
+"""
+Response cache
+
+Bounded LRU cache of fully serialized response bodies.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    LRU cache of response bodies tagged with the dataset version they were
+    built from.
+
+    Keys are tuples whose first item is the year. An entry is only returned
+    while the caller's current version for that year matches the stored one,
+    so replacing a year's data invalidates its bodies without a full flush.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = max(0, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[Hashable, ...], version: Optional[str]) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or stale"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Tuple[Hashable, ...], version: Optional[str], body: bytes):
+        """Store a body for key, evicting the least recently used entries"""
+        if not self.maxsize:
+            return
+        self._entries[key] = (version, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, year: Optional[int] = None):
+        """Drop every entry, or only the entries of the given year"""
+        if year is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == year]:
+            del self._entries[key]
@@ -0,0 +1,138 @@
+"""
+JSON serialization
+
+One place to encode and decode JSON for response bodies and cached payloads,
+using orjson when it is installed and the standard library otherwise.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional, Type, Union
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _encode_default(value: Any) -> str:
+    """Encode dates and datetimes as ISO 8601 strings, like orjson"""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonSerializer:
+    """
+    Standard library serializer.
+
+    Output matches FastAPI's JSONResponse: compact separators, UTF-8 text
+    instead of \\u escapes, and NaN/Infinity rejected. Dates and datetimes
+    are written as ISO 8601 strings, as orjson writes them.
+    """
+
+    name = "json"
+
+    def dumps(self, content: Any) -> bytes:
+        """Encode content as compact UTF-8 JSON"""
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_encode_default,
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document"""
+        return json.loads(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    orjson serializer, producing the same bytes as JsonSerializer for the
+    plain dicts, lists, strings and numbers the API returns.
+
+    Content orjson rejects (integers wider than 64 bits, unsupported types)
+    goes through JsonSerializer so errors stay the same. Unlike the json
+    module, orjson writes NaN and Infinity as null.
+    """
+
+    name = "orjson"
+
+    def dumps(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().dumps(content)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+SERIALIZERS: Dict[str, Type[JsonSerializer]] = {"json": JsonSerializer}
+if orjson is not None:
+    SERIALIZERS["orjson"] = OrjsonSerializer
+
+
+def get_serializer(name: Optional[str] = None) -> JsonSerializer:
+    """
+    Return a serializer by name, or the fastest one installed.
+
+    Args:
+        name (Optional[str]): "orjson" or "json". A library that isn't
+            installed falls back to the standard library with a warning.
+
+    Returns:
+        JsonSerializer: The serializer.
+
+    Raises:
+        ValueError: If the name is not a known serializer.
+    """
+    if name is None:
+        name = "orjson" if "orjson" in SERIALIZERS else "json"
+    name = name.lower()
+    if name not in ("json", "orjson"):
+        raise ValueError(f"Unknown JSON serializer: {name}")
+    if name not in SERIALIZERS:
+        logger.warning("%s is not installed, using the json module instead", name)
+        name = "json"
+    return SERIALIZERS[name]()
+
+
+_serializer = get_serializer()
+
+
+def use_serializer(name: Optional[str] = None) -> JsonSerializer:
+    """Switch the serializer used by serialize_json/deserialize_json"""
+    global _serializer
+    _serializer = get_serializer(name)
+    return _serializer
+
+
+def json_backend() -> str:
+    """Return the name of the serializer in use"""
+    return _serializer.name
+
+
+def serialize_json(content: Any) -> bytes:
+    """Serialize content the same way FastAPI's JSONResponse renders it"""
+    return _serializer.dumps(content)
+
+
+def deserialize_json(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    return _serializer.loads(data)
@@ -0,0 +1,327 @@
+"""
+Shared holiday data
+
+Publishes the holiday data as generations of the binary artifact in a
+directory shared by the worker processes of a host (ex: under /dev/shm), so
+every worker memory-maps the same copy instead of parsing and indexing its
+own.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+import json
+import logging
+import os
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from .artifact import (
+    ArtifactError,
+    HolidayArtifact,
+    build_artifact,
+    file_sha256,
+    file_stamp,
+)
+from .store import Holiday, HolidayStore
+
+if TYPE_CHECKING:
+    from .business_days import BusinessCalendar
+
+logger = logging.getLogger(__name__)
+
+# Names the artifact file of the current generation
+MANIFEST_NAME = "current.json"
+# Serializes publishing between processes
+LOCK_NAME = "publish.lock"
+
+
+class ArtifactStore:
+    """
+    Read-only HolidayStore backed by a memory-mapped artifact.
+
+    Nothing is parsed or indexed up front: date and range lookups binary
+    search the artifact's start dates in place, and holidays are decoded the
+    first time a query returns them. Use `with_year` to get a regular
+    HolidayStore with an extra year.
+    """
+
+    def __init__(
+        self,
+        artifact: HolidayArtifact,
+        versions: Optional[Mapping[int, str]] = None,
+        modified: Optional[Mapping[int, datetime]] = None,
+    ):
+        self.artifact = artifact
+        self._versions: Dict[int, str] = dict(versions or {})
+        now = datetime.now(timezone.utc)
+        self._modified = {year: (modified or {}).get(year, now) for year in self.years}
+        # Year -> (holidays, start ordinals), decoded on first use
+        self._year_cache: Dict[int, Tuple[Tuple[Holiday, ...], List[int]]] = {}
+        self._category_keys = frozenset(c.lower() for c in artifact.categories)
+        self._business_calendars: Dict[Optional[frozenset], "BusinessCalendar"] = {}
+
+    @property
+    def years(self) -> Tuple[int, ...]:
+        """Years available in the store, in ascending order"""
+        return self.artifact.years
+
+    @property
+    def category_keys(self) -> FrozenSet[str]:
+        """Lower-cased categories of the loaded holidays"""
+        return self._category_keys
+
+    def has_year(self, year: int) -> bool:
+        """Return whether data for the given year is loaded"""
+        return self.artifact.source_hash(year) is not None
+
+    def version(self, year: int) -> Optional[str]:
+        """Return the content hash of a year's data (None if not loaded)"""
+        return self._versions.get(year) or self.artifact.year_version(year)
+
+    def last_modified(self, year: int) -> Optional[datetime]:
+        """Return when a year's data last changed (None if not loaded)"""
+        return self._modified.get(year)
+
+    def _year(self, year: int) -> Tuple[Tuple[Holiday, ...], List[int]]:
+        entry = self._year_cache.get(year)
+        if entry is None:
+            holidays = self.artifact.year_holidays(year)
+            entry = (holidays, [h.start_ordinal for h in holidays])
+            self._year_cache[year] = entry
+        return entry
+
+    def year_holidays(
+        self, year: int, month: Optional[int] = None
+    ) -> Tuple[Holiday, ...]:
+        """Return the holidays of a year (starting in `month`) by start date"""
+        holidays, starts = self._year(year)
+        if not month or not holidays:
+            return holidays
+        first = date(year, month, 1).toordinal()
+        after = (
+            date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        ).toordinal()
+        return holidays[bisect_left(starts, first) : bisect_left(starts, after)]
+
+    def holidays_on(self, day: date) -> Tuple[Holiday, ...]:
+        """Return the holidays that cover the given date"""
+        return self.artifact.holidays_on(day)
+
+    def holidays_on_many(self, days: Iterable[date]) -> List[Tuple[Holiday, ...]]:
+        """Return the holidays covering each of the given dates, in order"""
+        lookup = self.artifact.holidays_on
+        return [lookup(day) for day in days]
+
+    def holidays_between(self, start: date, end: date) -> Tuple[Holiday, ...]:
+        """Return the holidays overlapping an inclusive date range, across years"""
+        return self.artifact.holidays_between(start, end)
+
+    # Same per-selection calendar cache as HolidayStore
+    business_calendar = HolidayStore.business_calendar
+
+    def with_year(self, year: int, holidays: Iterable[Holiday]) -> HolidayStore:
+        """Return a new (in-memory) store with the given year added or replaced"""
+        years = {y: self.year_holidays(y) for y in self.years}
+        years[year] = tuple(holidays)
+        modified = {y: m for y, m in self._modified.items() if y != year}
+        return HolidayStore(years, modified)
+
+
+class SharedDataset:
+    """
+    Generations of holiday data shared through a directory.
+
+    `publish` writes the data as a new artifact file, then atomically
+    replaces the manifest naming the current generation, so readers move
+    from one complete generation to the next and never see a partial one.
+    `attach` memory-maps the current generation; the operating system keeps
+    one copy of its pages however many processes map it. `update` holds a
+    file lock and skips publishing when the current generation was compiled
+    from the same files, so workers noticing a change at once build it once.
+    """
+
+    def __init__(self, directory: Path, keep: int = 3):
+        self.directory = Path(directory)
+        # Artifact files kept, for workers still attached to older ones
+        self.keep = max(1, keep)
+        self.manifest_path = self.directory / MANIFEST_NAME
+        # Generation of the last `attach`
+        self.generation: Optional[int] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+
+    def read_manifest(self) -> Optional[dict]:
+        """Return the manifest of the current generation (None if none yet)"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the publish lock (a no-op where fcntl is unavailable)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / LOCK_NAME, "a") as lock_file:
+            if fcntl is None:
+                yield
+                return
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def is_current(self, paths: Mapping[int, Path]) -> bool:
+        """Return whether the current generation was compiled from these files"""
+        try:
+            manifest = self.read_manifest()
+            if manifest is None:
+                return False
+            with HolidayArtifact(self.directory / manifest["artifact"]) as artifact:
+                return artifact.matches(paths)
+        except (OSError, KeyError, ValueError):
+            return False
+
+    def publish(
+        self,
+        store: HolidayStore,
+        source_hashes: Optional[Mapping[int, bytes]] = None,
+        source_stamps: Optional[Mapping[int, Tuple[int, int]]] = None,
+    ) -> int:
+        """
+        Publish a store as the next generation. Hold `lock` while calling it.
+
+        Args:
+            store (HolidayStore): Holiday data to publish.
+            source_hashes (Optional[Mapping[int, bytes]]): sha256 digest of
+                each year's source file (see `build_artifact`).
+            source_stamps (Optional[Mapping[int, Tuple[int, int]]]):
+                Modification time and size of each year's source file.
+
+        Returns:
+            int: The new generation number.
+        """
+        previous = self.read_manifest() or {}
+        generation = previous.get("generation", 0) + 1
+        data = build_artifact(
+            {year: store.year_holidays(year) for year in store.years},
+            source_hashes,
+            source_stamps,
+        )
+        artifact_name = f"holidays-{generation}.bin"
+        temp_path = self.directory / f"{artifact_name}.tmp"
+        temp_path.write_bytes(data)
+        temp_path.replace(self.directory / artifact_name)
+
+        manifest = {
+            "generation": generation,
+            "artifact": artifact_name,
+            "published": datetime.now(timezone.utc).isoformat(),
+            "versions": {str(year): store.version(year) for year in store.years},
+            "modified": {
+                str(year): store.last_modified(year).isoformat() for year in store.years
+            },
+        }
+        temp_path = self.manifest_path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        temp_path.replace(self.manifest_path)
+        logger.info("Published holiday data generation %s", generation)
+        self._remove_old(generation)
+        return generation
+
+    def _remove_old(self, generation: int):
+        for path in self.directory.glob("holidays-*.bin"):
+            number = path.stem.partition("-")[2]
+            if number.isdigit() and int(number) <= generation - self.keep:
+                # Processes still mapping it keep their pages until they switch
+                path.unlink(missing_ok=True)
+
+    def update(
+        self,
+        paths: Mapping[int, Path],
+        load: Callable[[Dict[int, Path]], HolidayStore],
+    ) -> bool:
+        """
+        Publish the given data files unless the current generation matches.
+
+        Args:
+            paths (Mapping[int, Path]): Year to data file.
+            load (Callable): Builds a HolidayStore from the data files.
+
+        Returns:
+            bool: Whether a new generation was published.
+        """
+        with self.lock():
+            if self.is_current(paths):
+                return False
+            # Stamp and hash before loading: a file changing in between then
+            # only causes another update
+            source_stamps = {year: file_stamp(path) for year, path in paths.items()}
+            source_hashes = {year: file_sha256(path) for year, path in paths.items()}
+            self.publish(load(dict(paths)), source_hashes, source_stamps)
+            return True
+
+    def attach(self) -> Optional[ArtifactStore]:
+        """
+        Open the current generation unless it is the one already attached.
+
+        The manifest is only read when its file changed, so calling this on
+        every poll costs one stat.
+
+        Returns:
+            Optional[ArtifactStore]: The new generation, or None if there is
+                no newer one.
+
+        Raises:
+            ArtifactError: If the generation's artifact can't be read.
+        """
+        try:
+            stat = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if stamp == self._stamp:
+            return None
+        manifest = self.read_manifest()
+        if manifest is None:
+            return None
+        if manifest["generation"] == self.generation:
+            self._stamp = stamp
+            return None
+        try:
+            artifact = HolidayArtifact(self.directory / manifest["artifact"])
+        except FileNotFoundError as exc:
+            raise ArtifactError(
+                f"Artifact of generation {manifest['generation']} is missing"
+            ) from exc
+        store = ArtifactStore(
+            artifact,
+            {int(year): version for year, version in manifest["versions"].items()},
+            {
+                int(year): datetime.fromisoformat(moment)
+                for year, moment in manifest["modified"].items()
+            },
+        )
+        self.generation = manifest["generation"]
+        self._stamp = stamp
+        return store
@@ -0,0 +1,416 @@
+"""
+In-memory holiday store
+
+Parses the yearly JSON data files once and answers date lookups from memory.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+import hashlib
+import json
+import logging
+
+if TYPE_CHECKING:
+    from .business_days import BusinessCalendar
+
+logger = logging.getLogger(__name__)
+
+
+class Holiday:
+    """
+    A single holiday entry with every derived field computed once.
+
+    Dates are parsed at construction time and kept both as `date` objects and
+    as ordinals/ISO strings, so request handlers only do integer comparisons
+    and never re-parse or re-format dates.
+    """
+
+    __slots__ = (
+        "uid",
+        "summary",
+        "categories",
+        "category_keys",
+        "start",
+        "end",
+        "start_ordinal",
+        "end_ordinal",
+        "start_iso",
+        "end_iso",
+    )
+
+    def __init__(
+        self,
+        uid: Optional[str],
+        summary: Optional[str],
+        categories: Iterable[str],
+        start: date,
+        end: date,
+    ):
+        self.uid = uid
+        self.summary = summary
+        self.categories: Tuple[str, ...] = tuple(categories)
+        # Lower-cased categories for case-insensitive type filtering
+        self.category_keys = frozenset(cat.lower() for cat in self.categories)
+        self.start = start
+        self.end = end
+        self.start_ordinal = start.toordinal()
+        self.end_ordinal = end.toordinal()
+        self.start_iso = start.isoformat()
+        self.end_iso = end.isoformat()
+
+    @classmethod
+    def from_dict(cls, entry: dict) -> "Holiday":
+        """
+        Build a holiday from a raw JSON entry.
+
+        Args:
+            entry (dict): Holiday entry as stored in `json/{year}.json`.
+
+        Returns:
+            Holiday: The parsed holiday.
+
+        Raises:
+            KeyError: If the start or end date is missing.
+            ValueError: If the start or end date is not an ISO date.
+        """
+        return cls(
+            uid=entry.get("uid"),
+            summary=entry.get("summary"),
+            categories=entry.get("categories") or (),
+            start=date.fromisoformat(entry["start"]),
+            end=date.fromisoformat(entry["end"]),
+        )
+
+    def to_dict(self) -> dict:
+        """Return the holiday in the same shape as the JSON data files"""
+        return {
+            "uid": self.uid,
+            "summary": self.summary,
+            "categories": list(self.categories),
+            "start": self.start_iso,
+            "end": self.end_iso,
+        }
+
+    def covers(self, ordinal: int) -> bool:
+        """Return whether the given date ordinal falls within the holiday"""
+        return self.start_ordinal <= ordinal < self.end_ordinal
+
+    def _key(self) -> tuple:
+        return (self.uid, self.summary, self.categories, self.start, self.end)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Holiday):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"Holiday(uid={self.uid!r}, summary={self.summary!r}, "
+            f"categories={self.categories!r}, start={self.start!r}, end={self.end!r})"
+        )
+
+
+def dataset_version(holidays: Iterable[Holiday]) -> str:
+    """Return a content hash identifying a year's holiday data"""
+    payload = json.dumps(
+        [holiday.to_dict() for holiday in holidays],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def data_file_paths(
+    data_dir: Path, years: Optional[Iterable[int]] = None
+) -> Dict[int, Path]:
+    """
+    Return the resolved data file of each year that has one.
+
+    Paths are resolved once and must stay inside `data_dir`, so later reads
+    don't need to re-validate them.
+
+    Args:
+        data_dir (Path): Directory holding the yearly JSON files.
+        years (Optional[Iterable[int]]): Years to look for. By default every
+            `{year}.json` file in the directory is used.
+
+    Returns:
+        Dict[int, Path]: Year to absolute file path, for existing files only.
+    """
+    base_dir = Path(data_dir).resolve()
+    if years is None:
+        years = sorted(
+            int(path.stem)
+            for path in base_dir.glob("*.json")
+            if path.stem.isdigit() and len(path.stem) == 4
+        )
+    paths = {}
+    for year in years:
+        resolved_path = (base_dir / f"{year}.json").resolve()
+        if resolved_path.parent != base_dir:
+            logger.warning("Invalid file path for year %s: %s", year, resolved_path)
+            continue
+        if resolved_path.is_file():
+            paths[year] = resolved_path
+    return paths
+
+
+def read_data_file(file_path: Path) -> Tuple[list, Tuple[Holiday, ...]]:
+    """
+    Read and parse one yearly data file (blocking, run it in a thread).
+
+    Returns:
+        Tuple[list, Tuple[Holiday, ...]]: Raw JSON entries and parsed holidays.
+
+    Raises:
+        OSError: If the file can't be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        entries = json.load(file)
+    return entries, parse_holidays(entries)
+
+
+def parse_holidays(entries: Iterable[dict]) -> Tuple[Holiday, ...]:
+    """Parse raw JSON entries into holidays, skipping invalid entries"""
+    holidays = []
+    for entry in entries:
+        try:
+            holidays.append(Holiday.from_dict(entry))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("Invalid holiday entry detected: %s", entry)
+    return tuple(holidays)
+
+
+class HolidayStore:
+    """
+    Immutable in-memory index of holiday data.
+
+    Holidays are kept per year sorted by start date (file order for ties),
+    and every day covered by a holiday (start inclusive, end exclusive) is
+    indexed by its ordinal so a date lookup is a single dict access. Month
+    listings use a binary search over the sorted start ordinals, and all
+    years are also merged into one start-sorted interval index for range
+    queries that cross year boundaries. Each year
+    also carries a content hash (`version`) so derived caches can tell when
+    its data changed. Use `with_year` to get a new store with an extra year
+    instead of mutating a shared instance.
+    """
+
+    def __init__(
+        self,
+        years: Optional[Mapping[int, Iterable[Holiday]]] = None,
+        modified: Optional[Mapping[int, datetime]] = None,
+    ):
+        self._years: Mapping[int, Tuple[Holiday, ...]] = MappingProxyType(
+            {
+                year: tuple(sorted(holidays, key=lambda h: h.start_ordinal))
+                for year, holidays in (years or {}).items()
+            }
+        )
+        self._versions: Mapping[int, str] = MappingProxyType(
+            {year: dataset_version(holidays) for year, holidays in self._years.items()}
+        )
+        # When each year's data last changed (file mtime or time of loading)
+        now = datetime.now(timezone.utc)
+        self._modified: Mapping[int, datetime] = MappingProxyType(
+            {year: (modified or {}).get(year, now) for year in self._years}
+        )
+        self._starts: Mapping[int, Tuple[int, ...]] = MappingProxyType(
+            {
+                year: tuple(holiday.start_ordinal for holiday in holidays)
+                for year, holidays in self._years.items()
+            }
+        )
+
+        # Interval index: every holiday sorted by start, plus the longest
+        # duration, which bounds how far back an overlapping holiday can start
+        self._all: Tuple[Holiday, ...] = tuple(
+            sorted(
+                (holiday for holidays in self._years.values() for holiday in holidays),
+                key=lambda h: h.start_ordinal,
+            )
+        )
+        self._all_starts: Tuple[int, ...] = tuple(h.start_ordinal for h in self._all)
+        self._max_span = max(
+            (h.end_ordinal - h.start_ordinal for h in self._all), default=0
+        )
+
+        by_ordinal: Dict[int, List[Holiday]] = {}
+        for holidays in self._years.values():
+            for holiday in holidays:
+                for ordinal in range(holiday.start_ordinal, holiday.end_ordinal):
+                    by_ordinal.setdefault(ordinal, []).append(holiday)
+        self._by_ordinal: Mapping[int, Tuple[Holiday, ...]] = MappingProxyType(
+            {ordinal: tuple(matches) for ordinal, matches in by_ordinal.items()}
+        )
+
+        self._category_keys = frozenset(
+            key
+            for holidays in self._years.values()
+            for holiday in holidays
+            for key in holiday.category_keys
+        )
+        # Business calendars built on demand, one per category selection
+        self._business_calendars: Dict[Optional[frozenset], "BusinessCalendar"] = {}
+
+    @classmethod
+    def load(cls, data_dir: Path, years: Iterable[int]) -> "HolidayStore":
+        """
+        Load the given years from `data_dir/{year}.json`.
+
+        Missing or unreadable files are logged and left out of the store, so
+        callers can still fall back to their own error handling for them.
+
+        Args:
+            data_dir (Path): Directory holding the yearly JSON files.
+            years (Iterable[int]): Years to load.
+
+        Returns:
+            HolidayStore: The populated store.
+        """
+        loaded = {}
+        modified = {}
+        for year in years:
+            file_path = Path(data_dir) / f"{year}.json"
+            try:
+                with open(file_path, "r", encoding="utf-8") as file:
+                    loaded[year] = parse_holidays(json.load(file))
+                modified[year] = datetime.fromtimestamp(
+                    file_path.stat().st_mtime, tz=timezone.utc
+                )
+            except FileNotFoundError:
+                logger.warning("Data file not found for year %s", year)
+            except (json.JSONDecodeError, TypeError):
+                logger.error("Invalid JSON format in file for year %s", year)
+        logger.info("Loaded holiday data for years: %s", sorted(loaded))
+        return cls(loaded, modified)
+
+    @property
+    def years(self) -> Tuple[int, ...]:
+        """Years available in the store, in ascending order"""
+        return tuple(sorted(self._years))
+
+    @property
+    def category_keys(self) -> FrozenSet[str]:
+        """Lower-cased categories of the loaded holidays"""
+        return self._category_keys
+
+    def has_year(self, year: int) -> bool:
+        """Return whether data for the given year is loaded"""
+        return year in self._years
+
+    def version(self, year: int) -> Optional[str]:
+        """Return the content hash of a year's data (None if not loaded)"""
+        return self._versions.get(year)
+
+    def last_modified(self, year: int) -> Optional[datetime]:
+        """Return when a year's data last changed (None if not loaded)"""
+        return self._modified.get(year)
+
+    def year_holidays(
+        self, year: int, month: Optional[int] = None
+    ) -> Tuple[Holiday, ...]:
+        """
+        Return the holidays of a year sorted by start date.
+
+        Args:
+            year (int): Year to list.
+            month (Optional[int]): Only return holidays starting in this month.
+
+        Returns:
+            Tuple[Holiday, ...]: Matching holidays (empty if the year is not loaded).
+        """
+        holidays = self._years.get(year, ())
+        if not month or not holidays:
+            return holidays
+
+        starts = self._starts[year]
+        first = date(year, month, 1).toordinal()
+        after = (
+            date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        ).toordinal()
+        return holidays[bisect_left(starts, first) : bisect_left(starts, after)]
+
+    def holidays_on(self, day: date) -> Tuple[Holiday, ...]:
+        """Return the holidays that cover the given date"""
+        return self._by_ordinal.get(day.toordinal(), ())
+
+    def holidays_on_many(self, days: Iterable[date]) -> List[Tuple[Holiday, ...]]:
+        """Return the holidays covering each of the given dates, in order"""
+        lookup = self._by_ordinal.get
+        return [lookup(day.toordinal(), ()) for day in days]
+
+    def holidays_between(self, start: date, end: date) -> Tuple[Holiday, ...]:
+        """
+        Return the holidays overlapping an inclusive date range, across years.
+
+        Args:
+            start (date): First day of the range.
+            end (date): Last day of the range.
+
+        Returns:
+            Tuple[Holiday, ...]: Overlapping holidays sorted by start date.
+        """
+        first = start.toordinal()
+        last = end.toordinal()
+        if last < first:
+            return ()
+        # Only holidays starting within max_span days before the range can
+        # still be running when it begins
+        lo = bisect_left(self._all_starts, first - self._max_span + 1)
+        hi = bisect_right(self._all_starts, last)
+        return tuple(h for h in self._all[lo:hi] if h.end_ordinal > first)
+
+    def business_calendar(
+        self, categories: Optional[Iterable[str]] = None
+    ) -> "BusinessCalendar":
+        """
+        Return the working day calendar for a selection of holiday categories.
+
+        Args:
+            categories (Optional[Iterable[str]]): Holiday categories that make a
+                day non-working (case-insensitive). None means every holiday.
+
+        Returns:
+            BusinessCalendar: Calendar built once and reused for this store.
+        """
+        from .business_days import (  # pylint: disable=import-outside-toplevel
+            BusinessCalendar,
+            normalize_categories,
+        )
+
+        key = normalize_categories(categories)
+        if key is not None:
+            # Unknown categories match nothing, so they don't need their own entry
+            key = key & self._category_keys
+        calendar = self._business_calendars.get(key)
+        if calendar is None:
+            calendar = BusinessCalendar(self, key)
+            self._business_calendars[key] = calendar
+        return calendar
+
+    def with_year(self, year: int, holidays: Iterable[Holiday]) -> "HolidayStore":
+        """Return a new store with the given year added or replaced"""
+        years = dict(self._years)
+        years[year] = tuple(holidays)
+        modified = {y: m for y, m in self._modified.items() if y != year}
+        return HolidayStore(years, modified)
@@ -0,0 +1,143 @@
+"""
+Usage accounting
+
+Accumulates per API key hourly request counts in memory and writes them to
+Redis in batches, keeping usage logging off the request path.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Usage counters are kept in Redis for 30 days
+USAGE_TTL_SECONDS = 86400 * 30
+
+
+def usage_counter_key(key_hash: str, hour_bucket: int) -> str:
+    """Return the Redis key of a usage counter (ex: usage:<hash16>:2025112814)"""
+    hour = datetime.fromtimestamp(hour_bucket * 3600, tz=timezone.utc)
+    return f"usage:{key_hash[:16]}:{hour:%Y%m%d%H}"
+
+
+class UsageRecorder:
+    """
+    In-memory usage counters flushed to Redis in one pipeline.
+
+    `record` is a plain dict increment. `run` flushes every `interval`
+    seconds, or sooner once `flush_threshold` increments are pending. Counts
+    from a failed flush are merged back and retried on the next one. At most
+    `max_pending_keys` distinct counters are held (ex: while Redis is down);
+    increments of further counters are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        flush_threshold: int = 500,
+        max_pending_keys: int = 100000,
+        ttl: int = USAGE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.flush_threshold = flush_threshold
+        self.max_pending_keys = max_pending_keys
+        self.ttl = ttl
+        self._clock = clock
+        self._pending: Counter = Counter()
+        self._pending_increments = 0
+        self._wake = asyncio.Event()
+        # Flush statistics
+        self.flushes = 0
+        self.flushed_increments = 0
+        self.failed_flushes = 0
+        self.dropped_increments = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of increments waiting to be flushed"""
+        return self._pending_increments
+
+    def record(self, key_hash: str):
+        """Count one request for the given API key hash"""
+        counter = (key_hash[:16], int(self._clock() // 3600))
+        if counter not in self._pending and len(self._pending) >= self.max_pending_keys:
+            self.dropped_increments += 1
+            return
+        self._pending[counter] += 1
+        self._pending_increments += 1
+        if self._pending_increments >= self.flush_threshold:
+            self._wake.set()
+
+    async def flush(self, client: Optional[Any]) -> int:
+        """
+        Write all pending counters to Redis in a single pipeline.
+
+        Args:
+            client: Async Redis client, or None to keep counting in memory.
+
+        Returns:
+            int: Number of increments written.
+        """
+        if not client or not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, Counter()
+        increments, self._pending_increments = self._pending_increments, 0
+        try:
+            pipe = client.pipeline(transaction=False)
+            for (key_hash, hour_bucket), count in batch.items():
+                counter_key = usage_counter_key(key_hash, hour_bucket)
+                pipe.incrby(counter_key, count)
+                pipe.expire(counter_key, self.ttl)
+            await pipe.execute()
+        except Exception:  # pylint: disable=broad-except
+            logger.error("Failed to flush %s usage increments", increments)
+            self.failed_flushes += 1
+            self._restore(batch)
+            return 0
+
+        self.flushes += 1
+        self.flushed_increments += increments
+        return increments
+
+    def _restore(self, batch: Counter):
+        """Merge counts from a failed flush back into the pending counters"""
+        for counter, count in batch.items():
+            if counter in self._pending or len(self._pending) < self.max_pending_keys:
+                self._pending[counter] += count
+                self._pending_increments += count
+            else:
+                self.dropped_increments += count
+        if self.dropped_increments:
+            logger.warning(
+                "Dropped %s usage increments so far", self.dropped_increments
+            )
+
+    async def run(self, get_client: Callable[[], Optional[Any]], interval: float):
+        """
+        Flush periodically until cancelled.
+
+        Args:
+            get_client (Callable): Returns the current Redis client (or None).
+            interval (float): Maximum seconds between flushes.
+        """
+        # Created here so the event belongs to the running loop
+        self._wake = asyncio.Event()
+        while True:
+            if get_client() is None:
+                # Nothing can be flushed, so don't wake up on every request
+                # once the threshold is reached
+                await asyncio.sleep(interval)
+            else:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._wake.clear()
+            await self.flush(get_client())
@@ -0,0 +1,116 @@
+"""
+Shared fixtures for the unit tests.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import os
+import shutil
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+# The converter scripts import each other as top-level modules
+sys.path.insert(0, str(REPO_ROOT / "converters"))
+
+from benchmarks.fakes import (  # noqa: E402
+    BENCH_API_KEY,
+    FALLBACK_API_KEY,
+    install_fake_redis,
+    key_hash,
+)
+from srilanka_holidays.store import Holiday, HolidayStore  # noqa: E402
+
+
+def make_holiday(uid, start, days=1, categories=("Public", "Bank")):
+    """Build a holiday starting on `start` and lasting `days` days"""
+    return Holiday(
+        uid=uid,
+        summary=f"Holiday {uid}",
+        categories=categories,
+        start=start,
+        end=date.fromordinal(start.toordinal() + days),
+    )
+
+
+@pytest.fixture
+def holiday():
+    """The `make_holiday` helper"""
+    return make_holiday
+
+
+@pytest.fixture
+def store():
+    """Two years of made-up holidays"""
+    return HolidayStore(
+        {
+            2025: (
+                make_holiday("a", date(2025, 1, 14)),
+                make_holiday("b", date(2025, 4, 14), categories=("Mercantile",)),
+                make_holiday("c", date(2025, 12, 25)),
+            ),
+            2026: (
+                make_holiday("d", date(2026, 1, 1), categories=("Bank",)),
+                make_holiday("e", date(2026, 12, 31)),
+            ),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def app_module():
+    """The API module, imported once with test settings"""
+    # The API reads data files relative to the working directory
+    os.chdir(REPO_ROOT)
+    os.environ.update(
+        API_KEYS=key_hash(FALLBACK_API_KEY),
+        ACCESS_LOG="false",
+        LOG_LEVEL="WARNING",
+        DATA_RELOAD_SECONDS="0",
+    )
+    import app  # pylint: disable=import-outside-toplevel
+
+    return app
+
+
+@pytest.fixture
+def redis(app_module):
+    """FakeRedis the API connects to at startup"""
+    app_module.REDIS_BREAKER.record_success()
+    app_module.RESPONSE_CACHE.invalidate()
+    return install_fake_redis(app_module)
+
+
+@pytest.fixture
+def client(app_module, redis):
+    """TestClient sending a valid API key, with the lifespan running"""
+    # pylint: disable=import-outside-toplevel
+    from fastapi.testclient import TestClient
+
+    with TestClient(app_module.app, headers={"X-API-Key": BENCH_API_KEY}) as client:
+        yield client
+
+
+@pytest.fixture
+def data_dir(app_module, tmp_path, monkeypatch):
+    """Copy of the data files the API loads instead of json/ (request it
+    before `client`); the loaded data is restored afterwards"""
+    # pylint: disable=import-outside-toplevel
+    from srilanka_holidays.reload import DataWatcher
+
+    directory = tmp_path / "json"
+    shutil.copytree(REPO_ROOT / "json", directory)
+    monkeypatch.setattr(app_module.CALENDAR, "store", app_module.CALENDAR.store)
+    for name in ("DATA_FILES", "YEAR_MIN", "YEAR_MAX", "DATA_VERSION_SEEN"):
+        monkeypatch.setattr(app_module, name, getattr(app_module, name))
+    monkeypatch.setattr(app_module, "DATA_DIR", directory)
+    monkeypatch.setattr(app_module, "DATA_WATCHER", DataWatcher(directory))
+    monkeypatch.setattr(app_module, "DATA_ARTIFACT", tmp_path / "missing.bin")
+    return directory
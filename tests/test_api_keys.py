@@ -0,0 +1,62 @@
+"""
+Tests for the in-process API key index.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from srilanka_holidays.api_keys import ApiKeyIndex, TTLCache
+
+
+class Clock:
+    """Settable clock"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts():
+    clock = Clock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    # "b" is now the least recently used entry
+    cache.set("c", 3)
+    assert cache.get("b") is None and len(cache) == 2
+    clock.now += 10
+    assert cache.get("a", "gone") == "gone"
+
+
+def test_replace_indexes_records_by_hash():
+    clock = Clock()
+    index = ApiKeyIndex(clock=clock)
+    assert not index.loaded and index.age() == float("inf")
+    index.replace(
+        [{"hash": "h1", "active": True}, {"hash": 5}, "junk", {"hash": "h2"}], "v1"
+    )
+    assert len(index) == 2
+    assert index.get("h1") == {"hash": "h1", "active": True}
+    assert index.get("missing") is None
+    assert index.version == "v1" and index.loaded
+    clock.now += 5
+    assert index.age() == 5
+
+
+def test_negative_cache_is_cleared_on_reload():
+    clock = Clock()
+    index = ApiKeyIndex(negative_ttl=30, clock=clock)
+    index.mark_invalid("h3")
+    assert index.is_known_invalid("h3")
+    clock.now += 30
+    assert not index.is_known_invalid("h3")
+
+    index.mark_invalid("h3")
+    index.replace([{"hash": "h3"}], "v2")
+    assert not index.is_known_invalid("h3")
+    assert index.get("h3") == {"hash": "h3"}
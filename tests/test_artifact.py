@@ -0,0 +1,143 @@
+"""
+Tests for the binary data artifact.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+from datetime import date
+import os
+
+import pytest
+
+from srilanka_holidays.artifact import (
+    ArtifactError,
+    HolidayArtifact,
+    build_artifact,
+    file_sha256,
+    file_stamp,
+    write_artifact,
+)
+from srilanka_holidays.store import dataset_version
+
+
+def open_artifact(tmp_path, years):
+    path = tmp_path / "holidays.bin"
+    write_artifact(years, path, {year: bytes([year % 256]) * 32 for year in years})
+    return HolidayArtifact(path)
+
+
+def test_round_trip(tmp_path, store):
+    years = {year: store.year_holidays(year) for year in store.years}
+    with open_artifact(tmp_path, years) as artifact:
+        assert artifact.years == store.years
+        for year in store.years:
+            assert artifact.year_holidays(year) == store.year_holidays(year)
+            assert artifact.source_hash(year) == bytes([year % 256]) * 32
+            assert artifact.source_stamp(year) is None
+            assert artifact.year_version(year) == store.version(year)
+        for ordinal in range(
+            date(2025, 1, 1).toordinal(), date(2027, 1, 1).toordinal()
+        ):
+            day = date.fromordinal(ordinal)
+            assert artifact.holidays_on(day) == store.holidays_on(day)
+        start, end = date(2025, 12, 1), date(2026, 1, 31)
+        assert artifact.holidays_between(start, end) == store.holidays_between(
+            start, end
+        )
+        assert artifact.to_store().year_holidays(2025) == store.year_holidays(2025)
+
+
+def test_category_order_is_kept_per_holiday(tmp_path, holiday):
+    # A later holiday inserts a category between ones seen before
+    holidays = (
+        holiday("a", date(2025, 1, 13), categories=("Public", "Bank", "Poya")),
+        holiday(
+            "b",
+            date(2025, 5, 12),
+            categories=("Public", "Bank", "Mercantile", "Poya"),
+        ),
+        holiday("c", date(2025, 6, 10), categories=("Poya", "Public")),
+        holiday("d", date(2025, 7, 10), categories=()),
+    )
+    with open_artifact(tmp_path, {2025: holidays}) as artifact:
+        assert [h.categories for h in artifact.year_holidays(2025)] == [
+            h.categories for h in holidays
+        ]
+        assert artifact.categories == ("Public", "Bank", "Poya", "Mercantile")
+
+
+def test_multi_day_holidays_and_missing_strings(tmp_path, holiday):
+    long_holiday = holiday("long", date(2025, 12, 30), days=5)
+    untitled = holiday(None, date(2026, 1, 2))
+    untitled.summary = None
+    years = {2025: (long_holiday,), 2026: (untitled,)}
+    with open_artifact(tmp_path, years) as artifact:
+        assert artifact.holidays_on(date(2026, 1, 2)) == (long_holiday, untitled)
+        assert artifact.holidays_on(date(2026, 1, 4)) == ()
+        assert artifact.year_holidays(2026)[0].uid is None
+
+
+def test_matches_source_files(tmp_path, store):
+    data_file = tmp_path / "2025.json"
+    data_file.write_text("[]", encoding="utf-8")
+    path = tmp_path / "holidays.bin"
+    write_artifact({2025: ()}, path, {2025: file_sha256(data_file)})
+    with HolidayArtifact(path) as artifact:
+        assert artifact.year_version(2025) == dataset_version(())
+        assert artifact.matches({2025: data_file})
+        data_file.write_text("[ ]", encoding="utf-8")
+        assert not artifact.matches({2025: data_file})
+        assert not artifact.matches({})
+        assert not artifact.matches({2025: tmp_path / "missing.json"})
+
+
+def test_matches_unchanged_files_without_reading_them(tmp_path, monkeypatch):
+    data_file = tmp_path / "2025.json"
+    data_file.write_text("[]", encoding="utf-8")
+    path = tmp_path / "holidays.bin"
+    stamp = file_stamp(data_file)
+    write_artifact({2025: ()}, path, {2025: file_sha256(data_file)}, {2025: stamp})
+    hashed = []
+
+    def sha256(file_path):
+        hashed.append(file_path)
+        return file_sha256(file_path)
+
+    monkeypatch.setattr("srilanka_holidays.artifact.file_sha256", sha256)
+    with HolidayArtifact(path) as artifact:
+        assert artifact.source_stamp(2025) == stamp
+        assert artifact.matches({2025: data_file})
+        assert not hashed
+
+        # Same size, new mtime (ex: a fresh checkout): compared by content
+        os.utime(data_file, ns=(stamp[0], stamp[0] + 10**9))
+        assert artifact.matches({2025: data_file})
+        assert hashed == [data_file]
+        data_file.write_text("{}", encoding="utf-8")
+        assert not artifact.matches({2025: data_file})
+
+        # A different size can't be the same file
+        hashed.clear()
+        data_file.write_text("[ ]", encoding="utf-8")
+        assert not artifact.matches({2025: data_file})
+        assert not hashed
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: b"XXXX" + data[4:],
+        lambda data: data[:4] + b"\x63\x00" + data[6:],
+        lambda data: data[:100],
+    ],
+    ids=["magic", "version", "truncated"],
+)
+def test_invalid_files_are_rejected(tmp_path, store, corrupt):
+    data = build_artifact({2025: store.year_holidays(2025)})
+    path = tmp_path / "holidays.bin"
+    path.write_bytes(corrupt(data))
+    with pytest.raises(ArtifactError):
+        HolidayArtifact(path)
@@ -0,0 +1,99 @@
+"""
+Tests for the batch holiday lookup endpoints.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+URL = "/api/v1/check_holidays"
+
+
+def _day(n):
+    """ISO date of the n-th day from 2025-01-01 (1-based)"""
+    return (date(2025, 1, 1) + timedelta(days=n - 1)).isoformat()
+
+
+def test_get_and_post_agree(client):
+    query = client.get(
+        URL,
+        params={"dates": "2025-02-04,2025-02-05", "ranges": "2025-04-12..2025-04-14"},
+    )
+    body = client.post(
+        URL,
+        json={
+            "dates": ["2025-02-04", "2025-02-05"],
+            "ranges": [{"start": "2025-04-12", "end": "2025-04-14"}],
+        },
+    )
+    assert query.status_code == body.status_code == 200
+    assert query.content == body.content
+    result = query.json()
+    assert result["count"] == 5
+    assert [entry["date"] for entry in result["results"]] == [
+        "2025-02-04",
+        "2025-02-05",
+        "2025-04-12",
+        "2025-04-13",
+        "2025-04-14",
+    ]
+    assert result["results"][0]["is_holiday"] is True
+    assert result["results"][1] == {"date": "2025-02-05", "is_holiday": False}
+
+
+def test_years_without_data_are_reported_per_date(client):
+    result = client.get(URL, params={"dates": "1999-01-01,2025-01-01"}).json()
+    assert result["results"][0] == {
+        "date": "1999-01-01",
+        "error": "Data for requested year not available",
+    }
+    assert "is_holiday" in result["results"][1]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"dates": "2025-02-30"},
+        {"ranges": "2025-01-01"},
+        {"ranges": "2025-01-10..2025-01-01"},
+    ],
+)
+def test_invalid_batches_are_rejected(client, params):
+    assert client.get(URL, params=params).status_code == 400
+
+
+def test_batch_size_limit(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "BATCH_MAX_DATES", 10)
+    ten = {"dates": "2025-01-01", "ranges": "2025-01-02..2025-01-10"}
+    assert client.get(URL, params=ten).status_code == 200
+    over = client.post(
+        URL,
+        json={
+            "dates": ["2025-01-01"],
+            "ranges": [{"start": "2025-01-02", "end": "2025-01-11"}],
+        },
+    )
+    assert over.status_code == 400
+    assert over.json() == {
+        "error": "Too many dates requested. Maximum batch size is 10"
+    }
+
+
+@pytest.mark.parametrize("days", [0, 1, 499, 500, 501, 1200])
+def test_stream_threshold_and_chunked_body(client, app_module, monkeypatch, days):
+    monkeypatch.setattr(app_module, "BATCH_STREAM_THRESHOLD", 500)
+    ranges = f"2025-01-01..{_day(days)}" if days else None
+    response = client.get(URL, params={"ranges": ranges})
+    assert response.status_code == 200
+    streamed = days > 500
+    assert ("content-length" not in response.headers) is streamed
+    result = json.loads(response.content)
+    assert result["count"] == len(result["results"]) == days
+    if days:
+        assert result["results"][-1]["date"] == _day(days)
@@ -0,0 +1,67 @@
+"""
+Tests for the working day calendar.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+from datetime import date
+
+import pytest
+
+from srilanka_holidays.business_days import BusinessCalendar, CoverageError
+
+
+def test_next_and_previous_skip_weekends_and_holidays(store):
+    calendar = BusinessCalendar(store)
+    # Friday 2025-04-11 -> Monday 14 is a holiday -> Tuesday 15
+    assert calendar.next_working_day(date(2025, 4, 11)) == date(2025, 4, 15)
+    assert calendar.previous_working_day(date(2025, 4, 15)) == date(2025, 4, 11)
+
+
+def test_categories_select_holidays(store):
+    calendar = BusinessCalendar(store, ["public"])
+    # The Mercantile holiday doesn't count for a Public-only calendar
+    assert calendar.is_working_day(date(2025, 4, 14))
+    assert not calendar.is_working_day(date(2025, 1, 14))
+
+
+def test_add_business_days(store):
+    calendar = BusinessCalendar(store)
+    assert calendar.add_business_days(date(2025, 4, 11), 1) == date(2025, 4, 15)
+    assert calendar.add_business_days(date(2025, 4, 15), -1) == date(2025, 4, 11)
+    # Zero days on a holiday moves to the next working day
+    assert calendar.add_business_days(date(2025, 4, 14), 0) == date(2025, 4, 15)
+
+
+def test_between_counts_start_inclusive_end_exclusive(store):
+    calendar = BusinessCalendar(store)
+    # Mon 2025-04-14 (holiday) to Mon 2025-04-21: Tue-Fri
+    assert calendar.business_days_between(date(2025, 4, 14), date(2025, 4, 21)) == 4
+    assert calendar.business_days_between(date(2025, 4, 21), date(2025, 4, 14)) == -4
+    assert calendar.business_days_between(date(2025, 4, 14), date(2025, 4, 14)) == 0
+
+
+def test_between_accepts_end_after_last_covered_day(store):
+    calendar = BusinessCalendar(store)
+    # December 2026 has 23 weekdays, one of them (31st) a holiday
+    assert calendar.business_days_between(date(2026, 12, 1), date(2027, 1, 1)) == 22
+    assert calendar.business_days_between(date(2027, 1, 1), date(2026, 12, 1)) == -22
+
+
+def test_between_rejects_uncovered_days(store):
+    calendar = BusinessCalendar(store)
+    with pytest.raises(CoverageError):
+        calendar.business_days_between(date(2026, 12, 1), date(2027, 1, 2))
+    with pytest.raises(CoverageError):
+        calendar.business_days_between(date(2024, 12, 31), date(2025, 1, 10))
+
+
+def test_results_outside_data_raise(store):
+    calendar = BusinessCalendar(store)
+    with pytest.raises(CoverageError):
+        calendar.previous_working_day(date(2025, 1, 1))
+    with pytest.raises(CoverageError):
+        calendar.next_working_day(date(2024, 6, 1))
@@ -0,0 +1,130 @@
+"""
+Tests for the circuit breaker and the client proxy reporting to it.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import asyncio
+
+import pytest
+from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+
+from benchmarks.fakes import FakeRedis
+from srilanka_holidays.circuit_breaker import BreakerClient, CircuitBreaker
+from srilanka_holidays.usage import UsageRecorder
+
+
+class FailingPipeline:
+    """Awaitable pipeline whose execute fails"""
+
+    def __await__(self):
+        return self._self().__await__()
+
+    async def _self(self):
+        return self
+
+    def incrby(self, key, amount=1):
+        return self
+
+    async def execute(self):
+        raise RedisError("connection lost")
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker("Redis", failure_threshold=2, clock=lambda: 10.0)
+
+
+def test_opens_at_threshold_and_closes_on_success(breaker):
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow() and breaker.state == "open"
+    assert breaker.trips == 1
+    breaker.record_success()
+    assert breaker.allow() and breaker.failures == 0
+
+
+def test_trip_opens_at_once(breaker):
+    breaker.trip()
+    breaker.trip()
+    assert breaker.is_open and breaker.trips == 1
+
+
+def test_probe_closes_breaker(breaker):
+    async def scenario():
+        breaker.trip()
+        task = asyncio.create_task(breaker.run(probe, 0.001))
+        while breaker.is_open:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    async def probe():
+        return True
+
+    asyncio.run(scenario())
+    assert breaker.allow()
+
+
+def test_client_calls_report_outcomes(breaker):
+    client = BreakerClient(FakeRedis(), breaker, (RedisError,))
+    breaker.failures = 1
+    assert asyncio.run(client.set("k", "v"))
+    assert breaker.failures == 0
+    assert client.client.data == {"k": "v"}
+
+
+def test_pipeline_is_proxied_not_awaited(breaker):
+    redis = FakeRedis()
+    client = BreakerClient(redis, breaker, (RedisError,))
+    pipe = client.pipeline(transaction=False)
+    assert isinstance(pipe, BreakerClient)
+    # Chained commands return the proxy, and only execute is awaited
+    assert pipe.incrby("a", 2).expire("a", 60) is pipe
+    breaker.failures = 1
+    assert asyncio.run(pipe.execute()) == [2, True]
+    assert breaker.failures == 0 and redis.data == {"a": 2}
+
+
+def test_pipeline_execute_errors_count_as_failures(breaker):
+    redis = FakeRedis()
+    redis.pipeline = lambda transaction=True: FailingPipeline()
+    client = BreakerClient(redis, breaker, (RedisError,))
+    for _ in range(2):
+        pipe = client.pipeline(transaction=False)
+        pipe.incrby("a")
+        with pytest.raises(RedisError):
+            asyncio.run(pipe.execute())
+    assert breaker.is_open
+
+
+def test_redis_pipeline_without_server(breaker):
+    async def scenario():
+        redis = Redis(host="127.0.0.1", port=1, retry=Retry(NoBackoff(), 0))
+        client = BreakerClient(redis, breaker, (RedisError,))
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.incrby("a", 1)
+            with pytest.raises(RedisError):
+                await pipe.execute()
+        finally:
+            await redis.aclose()
+
+    asyncio.run(scenario())
+    assert breaker.failures == 1
+
+
+def test_usage_flush_through_breaker_client(breaker):
+    redis = FakeRedis()
+    recorder = UsageRecorder(clock=lambda: 1764340200.0)
+    recorder.record("b" * 64)
+    breaker.failures = 1
+    assert asyncio.run(recorder.flush(BreakerClient(redis, breaker, (RedisError,))))
+    assert list(redis.data.values()) == [1]
+    assert breaker.failures == 0
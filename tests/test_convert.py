@@ -0,0 +1,87 @@
+"""
+Tests for the incremental iCalendar conversion.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from convert import MANIFEST_FILE_NAME, convert, file_hash
+
+ICS_DIR = Path(__file__).resolve().parent.parent / "ics"
+
+
+@pytest.fixture
+def sources(tmp_path):
+    ics_dir = tmp_path / "ics"
+    ics_dir.mkdir()
+    paths = []
+    for year in (2025, 2026):
+        shutil.copy(ICS_DIR / f"{year}.ics", ics_dir)
+        paths.append(str(ics_dir / f"{year}.ics"))
+    return paths
+
+
+def output_stamps(output_dir):
+    return {
+        path.relative_to(output_dir): path.stat().st_mtime_ns
+        for path in output_dir.rglob("*")
+        if path.is_file() and path.name != MANIFEST_FILE_NAME
+    }
+
+
+def test_unchanged_sources_are_skipped(tmp_path, sources):
+    output_dir = tmp_path / "out"
+
+    assert convert(sources, output_dir=str(output_dir), workers=1) == sources
+    manifest = json.loads((output_dir / MANIFEST_FILE_NAME).read_text("utf-8"))
+    assert manifest["2025.ics"] == {
+        "sha256": file_hash(sources[0]),
+        "formats": ["csv", "json", "xml"],
+    }
+    stamps = output_stamps(output_dir)
+    assert len(stamps) == 7  # 2 years x 3 formats, plus bin/holidays.bin
+
+    assert convert(sources, output_dir=str(output_dir), workers=1) == []
+    assert output_stamps(output_dir) == stamps
+
+
+def test_changed_and_missing_outputs_are_regenerated(tmp_path, sources):
+    output_dir = tmp_path / "out"
+    convert(sources, output_dir=str(output_dir), workers=1, artifact=False)
+    stamps = output_stamps(output_dir)
+
+    with open(sources[0], "r", encoding="utf-8") as file:
+        text = file.read()
+    with open(sources[0], "w", encoding="utf-8") as file:
+        file.write(text.replace("Duruthu Full Moon Poya Day", "Renamed Poya Day"))
+    assert convert(sources, output_dir=str(output_dir), workers=1) == sources[:1]
+    holidays = json.loads((output_dir / "json" / "2025.json").read_text("utf-8"))
+    assert holidays[0]["summary"] == "Renamed Poya Day"
+    # Only the changed year is rewritten, and the artifact is recompiled
+    changed = {
+        path
+        for path, stamp in output_stamps(output_dir).items()
+        if stamps.get(path) != stamp
+    }
+    assert {path.as_posix() for path in changed} == {
+        "csv/2025.csv",
+        "json/2025.json",
+        "xml/2025.xml",
+        "bin/holidays.bin",
+    }
+
+    (output_dir / "xml" / "2026.xml").unlink()
+    assert convert(sources, output_dir=str(output_dir), workers=1) == sources[1:]
+    assert (output_dir / "xml" / "2026.xml").is_file()
+    # --force converts everything
+    assert convert(sources, output_dir=str(output_dir), workers=1, force=True) == (
+        sources
+    )
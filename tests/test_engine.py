@@ -0,0 +1,106 @@
+"""
+Tests for the embeddable holiday lookup engine.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import json
+from datetime import date
+
+import pytest
+
+import srilanka_holidays
+from srilanka_holidays.artifact import file_sha256, file_stamp, write_artifact
+from srilanka_holidays.business_days import CoverageError
+from srilanka_holidays.engine import HolidayCalendar, load_store
+from srilanka_holidays.shared_data import ArtifactStore
+from srilanka_holidays.store import HolidayStore
+
+
+@pytest.fixture
+def calendar(store):
+    return HolidayCalendar(store)
+
+
+def test_lookups_select_categories(calendar):
+    assert [h.uid for h in calendar.holidays_on(date(2025, 4, 14))] == ["b"]
+    assert calendar.holidays_on(date(2025, 4, 14), ["public"]) == ()
+    assert calendar.is_holiday(date(2025, 1, 14), ["BANK"])
+    assert [h.uid for h in calendar.holidays(2025, categories=["Bank"])] == ["a", "c"]
+    assert [h.uid for h in calendar.holidays(2025, month=12)] == ["c"]
+    between = calendar.holidays_between(date(2025, 12, 1), date(2026, 1, 31))
+    assert [h.uid for h in between] == ["c", "d"]
+
+
+def test_years_without_data_raise(calendar):
+    assert calendar.years == (2025, 2026) and not calendar.has_year(2024)
+    with pytest.raises(CoverageError):
+        calendar.holidays_on(date(2024, 5, 1))
+    with pytest.raises(CoverageError):
+        calendar.holidays(2027)
+    assert calendar.holidays_on_many([date(2024, 5, 1)]) == [()]
+
+
+def test_working_days(calendar):
+    assert not calendar.is_working_day(date(2025, 4, 14))
+    assert calendar.is_working_day(date(2025, 4, 14), ["Public"])
+    assert calendar.next_working_day(date(2025, 4, 11)) == date(2025, 4, 15)
+    assert calendar.previous_working_day(date(2025, 4, 15)) == date(2025, 4, 11)
+    assert calendar.add_business_days(date(2025, 4, 11), 1) == date(2025, 4, 15)
+    assert calendar.business_days_between(date(2025, 4, 11), date(2025, 4, 16)) == 2
+
+
+def test_replacing_the_store(calendar, store):
+    calendar.store = store.with_year(2027, ())
+    assert calendar.years == (2025, 2026, 2027)
+    assert calendar.holidays(2027) == ()
+
+
+def test_load_store_uses_a_matching_artifact(tmp_path, store, monkeypatch):
+    for year in store.years:
+        entries = [h.to_dict() for h in store.year_holidays(year)]
+        (tmp_path / f"{year}.json").write_text(json.dumps(entries), encoding="utf-8")
+    paths = {year: tmp_path / f"{year}.json" for year in store.years}
+    artifact_path = tmp_path / "holidays.bin"
+    write_artifact(
+        {year: store.year_holidays(year) for year in store.years},
+        artifact_path,
+        {year: file_sha256(path) for year, path in paths.items()},
+        {year: file_stamp(path) for year, path in paths.items()},
+    )
+
+    def fail(*args):
+        raise AssertionError("JSON files were read")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(HolidayStore, "load", fail)
+        patch.setattr("srilanka_holidays.artifact.file_sha256", fail)
+        loaded = load_store(tmp_path, artifact_path=artifact_path)
+    # Served from the mapped artifact, with the same versions as the files
+    assert isinstance(loaded, ArtifactStore)
+    assert loaded.year_holidays(2025) == store.year_holidays(2025)
+    assert loaded.version(2026) == store.version(2026)
+
+    # A stale artifact falls back to the JSON files
+    paths[2026].write_text("[]", encoding="utf-8")
+    loaded = load_store(tmp_path, artifact_path=artifact_path)
+    assert loaded.year_holidays(2026) == ()
+    assert load_store(tmp_path, artifact_path=tmp_path / "missing.bin").years == (
+        2025,
+        2026,
+    )
+
+
+def test_bundled_data_loads():
+    calendar = HolidayCalendar.load()
+    assert calendar.years and calendar.holidays(calendar.years[0])
+
+
+def test_package_exports_are_lazy():
+    assert "HolidayCalendar" in dir(srilanka_holidays)
+    assert srilanka_holidays.HolidayCalendar is HolidayCalendar
+    with pytest.raises(AttributeError):
+        getattr(srilanka_holidays, "missing_name")
@@ -0,0 +1,157 @@
+"""
+Tests for the holiday exports and Accept header negotiation.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+from icalendar import Calendar
+
+from srilanka_holidays.exports import CHUNK_SIZE, iter_export, negotiate_format
+from srilanka_holidays.store import Holiday, HolidayStore
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MODIFIED = datetime(2025, 3, 1, 10, 30, 15, tzinfo=timezone.utc)
+
+BROWSER_ACCEPT = (
+    "text/html,application/xhtml+xml,application/xml;q=0.9,"
+    "image/avif,image/webp,*/*;q=0.8"
+)
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, None),
+        ("", None),
+        ("image/png", None),
+        ("*/*", "full"),
+        ("application/*", "full"),
+        ("application/json", "full"),
+        (BROWSER_ACCEPT, "full"),
+        ("text/html,application/xml;q=0.9,*/*;q=0.8", "full"),
+        ("application/xml, */*", "full"),
+        ("text/calendar", "ics"),
+        ("TEXT/CSV; charset=utf-8", "csv"),
+        ("text/xml", "xml"),
+        ("text/calendar, */*;q=0.1", "ics"),
+        ("application/json;q=0.5, text/csv", "csv"),
+        ("application/json, text/csv;q=0.9", "full"),
+        ("text/csv;q=0.4, application/xml;q=0.7", "xml"),
+        ("text/csv, text/calendar", "csv"),
+        ("text/html, text/calendar", "ics"),
+        ("text/html, text/calendar;q=0.9", "full"),
+        ("application/json;q=0, text/csv;q=0.1", "csv"),
+        ("text/calendar;q=0", None),
+        ("text/calendar;q=abc, */*", "full"),
+    ],
+)
+def test_negotiate_format(accept, expected):
+    assert negotiate_format(accept) == expected
+
+
+def render(fmt, holidays, modified=None) -> bytes:
+    return b"".join(iter_export(fmt, holidays, modified))
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xml"])
+def test_exports_match_the_bundled_files(fmt):
+    holidays = HolidayStore.load(REPO_ROOT / "json", [2025]).year_holidays(2025)
+    assert render(fmt, holidays) == (REPO_ROOT / fmt / f"2025.{fmt}").read_bytes()
+
+
+def test_csv_and_xml_escaping(holiday):
+    special = holiday("x&1", date(2025, 5, 1), categories=("Public", "Bank"))
+    special.summary = 'May Day, "Workers\' Day" <& more>'
+
+    assert render("csv", [special]).decode("utf-8").splitlines() == [
+        "UID,Summary,Categories,Start,End",
+        'x&1,"May Day, ""Workers\' Day"" <& more>","Public,Bank",2025-05-01,2025-05-02',
+    ]
+    assert render("xml", [special]).decode("utf-8") == (
+        "<?xml version='1.0' encoding='utf-8'?>\n<CalendarEvents><Event>"
+        '<Summary>May Day, "Workers\' Day" &lt;&amp; more&gt;</Summary>'
+        "<Categories>Public,Bank</Categories>"
+        "<Start>2025-05-01</Start><End>2025-05-02</End></Event></CalendarEvents>"
+    )
+
+
+def test_empty_exports():
+    assert render("csv", []) == b"UID,Summary,Categories,Start,End\r\n"
+    assert render("xml", []) == (
+        b"<?xml version='1.0' encoding='utf-8'?>\n<CalendarEvents></CalendarEvents>"
+    )
+    calendar = Calendar.from_ical(render("ics", []))
+    assert not calendar.walk("VEVENT")
+
+
+def test_ics_feed(holiday):
+    long_name = "Sinhala & Tamil New Year Day; " + "අලුත් අවුරුදු " * 6
+    holidays = [
+        Holiday(
+            "sl_1", long_name, ("Public", "Bank"), date(2025, 4, 13), date(2025, 4, 15)
+        ),
+        holiday("sl_2", date(2025, 12, 31), days=2, categories=("Mercantile",)),
+    ]
+
+    data = render("ics", holidays, MODIFIED)
+
+    lines = data.split(b"\r\n")
+    assert lines[0] == b"BEGIN:VCALENDAR" and lines[-2:] == [b"END:VCALENDAR", b""]
+    # Folded at 75 octets, without splitting a UTF-8 sequence
+    assert all(len(line) <= 75 for line in lines)
+    for line in lines:
+        line.decode("utf-8")
+    events = Calendar.from_ical(data).walk("VEVENT")
+    assert [
+        (
+            str(event["uid"]),
+            str(event["summary"]),
+            str(event["description"]),
+            event.decoded("dtstart"),
+            event.decoded("dtend"),
+            event.decoded("dtstamp"),
+        )
+        for event in events
+    ] == [
+        (
+            "sl_1",
+            long_name,
+            "Public,Bank",
+            date(2025, 4, 13),
+            date(2025, 4, 15),
+            MODIFIED,
+        ),
+        (
+            "sl_2",
+            "Holiday sl_2",
+            "Mercantile",
+            date(2025, 12, 31),
+            date(2026, 1, 2),
+            MODIFIED,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["ics", "csv", "xml"])
+def test_exports_are_chunked(holiday, fmt):
+    holidays = [
+        holiday(f"h{index}", date.fromordinal(date(2025, 1, 1).toordinal() + index))
+        for index in range(CHUNK_SIZE + 1)
+    ]
+    chunks = list(iter_export(fmt, holidays, MODIFIED))
+    # Header and footer chunks (if any) plus two chunks of holidays
+    assert len(chunks) >= 2
+    assert b"".join(chunks) == render(fmt, holidays, MODIFIED)
+    assert b"h100" in chunks[-1] or b"h100" in chunks[-2]
+
+
+def test_unknown_export_format():
+    with pytest.raises(ValueError):
+        iter_export("pdf", [])
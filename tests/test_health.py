@@ -0,0 +1,176 @@
+"""
+Tests for the background health checks.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.fakes import BENCH_API_KEY, FakeRedis, install_fake_redis
+from srilanka_holidays.health import DEGRADED, FAIL, OK, HealthMonitor
+
+
+class Clock:
+    """Settable monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FlakyRedis(FakeRedis):
+    """FakeRedis whose pings fail while `down` is set"""
+
+    def __init__(self, error=ConnectionError):
+        super().__init__()
+        self.error = error
+        self.down = False
+        self.pings = 0
+
+    async def ping(self):
+        self.pings += 1
+        if self.down:
+            raise self.error("connection refused")
+        return True
+
+
+def redis_check(redis):
+    """Redis check of a service that can fall back while Redis is down"""
+
+    async def check():
+        try:
+            await redis.ping()
+        except ConnectionError as exc:
+            return DEGRADED, f"Redis ping failed ({exc})"
+        return OK, None
+
+    return check
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_transitions(clock):
+    redis = FlakyRedis()
+    data_ok = [True]
+
+    async def data_check():
+        return (OK, None) if data_ok[0] else (FAIL, "canary lookup failed")
+
+    monitor = HealthMonitor(
+        {"redis": redis_check(redis), "data": data_check}, max_age=30, clock=clock
+    )
+    # Unready until the checks have run once
+    assert monitor.status == FAIL and not monitor.is_ready()
+
+    assert asyncio.run(monitor.check()) == OK
+    assert monitor.is_ready()
+
+    redis.down = True
+    assert asyncio.run(monitor.check()) == DEGRADED
+    assert monitor.is_ready()
+    assert monitor.results["redis"].detail == "Redis ping failed (connection refused)"
+
+    data_ok[0] = False
+    assert asyncio.run(monitor.check()) == FAIL
+    assert not monitor.is_ready()
+
+    redis.down = False
+    data_ok[0] = True
+    assert asyncio.run(monitor.check()) == OK
+    assert monitor.is_ready()
+    assert redis.pings == 4
+
+
+def test_stale_results_fail(clock):
+    monitor = HealthMonitor(
+        {"redis": redis_check(FlakyRedis())}, max_age=30, clock=clock
+    )
+    asyncio.run(monitor.check())
+
+    clock.now += 30
+    assert monitor.status == OK
+    clock.now += 1
+    assert monitor.status == FAIL
+    assert monitor.snapshot()["age_seconds"] == 31
+
+
+def test_raising_slow_and_invalid_checks_fail(clock):
+    async def broken():
+        raise RuntimeError("boom")
+
+    async def slow():
+        await asyncio.sleep(1)
+        return OK, None
+
+    async def unknown():
+        return "fine", None
+
+    monitor = HealthMonitor(
+        {"broken": broken, "slow": slow, "unknown": unknown}, timeout=0.01, clock=clock
+    )
+    assert asyncio.run(monitor.check()) == FAIL
+    details = {name: result.detail for name, result in monitor.results.items()}
+    assert details == {
+        "broken": "RuntimeError: boom",
+        "slow": "Timed out after 0.01s",
+        "unknown": "Unknown status 'fine'",
+    }
+    assert all(result.status == FAIL for result in monitor.results.values())
+
+
+def test_concurrent_checks_share_one_run(clock):
+    redis = FlakyRedis()
+    monitor = HealthMonitor({"redis": redis_check(redis)}, clock=clock)
+
+    async def check_twice():
+        return await asyncio.gather(monitor.check(), monitor.check())
+
+    assert asyncio.run(check_twice()) == [OK, OK]
+    assert redis.pings == 1
+
+
+@pytest.fixture
+def flaky_redis(app_module):
+    app_module.REDIS_BREAKER.record_success()
+    yield install_fake_redis(app_module, FlakyRedis(app_module.RedisError))
+    app_module.REDIS_BREAKER.record_success()
+
+
+@pytest.mark.parametrize(
+    "fallback_keys, down_status, ready_code",
+    [(3, DEGRADED, 200), (1, FAIL, 503)],
+    ids=["with-fallback-keys", "without-fallback-keys"],
+)
+def test_api_health_when_redis_goes_down_and_recovers(
+    app_module, flaky_redis, monkeypatch, fallback_keys, down_status, ready_code
+):
+    monkeypatch.setattr(
+        app_module, "FALLBACK_API_KEY_HASHES", ["a" * 64] * fallback_keys
+    )
+    with TestClient(app_module.app, headers={"X-API-Key": BENCH_API_KEY}) as client:
+        assert client.get("/api/v1/health/ready").status_code == 200
+
+        flaky_redis.down = True
+        deep = client.get("/api/v1/health/deep")
+        assert deep.json()["checks"]["redis"]["status"] == down_status
+        assert deep.json()["status"] == down_status
+        assert deep.status_code == ready_code
+        # Probes answer from the results of the last run
+        assert client.get("/api/v1/health/ready").status_code == ready_code
+
+        flaky_redis.down = False
+        deep = client.get("/api/v1/health/deep")
+        assert deep.status_code == 200
+        assert deep.json()["status"] == OK
+        assert client.get("/api/v1/health/ready").status_code == 200
@@ -0,0 +1,169 @@
+"""
+Tests for the holiday listing endpoints.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import json
+
+import pytest
+
+
+def test_type_filter_is_case_and_space_insensitive(client):
+    public = client.get("/api/v1/holidays", params={"year": 2025, "type": "Public"})
+    assert public.status_code == 200
+    holidays = public.json()["holidays"]
+    assert holidays and all("Public" in h["type"] for h in holidays)
+    same = client.get("/api/v1/holidays", params={"year": 2025, "type": " PUBLIC "})
+    assert same.content == public.content
+    assert same.headers["ETag"] == public.headers["ETag"]
+
+
+def test_unknown_types_share_one_cache_entry(client, app_module):
+    cache = app_module.RESPONSE_CACHE
+    for type_ in ("nope", "Other", "x" * 50):
+        response = client.get("/api/v1/holidays", params={"year": 2025, "type": type_})
+        assert response.json() == {"holidays": []}
+    assert len(cache) == 1
+    everything = client.get("/api/v1/holidays", params={"year": 2025, "type": ""})
+    assert len(everything.json()["holidays"]) > 20
+
+
+def test_revalidation_answers_304(client, app_module):
+    params = {"year": 2025, "month": 2}
+    first = client.get("/api/v1/holidays", params=params)
+    assert first.status_code == 200
+    etag, modified = first.headers["ETag"], first.headers["Last-Modified"]
+    assert first.headers["Cache-Control"] == app_module.CACHE_CONTROL
+    assert first.headers["Vary"] == "Accept"
+
+    cache = app_module.RESPONSE_CACHE
+    lookups = cache.hits + cache.misses
+    for headers in (
+        {"If-None-Match": etag},
+        {"If-None-Match": f'W/{etag}, "other"'},
+        {"If-None-Match": "*"},
+        {"If-Modified-Since": modified},
+    ):
+        response = client.get("/api/v1/holidays", params=params, headers=headers)
+        assert response.status_code == 304, headers
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+    # 304s are answered before the response cache is even consulted
+    assert cache.hits + cache.misses == lookups
+
+    # A non-matching ETag wins over a fresh If-Modified-Since
+    stale = client.get(
+        "/api/v1/holidays",
+        params=params,
+        headers={"If-None-Match": '"other"', "If-Modified-Since": modified},
+    )
+    assert stale.status_code == 200 and stale.content == first.content
+
+
+def test_etags_differ_per_representation(client):
+    def etag(params):
+        return client.get("/api/v1/holidays", params=params).headers["ETag"]
+
+    base = {"year": 2025}
+    assert etag(base) == etag(base)
+    assert (
+        len(
+            {
+                etag(base),
+                etag({**base, "month": 1}),
+                etag({**base, "format": "simple"}),
+                etag({**base, "type": "Bank"}),
+                etag({"year": 2024}),
+            }
+        )
+        == 5
+    )
+
+
+def test_check_holiday_revalidation(client):
+    params = {"year": 2025, "month": 2, "day": 4}
+    first = client.get("/api/v1/check_holiday", params=params)
+    assert first.json()["response"] is True
+    again = client.get(
+        "/api/v1/check_holiday",
+        params=params,
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert again.status_code == 304
+    other_day = client.get(
+        "/api/v1/check_holiday",
+        params={**params, "day": 5},
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert other_day.status_code == 200
+
+
+def test_etag_changes_after_reload(data_dir, client, app_module):
+    first = client.get("/api/v1/holidays", params={"year": 2025})
+    etag = first.headers["ETag"]
+
+    path = data_dir / "2025.json"
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    entries[0]["summary"] = "Renamed holiday"
+    path.write_text(json.dumps(entries), encoding="utf-8")
+    assert client.portal.call(app_module.reload_holiday_data)
+
+    stale = client.get(
+        "/api/v1/holidays", params={"year": 2025}, headers={"If-None-Match": etag}
+    )
+    assert stale.status_code == 200
+    assert stale.headers["ETag"] != etag
+    assert stale.json()["holidays"][0]["name"] == "Renamed holiday"
+
+
+def test_range_across_years(client):
+    response = client.get(
+        "/api/v1/holidays/range", params={"from": "2025-12-01", "to": "2026-01-31"}
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["from"], result["to"]) == ("2025-12-01", "2026-01-31")
+    starts = [h["start"] for h in result["holidays"]]
+    assert starts == sorted(starts)
+    assert starts[0].startswith("2025-12") and starts[-1].startswith("2026-01")
+
+
+@pytest.mark.parametrize(
+    "start, end, year",
+    [("2026-12-01", "2027-01-31", 2027), ("2019-06-01", "2021-01-31", 2019)],
+)
+def test_range_reaching_years_without_data(client, start, end, year):
+    for fmt in ("full", "ics"):
+        response = client.get(
+            "/api/v1/holidays/range", params={"from": start, "to": end, "format": fmt}
+        )
+        assert response.status_code == 404
+        assert response.json() == {"error": f"Holiday data for {year} is not available"}
+
+
+def test_reversed_range(client):
+    response = client.get(
+        "/api/v1/holidays/range", params={"from": "2025-02-01", "to": "2025-01-01"}
+    )
+    assert response.status_code == 400
+
+
+def test_large_exports_are_streamed_uncached(client, app_module, monkeypatch):
+    params = {"year": 2025, "format": "csv"}
+    cached = client.get("/api/v1/holidays", params=params)
+    assert len(app_module.RESPONSE_CACHE) == 1
+
+    app_module.RESPONSE_CACHE.invalidate()
+    monkeypatch.setattr(app_module, "EXPORT_STREAM_THRESHOLD", 0)
+    streamed = client.get("/api/v1/holidays", params=params)
+
+    assert len(app_module.RESPONSE_CACHE) == 0
+    assert streamed.status_code == 200
+    assert streamed.content == cached.content
+    assert "content-length" not in streamed.headers
+    assert streamed.headers["ETag"] == cached.headers["ETag"]
+    assert streamed.headers["content-type"] == "text/csv; charset=utf-8"
@@ -0,0 +1,72 @@
+"""
+Tests for the HTTP caching helpers.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from datetime import datetime, timezone
+
+import pytest
+
+from srilanka_holidays.http_cache import format_http_date, is_not_modified, make_etag
+
+MODIFIED = datetime(2025, 3, 1, 10, 30, 15, 500000, tzinfo=timezone.utc)
+ETAG = make_etag("v1", 2025, None)
+
+
+def test_make_etag_depends_on_version_and_variant():
+    assert ETAG == make_etag("v1", 2025, None)
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert make_etag("v2", 2025, None) != ETAG
+    assert make_etag("v1", 2025, 1) != ETAG
+    # repr keeps 1 and "1" apart
+    assert make_etag("v1", 2025, "1") != make_etag("v1", 2025, 1)
+
+
+def test_format_http_date():
+    assert format_http_date(MODIFIED) == "Sat, 01 Mar 2025 10:30:15 GMT"
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (ETAG, True),
+        (f"W/{ETAG}", True),
+        (f'"other", {ETAG}', True),
+        ("*", True),
+        (' "other" ', False),
+        (ETAG[:-2] + '"', False),
+    ],
+)
+def test_if_none_match(if_none_match, expected):
+    assert is_not_modified(ETAG, MODIFIED, if_none_match) is expected
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        # Same second as the change, fractions are dropped
+        ("Sat, 01 Mar 2025 10:30:15 GMT", True),
+        ("Sun, 02 Mar 2025 00:00:00 GMT", True),
+        ("Sat, 01 Mar 2025 10:30:14 GMT", False),
+        ("not a date", False),
+        # No time zone
+        ("Sat, 01 Mar 2025 10:30:15 -0000", False),
+    ],
+)
+def test_if_modified_since(if_modified_since, expected):
+    assert is_not_modified(ETAG, MODIFIED, None, if_modified_since) is expected
+
+
+def test_if_none_match_takes_precedence():
+    fresh_date = "Sun, 02 Mar 2025 00:00:00 GMT"
+    assert not is_not_modified(ETAG, MODIFIED, '"other"', fresh_date)
+    assert is_not_modified(ETAG, MODIFIED, ETAG, "Sat, 01 Jan 2000 00:00:00 GMT")
+
+
+def test_no_conditions_or_unknown_modification_time():
+    assert not is_not_modified(ETAG, MODIFIED)
+    assert not is_not_modified(ETAG, None, None, "Sun, 02 Mar 2025 00:00:00 GMT")
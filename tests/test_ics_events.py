@@ -0,0 +1,66 @@
+"""
+Tests for the streaming iCalendar event parser.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from datetime import date
+from pathlib import Path
+
+from icalendar import Calendar
+
+from ics_events import IcsEvent, iter_ics_events, read_ics_events
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "folded.ics"
+
+
+def test_fixture_uses_crlf_line_endings():
+    data = FIXTURE.read_bytes()
+    assert data.count(b"\r\n") == data.count(b"\n")
+
+
+def test_folded_crlf_events():
+    assert read_ics_events(FIXTURE) == [
+        IcsEvent(
+            uid="sl_test_1",
+            summary="Day prior to Sinhala and Tamil New Year Day",
+            description="Public,Bank,Mercantile",
+            start=date(2025, 4, 13),
+            end=date(2025, 4, 15),
+        ),
+        # Spans the new year; the alarm's DESCRIPTION isn't the event's
+        IcsEvent(
+            uid="sl_test_2",
+            summary="Year-end shutdown",
+            description="Bank",
+            start=date(2025, 12, 30),
+            end=date(2026, 1, 2),
+        ),
+        IcsEvent(
+            uid="sl_test_3",
+            summary=None,
+            description=None,
+            start=date(2026, 1, 1),
+            end=date(2026, 1, 2),
+        ),
+    ]
+
+
+def test_matches_parsing_the_whole_file():
+    calendar = Calendar.from_ical(FIXTURE.read_bytes())
+    expected = [
+        (str(event["uid"]), event.decoded("dtstart"), event.decoded("dtend"))
+        for event in calendar.walk("VEVENT")
+    ]
+    assert [
+        (event.uid, event.start, event.end) for event in iter_ics_events(FIXTURE)
+    ] == expected
+
+
+def test_bundled_calendars_parse():
+    for path in sorted((FIXTURE.parents[2] / "ics").glob("*.ics")):
+        events = read_ics_events(path)
+        assert events and all(event.start < event.end for event in events)
@@ -0,0 +1,123 @@
+"""
+Tests for structured and sampled logging.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import json
+import logging
+import sys
+
+import pytest
+
+from srilanka_holidays import logs
+from srilanka_holidays.logs import JsonFormatter, SampledLogger, configure_logging
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def list_logger():
+    logger = logging.getLogger("tests.sampled")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.propagate = False
+    yield logger, handler.records
+    logger.removeHandler(handler)
+    logger.propagate = True
+    logger.setLevel(logging.NOTSET)
+
+
+def test_json_line_format():
+    record = logging.LogRecord(
+        "access", logging.INFO, __file__, 1, "%s %s", ("GET", "/"), None
+    )
+    record.created = 1735689600.5  # 2025-01-01 00:00:00.500 UTC
+    record.status = 200
+    record.duration_ms = 1.25
+    record.route = None
+    record._private = "hidden"
+
+    line = JsonFormatter().format(record)
+
+    assert "\n" not in line
+    assert json.loads(line) == {
+        "time": "2025-01-01T00:00:00.500+00:00",
+        "level": "INFO",
+        "logger": "access",
+        "message": "GET /",
+        "status": 200,
+        "duration_ms": 1.25,
+        "route": None,
+    }
+
+
+def test_json_line_includes_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "app", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+        )
+    # The queue handler resolves the message and traceback before queueing
+    prepared = logs._QueueHandler(None).prepare(record)  # pylint: disable=W0212
+
+    entry = json.loads(JsonFormatter().format(prepared))
+
+    assert prepared.exc_info is None
+    assert entry["message"] == "failed"
+    assert entry["exception"].endswith("ValueError: boom")
+
+
+def test_configure_logging_is_idempotent(monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", list(root.handlers))
+    monkeypatch.setattr(root, "level", root.level)
+    monkeypatch.setattr(logs, "_listener", None)
+
+    first = configure_logging("WARNING")
+    handlers = list(root.handlers)
+    second = configure_logging("ERROR", json_format=False)
+
+    assert second is first
+    assert root.handlers == handlers
+    assert root.level == logging.ERROR
+
+
+def test_sampled_logger_is_silent_above_debug(list_logger):
+    logger, records = list_logger
+    logger.setLevel(logging.INFO)
+
+    SampledLogger(logger, 1).debug("event")
+
+    assert not records
+
+
+def test_sampled_logger_rate(list_logger, monkeypatch):
+    logger, records = list_logger
+    logger.setLevel(logging.DEBUG)
+    samples = iter([0.1, 0.6, 0.2, 0.9])
+    monkeypatch.setattr(logs.random, "random", lambda: next(samples))
+
+    SampledLogger(logger, 0).debug("never")
+    always = SampledLogger(logger, 1)
+    always.debug("always %s", 1)
+    half = SampledLogger(logger, 0.5)
+    for number in range(4):
+        half.debug("sampled %s", number)
+
+    assert [record.getMessage() for record in records] == [
+        "always 1",
+        "sampled 0",
+        "sampled 2",
+    ]
@@ -0,0 +1,117 @@
+"""
+Tests for the Prometheus metrics and the Server-Timing header.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import re
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from srilanka_holidays.metrics import MetricsMiddleware, MetricsRegistry
+
+
+def test_render_counter_and_callback():
+    registry = MetricsRegistry(prefix="app_")
+    hits = registry.counter("hits_total", "Cache hits", ["cache"])
+    hits.inc("year")
+    hits.inc("year", amount=2)
+    hits.inc('say "hi"\n')
+    registry.callback("keys_loaded", "Keys in the index", lambda: 7)
+
+    text = registry.render()
+
+    assert text.endswith("\n")
+    assert "# HELP app_hits_total Cache hits\n# TYPE app_hits_total counter\n" in text
+    assert 'app_hits_total{cache="year"} 3\n' in text
+    assert 'app_hits_total{cache="say \\"hi\\"\\n"} 1\n' in text
+    assert "# TYPE app_keys_loaded gauge\napp_keys_loaded 7\n" in text
+    assert hits.value("year") == 3
+
+
+def test_render_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_count 4" in lines
+    assert "latency_seconds_sum 3.65" in lines
+    assert histogram.count() == 4
+
+
+def make_client(registry: MetricsRegistry, server_timing: bool) -> TestClient:
+    test_app = FastAPI()
+
+    @test_app.get("/items/{item}")
+    async def item(item: str):
+        with registry.stage("lookup"):
+            return {"item": item}
+
+    test_app.add_middleware(
+        MetricsMiddleware, registry=registry, server_timing=server_timing
+    )
+    return TestClient(test_app)
+
+
+def test_middleware_records_route_template_and_stages():
+    registry = MetricsRegistry()
+    client = make_client(registry, server_timing=False)
+
+    response = client.get("/items/a")
+    client.get("/items/b")
+    client.get("/missing")
+
+    assert "server-timing" not in response.headers
+    assert registry.request_duration.count("/items/{item}", "GET", "200") == 2
+    assert registry.request_duration.count("other", "GET", "404") == 1
+    assert registry.stage_duration.count("lookup") == 2
+
+
+def test_server_timing_header():
+    registry = MetricsRegistry()
+    client = make_client(registry, server_timing=True)
+
+    header = client.get("/items/a").headers["server-timing"]
+
+    assert re.fullmatch(r"lookup;dur=\d+\.\d{3}, total;dur=\d+\.\d{3}", header)
+
+
+def test_metrics_endpoint(client):
+    client.get("/api/v1/holidays", params={"year": 2025})
+
+    response = client.get("/metrics", headers={"X-API-Key": ""})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        "# TYPE srilanka_holidays_http_request_duration_seconds histogram"
+        in response.text
+    )
+    assert (
+        'srilanka_holidays_http_request_duration_seconds_count{route="/api/v1/holidays"'
+        in response.text
+    )
+
+
+def test_metrics_token(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, "METRICS_TOKEN", "scrape-token")
+
+    missing = client.get("/metrics")
+    wrong = client.get("/metrics", headers={"Authorization": "Bearer other"})
+    allowed = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+
+    assert missing.status_code == 401
+    assert missing.headers["www-authenticate"] == "Bearer"
+    assert wrong.status_code == 401
+    assert allowed.status_code == 200
@@ -0,0 +1,180 @@
+"""
+Tests for the per API key rate limiter.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import asyncio
+
+import pytest
+
+from benchmarks.fakes import BENCH_API_KEY, FALLBACK_API_KEY, FakeRedis, key_hash
+from srilanka_holidays.rate_limit import RateLimit, RateLimiter, rate_limit_key
+
+KEY = "a" * 64
+# 2025-01-01 00:00 UTC
+START = 20089 * 86400.0
+
+
+class Clock:
+    """Settable clock"""
+
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_burst_then_rate(clock):
+    limiter = RateLimiter(RateLimit(per_minute=60, burst=2, daily_quota=0), clock)
+    assert limiter.acquire(KEY) == 0
+    assert limiter.acquire(KEY) == 0
+    assert limiter.acquire(KEY) == pytest.approx(1.0)
+    clock.now += 0.5
+    assert limiter.acquire(KEY) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter.acquire(KEY) == 0
+    assert limiter.rejected_rate == 2
+
+
+def test_daily_quota_resets_next_day(clock):
+    limiter = RateLimiter(RateLimit(per_minute=0, burst=0, daily_quota=2), clock)
+    clock.now += 3600
+    assert limiter.acquire(KEY) == 0
+    assert limiter.acquire(KEY) == 0
+    assert limiter.acquire(KEY) == pytest.approx(86400 - 3600)
+    clock.now = START + 86400
+    assert limiter.acquire(KEY) == 0
+    assert limiter.rejected_quota == 1
+
+
+def test_unlimited_keys_are_not_tracked(clock):
+    limiter = RateLimiter(RateLimit(0, 0, 0), clock)
+    assert all(limiter.acquire(KEY) == 0 for _ in range(1000))
+    assert len(limiter) == 0
+
+
+def test_limit_for_record_fields():
+    limiter = RateLimiter(RateLimit(per_minute=120, burst=120, daily_quota=0))
+    assert limiter.limit_for(None) == limiter.default
+    assert limiter.limit_for({"hash": KEY}) == RateLimit(120, 120, 0)
+    assert limiter.limit_for({"rate_limit": 10}) == RateLimit(10, 10, 0)
+    assert limiter.limit_for({"rate_limit": 10, "burst": 3}) == RateLimit(10, 3, 0)
+    assert limiter.limit_for({"daily_quota": 50}) == RateLimit(120, 120, 50)
+    assert limiter.limit_for({"rate_limit": "many", "daily_quota": True}) == (
+        RateLimit(120, 120, 0)
+    )
+
+
+def test_sync_shares_counts_between_instances(clock):
+    redis = FakeRedis()
+    limit = RateLimit(per_minute=60, burst=10, daily_quota=5)
+    first, second = RateLimiter(limit, clock), RateLimiter(limit, clock)
+    for _ in range(3):
+        assert first.acquire(KEY) == 0
+    assert second.acquire(KEY) == 0
+
+    assert asyncio.run(first.sync(redis)) == 1
+    assert asyncio.run(second.sync(redis)) == 1
+    assert redis.data[rate_limit_key(KEY, int(START // 86400))] == 4
+    # The second instance now counts the first one's requests too
+    assert second.acquire(KEY) == 0
+    assert second.acquire(KEY) > 0
+    assert second.rejected_quota == 1
+
+
+def test_failed_sync_keeps_requests_for_the_next_one(clock):
+    class BrokenRedis(FakeRedis):
+        def pipeline(self, transaction=True):
+            raise ConnectionError("down")
+
+    redis = FakeRedis()
+    limiter = RateLimiter(RateLimit(60, 10, 0), clock)
+    limiter.acquire(KEY)
+    assert asyncio.run(limiter.sync(BrokenRedis())) == 0
+    assert limiter.failed_syncs == 1
+    asyncio.run(limiter.sync(redis))
+    assert redis.data[rate_limit_key(KEY, int(START // 86400))] == 1
+
+
+def test_sync_flushes_previous_day_before_pruning(clock):
+    redis = FakeRedis()
+    limiter = RateLimiter(RateLimit(60, 10, 0), clock)
+    limiter.acquire(KEY)
+    limiter.acquire(KEY)
+    clock.now = START + 86400 + 1
+
+    assert asyncio.run(limiter.sync(redis)) == 1
+    assert redis.data[rate_limit_key(KEY, int(START // 86400))] == 2
+    assert rate_limit_key(KEY, int(START // 86400) + 1) not in redis.data
+    assert len(limiter) == 0
+
+
+def test_sync_without_redis_prunes_previous_days(clock):
+    limiter = RateLimiter(RateLimit(60, 10, 0), clock)
+    limiter.acquire(KEY)
+    assert asyncio.run(limiter.sync(None)) == 0
+    assert len(limiter) == 1
+    clock.now += 86400
+    asyncio.run(limiter.sync(None))
+    assert len(limiter) == 0
+
+
+@pytest.fixture
+def api_limiter(app_module, clock, monkeypatch):
+    """The API's rate limiter, reset and driven by `clock`"""
+    limiter = RateLimiter(app_module.RATE_LIMITER.default, clock)
+    monkeypatch.setattr(app_module, "RATE_LIMITER", limiter)
+    return limiter
+
+
+@pytest.fixture
+def limited_key(redis):
+    """Give the test API key its own limits (request it before `client`)"""
+    record = redis.json_data["API_KEYS_V2"][0]
+    assert record["hash"] == key_hash(BENCH_API_KEY)
+    record.update(rate_limit=6, burst=2)
+
+
+def test_api_is_unlimited_by_default(app_module, api_limiter, client):
+    assert app_module.RATE_LIMIT_PER_MINUTE == 0
+    for _ in range(5):
+        assert client.get("/api/v1/version").status_code == 200
+    assert len(api_limiter) == 0
+
+
+def test_api_returns_429_with_retry_after(api_limiter, limited_key, client, clock):
+    assert client.get("/api/v1/version").status_code == 200
+    assert client.get("/api/v1/version").status_code == 200
+
+    rejected = client.get("/api/v1/version")
+    assert rejected.status_code == 429
+    # One token per 10 seconds at 6 requests per minute
+    assert rejected.headers["Retry-After"] == "10"
+    assert rejected.json() == {"detail": "Rate limit exceeded. Please retry later."}
+    assert api_limiter.rejected_rate == 1
+
+    clock.now += 10
+    assert client.get("/api/v1/version").status_code == 200
+
+
+def test_api_daily_quota_for_fallback_keys(app_module, api_limiter, client, clock):
+    api_limiter.default = RateLimit(per_minute=0, burst=0, daily_quota=1)
+    headers = {"X-API-Key": FALLBACK_API_KEY}
+    clock.now += 3600
+    assert client.get("/api/v1/version", headers=headers).status_code == 200
+
+    rejected = client.get("/api/v1/version", headers=headers)
+    assert rejected.status_code == 429
+    # Until the next UTC day
+    assert rejected.headers["Retry-After"] == str(23 * 3600)
+    assert api_limiter.rejected_quota == 1
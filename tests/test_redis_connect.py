@@ -0,0 +1,80 @@
+"""
+Tests for connecting to Redis at startup.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.fakes import FakeRedis, install_fake_redis
+
+
+class GatedRedis(FakeRedis):
+    """FakeRedis whose pings fail while down and wait while the gate is shut"""
+
+    def __init__(self, app_module):
+        super().__init__()
+        self.app_module = app_module
+        self.up = True
+        self.gate = threading.Event()
+        self.gate.set()
+
+    async def ping(self):
+        await asyncio.to_thread(self.gate.wait)
+        if not self.up:
+            raise self.app_module.RedisError("connection refused")
+        return True
+
+
+@pytest.fixture
+def gated_redis(app_module, monkeypatch):
+    for name in ("REDIS_CLIENT", "REDIS_PENDING_CLIENT"):
+        monkeypatch.setattr(app_module, name, None)
+    app_module.REDIS_BREAKER.record_success()
+    yield install_fake_redis(app_module, GatedRedis(app_module))
+    app_module.REDIS_BREAKER.record_success()
+
+
+def test_unreachable_redis_is_used_once_the_probe_succeeds(app_module, gated_redis):
+    gated_redis.up = False
+    asyncio.run(app_module.connect_redis())
+
+    assert app_module.REDIS_CLIENT is None
+    assert app_module.get_redis() is None
+    assert app_module.REDIS_BREAKER.is_open
+    with pytest.raises(app_module.RedisError):
+        asyncio.run(app_module.probe_redis())
+    assert app_module.REDIS_CLIENT is None
+
+    gated_redis.up = True
+    asyncio.run(app_module.probe_redis())
+    assert app_module.REDIS_CLIENT is not None
+    assert app_module.REDIS_PENDING_CLIENT is None
+
+
+def test_background_connect_reruns_the_health_checks(
+    app_module, gated_redis, monkeypatch
+):
+    monkeypatch.setattr(app_module, "REDIS_CONNECT_MODE", "background")
+    gated_redis.gate.clear()
+
+    with TestClient(app_module.app):
+        # Serving before Redis answered: no client, and the checks say so
+        assert app_module.REDIS_CLIENT is None
+        assert app_module.HEALTH.results["redis"].status == "fail"
+
+        gated_redis.gate.set()
+        deadline = time.monotonic() + 5
+        while app_module.HEALTH.results["redis"].status != "ok":
+            assert time.monotonic() < deadline, "health checks were not rerun"
+            time.sleep(0.01)
+        assert app_module.REDIS_CLIENT is not None
+        assert app_module.HEALTH.is_ready()
@@ -0,0 +1,113 @@
+"""
+Tests for reloading changed holiday data.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name,protected-access
+
+import asyncio
+import json
+import os
+
+from srilanka_holidays.reload import DataWatcher, store_version
+
+
+def cached_years(app_module):
+    return {key[0] for key in app_module.RESPONSE_CACHE._entries}
+
+
+def rename_first_holiday(path, name):
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    entries[0]["summary"] = name
+    path.write_text(json.dumps(entries), encoding="utf-8")
+
+
+def test_data_watcher_detects_changed_added_and_removed_files(tmp_path):
+    for year in (2025, 2026):
+        (tmp_path / f"{year}.json").write_text("[]", encoding="utf-8")
+    watcher = DataWatcher(tmp_path)
+
+    assert watcher.poll() == {2025, 2026}
+    assert watcher.poll() == set()
+
+    stat = (tmp_path / "2025.json").stat()
+    os.utime(tmp_path / "2025.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert watcher.poll() == {2025}
+
+    (tmp_path / "2027.json").write_text("[]", encoding="utf-8")
+    (tmp_path / "2026.json").unlink()
+    assert watcher.poll() == {2026, 2027}
+    assert sorted(watcher.paths) == [2025, 2027]
+
+
+def test_reload_after_file_change(data_dir, client, app_module, redis):
+    first = client.get("/api/v1/holidays", params={"year": 2025})
+    other = client.get("/api/v1/holidays", params={"year": 2026})
+    redis.data["holidays:2025"] = "stale"
+    assert cached_years(app_module) == {2025, 2026}
+    assert not client.portal.call(app_module.reload_holiday_data)
+
+    rename_first_holiday(data_dir / "2025.json", "Renamed holiday")
+    assert client.portal.call(app_module.reload_holiday_data)
+
+    # Only the changed year is dropped, locally and in Redis
+    assert cached_years(app_module) == {2026}
+    assert "holidays:2025" not in redis.data
+    version = store_version(app_module.CALENDAR.store)
+    assert redis.data[app_module.DATA_VERSION_KEY] == version
+    assert app_module.DATA_VERSION_SEEN == version
+
+    reloaded = client.get("/api/v1/holidays", params={"year": 2025})
+    assert reloaded.headers["ETag"] != first.headers["ETag"]
+    assert reloaded.json()["holidays"][0]["name"] == "Renamed holiday"
+    unchanged = client.get("/api/v1/holidays", params={"year": 2026})
+    assert unchanged.headers["ETag"] == other.headers["ETag"]
+
+
+async def run_periodic_reload(app_module, reloads: float):
+    """Run the reload loop until the version key triggered another reload"""
+
+    async def reloaded():
+        while app_module.DATA_RELOADS.value("version_key") == reloads:
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(app_module.reload_holiday_data_periodically())
+    try:
+        await asyncio.wait_for(reloaded(), timeout=5)
+    finally:
+        task.cancel()
+
+
+def test_reload_after_data_version_bump(
+    data_dir, client, app_module, redis, monkeypatch
+):
+    monkeypatch.setattr(app_module, "DATA_RELOAD_SECONDS", 0)
+    first = client.get("/api/v1/holidays", params={"year": 2025})
+    other = client.get("/api/v1/holidays", params={"year": 2026})
+
+    # Another instance replaced the file without changing its size or mtime,
+    # so only the version key it published tells this one to reload
+    path = data_dir / "2025.json"
+    stat = path.stat()
+    text = path.read_text(encoding="utf-8")
+    name = json.loads(text)[0]["summary"]
+    path.write_text(text.replace(name, name.upper(), 1), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert not client.portal.call(app_module.reload_holiday_data)
+
+    redis.data[app_module.DATA_VERSION_KEY] = "published-elsewhere"
+    reloads = app_module.DATA_RELOADS.value("version_key")
+    client.portal.call(run_periodic_reload, app_module, reloads)
+
+    assert app_module.DATA_VERSION_SEEN == "published-elsewhere"
+    # A forced reload drops every year and leaves the published version alone
+    assert not cached_years(app_module)
+    assert redis.data[app_module.DATA_VERSION_KEY] == "published-elsewhere"
+    reloaded = client.get("/api/v1/holidays", params={"year": 2025})
+    assert reloaded.headers["ETag"] != first.headers["ETag"]
+    assert reloaded.json()["holidays"][0]["name"] == name.upper()
+    unchanged = client.get("/api/v1/holidays", params={"year": 2026})
+    assert unchanged.headers["ETag"] == other.headers["ETag"]
@@ -0,0 +1,47 @@
+"""
+Tests for the serialized response cache.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from srilanka_holidays.response_cache import ResponseCache
+
+
+def test_evicts_least_recently_used_entries():
+    cache = ResponseCache(maxsize=2)
+    cache.put((2025, None), "v1", b"a")
+    cache.put((2025, 1), "v1", b"b")
+    assert cache.get((2025, None), "v1") == b"a"
+    cache.put((2025, 2), "v1", b"c")
+    assert len(cache) == 2
+    assert cache.get((2025, 1), "v1") is None
+    assert cache.get((2025, None), "v1") == b"a"
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_entries_of_another_version_are_stale():
+    cache = ResponseCache()
+    cache.put((2025, None), "v1", b"a")
+    assert cache.get((2025, None), "v2") is None
+    cache.put((2025, None), "v2", b"b")
+    assert cache.get((2025, None), "v2") == b"b"
+    assert len(cache) == 1
+
+
+def test_invalidate_one_year_or_all():
+    cache = ResponseCache()
+    for key in ((2025, None), (2025, 1), (2026, None)):
+        cache.put(key, "v1", b"x")
+    cache.invalidate(2025)
+    assert len(cache) == 1 and cache.get((2026, None), "v1") == b"x"
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_zero_size_stores_nothing():
+    cache = ResponseCache(maxsize=0)
+    cache.put((2025, None), "v1", b"a")
+    assert len(cache) == 0 and cache.get((2025, None), "v1") is None
@@ -0,0 +1,97 @@
+"""
+Tests for the JSON serializers.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from srilanka_holidays.serialization import (
+    SERIALIZERS,
+    JsonSerializer,
+    get_serializer,
+)
+
+PAYLOADS = [
+    {"holidays": ["2025-01-13", "2025-01-14"]},
+    {
+        "holidays": [
+            {
+                "uid": "sl_110",
+                "name": "Day prior to Sinhala & Tamil New Year Day",
+                "start": date(2025, 4, 13),
+                "end": date(2025, 4, 14),
+                "type": ["Public", "Bank", "Mercantile"],
+            },
+            {
+                "uid": None,
+                "name": "සිංහල හා දෙමළ අලුත් අවුරුද්ද / தமிழ் புத்தாண்டு",
+                "start": date(2025, 4, 14),
+                "end": date(2025, 4, 15),
+                "type": [],
+            },
+        ]
+    },
+    {
+        "from": date(2025, 12, 1),
+        "checked_at": datetime(2025, 3, 1, 10, 30, 15, 500000, tzinfo=timezone.utc),
+        "naive": datetime(2025, 3, 1, 10, 30),
+        "business_days": 21,
+        "is_holiday": False,
+        "ratio": 0.25,
+        "note": 'Quotes " backslash \\ newline \n tab \t nul \x00 and “curly” ’',
+    },
+]
+
+orjson_serializer = pytest.mark.skipif(
+    "orjson" not in SERIALIZERS, reason="orjson is not installed"
+)
+
+
+@orjson_serializer
+@pytest.mark.parametrize("content", PAYLOADS)
+def test_orjson_matches_the_json_module(content):
+    stdlib, fast = get_serializer("json"), get_serializer("orjson")
+    assert fast.dumps(content) == stdlib.dumps(content)
+    data = stdlib.dumps(content)
+    assert fast.loads(data) == stdlib.loads(data)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+@pytest.mark.parametrize("content", PAYLOADS)
+def test_matches_fastapi_rendering(name, content):
+    if name not in SERIALIZERS:
+        pytest.skip(f"{name} is not installed")
+    expected = JSONResponse(jsonable_encoder(content)).body
+    assert get_serializer(name).dumps(content) == expected
+
+
+def test_dates_and_non_ascii_text():
+    assert JsonSerializer().dumps(
+        {"start": date(2025, 1, 1), "name": "දුරුතු"}
+    ) == '{"start":"2025-01-01","name":"දුරුතු"}'.encode("utf-8")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_unsupported_values_raise_type_error(name):
+    if name not in SERIALIZERS:
+        pytest.skip(f"{name} is not installed")
+    with pytest.raises(TypeError):
+        get_serializer(name).dumps({"value": object()})
+
+
+def test_nan_is_rejected():
+    with pytest.raises(ValueError):
+        JsonSerializer().dumps({"value": float("nan")})
+
+
+def test_unknown_serializer():
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
@@ -0,0 +1,114 @@
+"""
+Tests for the holiday data shared between worker processes.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import os
+from datetime import date
+
+import pytest
+
+from srilanka_holidays.artifact import ArtifactError
+from srilanka_holidays.shared_data import ArtifactStore, SharedDataset
+from srilanka_holidays.store import HolidayStore
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    """Year -> data file of two years"""
+    paths = {}
+    for year in (2025, 2026):
+        paths[year] = tmp_path / f"{year}.json"
+        paths[year].write_text("v1", encoding="utf-8")
+    return paths
+
+
+def test_attach_reads_each_generation_once(tmp_path, store):
+    publisher = SharedDataset(tmp_path / "shared")
+    reader = SharedDataset(tmp_path / "shared")
+    assert reader.attach() is None
+
+    with publisher.lock():
+        assert publisher.publish(store) == 1
+    attached = reader.attach()
+    assert isinstance(attached, ArtifactStore)
+    assert reader.generation == 1
+    assert reader.attach() is None
+
+    with publisher.lock():
+        assert publisher.publish(store.with_year(2027, ())) == 2
+    attached = reader.attach()
+    assert reader.generation == 2
+    assert attached.years == (2025, 2026, 2027)
+
+
+def test_artifact_store_matches_holiday_store(tmp_path, store):
+    dataset = SharedDataset(tmp_path)
+    with dataset.lock():
+        dataset.publish(store)
+    shared = dataset.attach()
+
+    assert shared.years == store.years
+    for year in store.years:
+        assert shared.version(year) == store.version(year)
+        assert shared.last_modified(year) == store.last_modified(year)
+        for month in (None, 1, 4, 12):
+            assert shared.year_holidays(year, month) == store.year_holidays(year, month)
+    days = [date(2025, 4, 14), date(2025, 4, 15), date(2026, 1, 1), date(2024, 1, 1)]
+    assert shared.holidays_on_many(days) == store.holidays_on_many(days)
+    start, end = date(2025, 12, 1), date(2026, 12, 31)
+    assert shared.holidays_between(start, end) == store.holidays_between(start, end)
+    assert shared.business_calendar().business_days_between(
+        date(2025, 1, 1), date(2026, 1, 1)
+    ) == store.business_calendar().business_days_between(
+        date(2025, 1, 1), date(2026, 1, 1)
+    )
+    assert not shared.has_year(2024) and shared.version(2024) is None
+
+    updated = shared.with_year(2025, ())
+    assert isinstance(updated, HolidayStore)
+    assert updated.year_holidays(2025) == ()
+    assert updated.year_holidays(2026) == store.year_holidays(2026)
+
+
+def test_update_only_publishes_changed_files(tmp_path, store, data_files):
+    dataset = SharedDataset(tmp_path / "shared")
+    loads = []
+
+    def load(paths):
+        loads.append(paths)
+        return store
+
+    assert dataset.update(data_files, load)
+    assert not dataset.update(data_files, load)
+    assert len(loads) == 1
+    assert dataset.is_current(data_files)
+
+    data_files[2026].write_text("v2", encoding="utf-8")
+    assert not dataset.is_current(data_files)
+    assert dataset.update(data_files, load)
+    assert dataset.read_manifest()["generation"] == 2
+
+
+def test_old_generations_are_removed(tmp_path, store):
+    dataset = SharedDataset(tmp_path, keep=2)
+    with dataset.lock():
+        for _ in range(4):
+            dataset.publish(store)
+    assert sorted(p.name for p in tmp_path.glob("holidays-*.bin")) == [
+        "holidays-3.bin",
+        "holidays-4.bin",
+    ]
+
+
+def test_missing_artifact_is_an_error(tmp_path, store):
+    dataset = SharedDataset(tmp_path)
+    with dataset.lock():
+        dataset.publish(store)
+    os.remove(tmp_path / "holidays-1.bin")
+    with pytest.raises(ArtifactError):
+        dataset.attach()
@@ -0,0 +1,137 @@
+"""
+Tests for the holiday store and the yearly data files.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error,redefined-outer-name
+
+import json
+from datetime import date
+
+import pytest
+
+from srilanka_holidays.store import HolidayStore, data_file_paths, read_data_file
+
+ENTRY = {
+    "uid": "sl_102",
+    "summary": "Duruthu Full Moon Poya Day",
+    "categories": ["Public", "Bank"],
+    "start": "2025-01-13",
+    "end": "2025-01-14",
+}
+
+
+@pytest.fixture
+def new_year_store(holiday):
+    """A holiday running from 30 December 2025 to 2 January 2026"""
+    return HolidayStore(
+        {
+            2025: (
+                holiday("long", date(2025, 12, 30), days=4),
+                holiday("xmas", date(2025, 12, 25)),
+            ),
+            2026: (holiday("d", date(2026, 1, 1), categories=("Bank",)),),
+        }
+    )
+
+
+def test_holidays_on_covers_each_day_of_a_multi_day_holiday(new_year_store):
+    def uids(day):
+        return [h.uid for h in new_year_store.holidays_on(day)]
+
+    assert uids(date(2025, 12, 29)) == []
+    assert uids(date(2025, 12, 30)) == ["long"]
+    assert uids(date(2025, 12, 31)) == ["long"]
+    # Indexed under the next year's date too, alongside that year's holidays
+    assert uids(date(2026, 1, 1)) == ["long", "d"]
+    assert uids(date(2026, 1, 2)) == ["long"]
+    # The end date is exclusive
+    assert uids(date(2026, 1, 3)) == []
+    days = [date(2026, 1, 2), date(2026, 1, 3), date(2024, 1, 1)]
+    assert [len(m) for m in new_year_store.holidays_on_many(days)] == [1, 0, 0]
+
+
+def test_with_year_returns_a_new_store(new_year_store, holiday):
+    updated = new_year_store.with_year(2026, (holiday("e", date(2026, 1, 2)),))
+    assert [h.uid for h in updated.holidays_on(date(2026, 1, 2))] == ["long", "e"]
+    assert [h.uid for h in new_year_store.holidays_on(date(2026, 1, 2))] == ["long"]
+    assert updated.version(2025) == new_year_store.version(2025)
+    assert updated.version(2026) != new_year_store.version(2026)
+
+
+def test_year_holidays_are_sorted_and_listed_by_start_month(new_year_store, holiday):
+    assert [h.uid for h in new_year_store.year_holidays(2025)] == ["xmas", "long"]
+    assert [h.uid for h in new_year_store.year_holidays(2025, 12)] == [
+        "xmas",
+        "long",
+    ]
+    # Listed under the month it starts in only
+    assert new_year_store.year_holidays(2026, 1) == (new_year_store.year_holidays(2026))
+    assert new_year_store.year_holidays(2025, 1) == ()
+    assert new_year_store.year_holidays(2024) == ()
+
+    spanning = holiday("span", date(2025, 1, 30), days=3)
+    store = HolidayStore(
+        {
+            2025: (
+                holiday("feb", date(2025, 2, 1)),
+                spanning,
+                holiday("tie", date(2025, 2, 1)),
+            )
+        }
+    )
+    assert store.year_holidays(2025, 1) == (spanning,)
+    # Equal start dates keep their file order
+    assert [h.uid for h in store.year_holidays(2025, 2)] == ["feb", "tie"]
+
+
+def test_holidays_between_finds_holidays_started_before_the_range(new_year_store):
+    def uids(start, end):
+        return [h.uid for h in new_year_store.holidays_between(start, end)]
+
+    # The range starts in the middle of a holiday that began the year before
+    assert uids(date(2026, 1, 2), date(2026, 1, 2)) == ["long"]
+    assert uids(date(2026, 1, 1), date(2026, 1, 31)) == ["long", "d"]
+    assert uids(date(2025, 12, 26), date(2025, 12, 29)) == []
+    assert uids(date(2025, 12, 25), date(2026, 1, 1)) == ["xmas", "long", "d"]
+    assert uids(date(2026, 1, 3), date(2026, 12, 31)) == []
+    assert uids(date(2026, 1, 2), date(2025, 12, 30)) == []
+
+
+def test_data_file_paths_skips_missing_years(tmp_path):
+    for name in ("2025.json", "2026.json"):
+        (tmp_path / name).write_text("[]", encoding="utf-8")
+    assert data_file_paths(tmp_path, [2025, 2026, 2030]) == {
+        2025: (tmp_path / "2025.json").resolve(),
+        2026: (tmp_path / "2026.json").resolve(),
+    }
+
+
+def test_data_file_paths_rejects_files_outside_the_directory(tmp_path):
+    data_dir = tmp_path / "json"
+    data_dir.mkdir()
+    outside = tmp_path / "elsewhere.json"
+    outside.write_text("[]", encoding="utf-8")
+    (data_dir / "2025.json").symlink_to(outside)
+    assert data_file_paths(data_dir, [2025]) == {}
+
+
+def test_read_data_file_skips_invalid_entries(tmp_path):
+    path = tmp_path / "2025.json"
+    path.write_text(json.dumps([ENTRY, {"uid": "broken"}]), encoding="utf-8")
+    entries, holidays = read_data_file(path)
+    assert entries == [ENTRY, {"uid": "broken"}]
+    assert len(holidays) == 1
+    assert holidays[0].start == date(2025, 1, 13)
+    assert holidays[0].categories == ("Public", "Bank")
+
+
+def test_read_data_file_errors(tmp_path):
+    path = tmp_path / "2025.json"
+    with pytest.raises(OSError):
+        read_data_file(path)
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        read_data_file(path)
@@ -0,0 +1,132 @@
+"""
+Tests for the batched usage counters.
+Author: Dilshan-H (https://github.com/Dilshan-H)
+License: MIT License
+URL: https://github.com/Dilshan-H/srilanka-holidays
+"""
+
+# pylint: disable=import-error
+
+import asyncio
+
+from srilanka_holidays.usage import UsageRecorder, usage_counter_key
+
+KEY = "b" * 64
+# 2025-11-28 14:30 UTC
+NOW = 1764340200.0
+
+
+class FakePipeline:
+    """Applies pipelined INCRBY commands on execute"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def incrby(self, key, amount):
+        self._commands.append((key, amount))
+        return self
+
+    def expire(self, key, seconds):
+        return self
+
+    async def execute(self):
+        for key, amount in self._commands:
+            self._redis.data[key] = self._redis.data.get(key, 0) + amount
+        return [True] * len(self._commands) * 2
+
+
+class FakeRedis:
+    """Counters in a dict"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class BrokenRedis(FakeRedis):
+    """Fails every pipeline"""
+
+    def pipeline(self, transaction=True):
+        raise ConnectionError("down")
+
+
+def test_usage_counter_key():
+    assert usage_counter_key(KEY, int(NOW // 3600)) == f"usage:{KEY[:16]}:2025112814"
+
+
+def test_flush_writes_hourly_counters():
+    redis = FakeRedis()
+    recorder = UsageRecorder(clock=lambda: NOW)
+    for _ in range(3):
+        recorder.record(KEY)
+    assert recorder.pending == 3
+    assert asyncio.run(recorder.flush(redis)) == 3
+    assert redis.data == {usage_counter_key(KEY, int(NOW // 3600)): 3}
+    assert recorder.pending == 0 and recorder.flushed_increments == 3
+    assert asyncio.run(recorder.flush(redis)) == 0
+
+
+def test_failed_flush_is_retried():
+    recorder = UsageRecorder(clock=lambda: NOW)
+    recorder.record(KEY)
+    assert asyncio.run(recorder.flush(BrokenRedis())) == 0
+    assert recorder.pending == 1 and recorder.failed_flushes == 1
+    assert asyncio.run(recorder.flush(None)) == 0
+    assert asyncio.run(recorder.flush(FakeRedis())) == 1
+
+
+def test_failed_flush_drops_counters_over_the_limit():
+    now = [NOW]
+    recorder = UsageRecorder(max_pending_keys=1, clock=lambda: now[0])
+    recorder.record(KEY)
+    now[0] += 3600
+    recorder.record(KEY)
+    asyncio.run(recorder.flush(BrokenRedis()))
+    assert recorder.pending == 1 and recorder.dropped_increments == 1
+
+
+def test_threshold_wakes_the_flush_loop():
+    redis = FakeRedis()
+    recorder = UsageRecorder(flush_threshold=2, clock=lambda: NOW)
+
+    async def scenario():
+        task = asyncio.create_task(recorder.run(lambda: redis, interval=60))
+        await asyncio.sleep(0)
+        recorder.record(KEY)
+        recorder.record(KEY)
+        while recorder.pending:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert recorder.flushes == 1
+
+
+def test_record_drops_counters_over_the_limit():
+    recorder = UsageRecorder(max_pending_keys=2, clock=lambda: NOW)
+    for key in ("a" * 64, "b" * 64, "c" * 64, "a" * 64):
+        recorder.record(key)
+    assert recorder.pending == 3 and recorder.dropped_increments == 1
+    assert asyncio.run(recorder.flush(FakeRedis())) == 3
+
+
+def test_no_wake_ups_without_a_client():
+    recorder = UsageRecorder(flush_threshold=1, clock=lambda: NOW)
+    calls = []
+
+    def get_client():
+        calls.append(None)
+        return None
+
+    async def scenario():
+        task = asyncio.create_task(recorder.run(get_client, interval=60))
+        for _ in range(50):
+            recorder.record(KEY)
+            await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert len(calls) == 1 and recorder.pending == 50